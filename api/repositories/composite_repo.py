@@ -276,35 +276,44 @@ class CompositeRepository(BaseRepository):
                    AND ac1.q_number <> ac2.q_number
                 WHERE ac1.q_number = %(q_number)s
                 GROUP BY ac2.q_number
+            ), top AS (
+                SELECT r.rel_q, r.shared_witnesses, r.shared_p,
+                       c.designation, c.exemplar_count
+                FROM related r
+                JOIN composites c ON c.q_number = r.rel_q
+                ORDER BY r.shared_witnesses DESC, c.exemplar_count DESC, r.rel_q
+                LIMIT %(limit)s
+            ), top_genre AS (
+                -- Most common genre per listed composite: one grouped pass
+                -- over their exemplars, not a correlated subquery per row.
+                SELECT DISTINCT ON (x.q_number) x.q_number, a.genre
+                FROM artifact_composites x
+                JOIN artifacts a ON a.p_number = x.p_number
+                WHERE x.q_number IN (SELECT rel_q FROM top)
+                  AND a.genre IS NOT NULL AND a.genre <> ''
+                GROUP BY x.q_number, a.genre
+                ORDER BY x.q_number, count(*) DESC, a.genre
+            ), top_period AS (
+                SELECT DISTINCT ON (x.q_number) x.q_number, a.period
+                FROM artifact_composites x
+                JOIN artifacts a ON a.p_number = x.p_number
+                WHERE x.q_number IN (SELECT rel_q FROM top)
+                  AND a.period IS NOT NULL AND a.period <> ''
+                GROUP BY x.q_number, a.period
+                ORDER BY x.q_number, count(*) DESC, a.period
             )
             SELECT
-                r.rel_q AS q_number,
-                r.shared_witnesses,
-                r.shared_p,
-                c.designation,
-                c.exemplar_count,
-                (
-                    SELECT a.genre
-                    FROM artifact_composites x
-                    JOIN artifacts a ON a.p_number = x.p_number
-                    WHERE x.q_number = r.rel_q AND a.genre IS NOT NULL AND a.genre <> ''
-                    GROUP BY a.genre
-                    ORDER BY count(*) DESC
-                    LIMIT 1
-                ) AS top_genre,
-                (
-                    SELECT a.period
-                    FROM artifact_composites x
-                    JOIN artifacts a ON a.p_number = x.p_number
-                    WHERE x.q_number = r.rel_q AND a.period IS NOT NULL AND a.period <> ''
-                    GROUP BY a.period
-                    ORDER BY count(*) DESC
-                    LIMIT 1
-                ) AS top_period
-            FROM related r
-            JOIN composites c ON c.q_number = r.rel_q
-            ORDER BY r.shared_witnesses DESC, c.exemplar_count DESC, r.rel_q
-            LIMIT %(limit)s
+                t.rel_q AS q_number,
+                t.shared_witnesses,
+                t.shared_p,
+                t.designation,
+                t.exemplar_count,
+                g.genre AS top_genre,
+                p.period AS top_period
+            FROM top t
+            LEFT JOIN top_genre g ON g.q_number = t.rel_q
+            LEFT JOIN top_period p ON p.q_number = t.rel_q
+            ORDER BY t.shared_witnesses DESC, t.exemplar_count DESC, t.rel_q
             """,
             {"q_number": q_number, "limit": limit},
         )
@@ -384,11 +384,11 @@ def get_artifact_research(p_number: str, conn=Depends(get_db)):
 
 
 @router.get("/citations/{doi:path}")
-def get_citations(doi: str):
+async def get_citations(doi: str):
     """Fetch citing papers from Semantic Scholar for a DOI."""
     from api.services.semantic_scholar import get_citation_graph
 
-    return get_citation_graph(doi)
+    return await get_citation_graph(doi)
 
 
 @router.get("/{p_number}/debug")
@@ -1,23 +1,213 @@
 """Semantic Scholar API — on-demand citation graph lookup."""
 
-import logging
-import subprocess
+import asyncio
 import json
+import logging
+import re
+import sqlite3
+import threading
+import zlib
 from time import time
 
+import httpx
+
+try:  # optional: faster encode/decode of disk-cache payloads
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback below
+    orjson = None  # type: ignore[assignment]
+
+from core.config import get_settings
+
 log = logging.getLogger(__name__)
 
 _BASE = "https://api.semanticscholar.org/graph/v1"
 _CACHE: dict[str, tuple[float, list]] = {}  # doi → (timestamp, citations)
 _TTL = 3600  # 1 hour
+# Entries kept at most. The dict is in insertion (= fetch time) order, so the
+# first key is always the oldest and the first to expire.
+_CACHE_MAX = 2048
+_cache_lock = threading.Lock()
+
+# Optional second level behind _CACHE (settings.s2_cache_path): one SQLite file
+# shared by every API worker that survives restarts. Citation lists move
+# slowly, so rows stay good for a week. An empty path keeps it memory-only.
+_DISK_TTL = 7 * 86400
+_disk: sqlite3.Connection | None = None
+_disk_opened = False
+# Disk reads/writes run in asyncio.to_thread workers that share _disk; sqlite3
+# leaves serializing a shared connection to the caller.
+_disk_lock = threading.Lock()
+
+# Resolver and scheme prefixes stripped, in that order, from a DOI before it
+# keys the caches, as publications.doi_norm does in SQL (migration 062's
+# doi_canonical) and orcid_works._normalize_doi does in Python.
+_DOI_URL_RE = re.compile(r"^https?://(dx\.)?doi\.org/")
+_DOI_SCHEME_RE = re.compile(r"^doi:\s*")
+
+_USER_AGENT = (
+    "Glintstone/0.1 (citation lookup; "
+    "+https://app.glintstone.org; contact eric.wittke@gmail.com)"
+)
+# Lookups are driven by page views, usually more than httpx's default 5s
+# apart; hold idle connections for a minute so they actually get reused.
+_KEEPALIVE_S = 60.0
+
+# Lookups in flight to S2 at once. Unauthenticated S2 traffic shares one rate
+# limit, so a burst of page views queues here instead of fanning out into 429s.
+_MAX_IN_FLIGHT = 4
+_in_flight = asyncio.Semaphore(_MAX_IN_FLIGHT)
+
+# Lookups currently in flight, by (doi, limit); see get_citation_graph().
+_pending: dict[tuple[str, int], asyncio.Future] = {}
+
+# Transient S2 answers worth one more try. The caller is waiting on a page, so
+# retries are few and the wait (Retry-After when S2 sends one) is capped short.
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_MAX_RETRIES = 2
+_RETRY_CAP_S = 2.0
+
+# One pooled async client for the process: repeat lookups reuse the
+# kept-alive TLS connection to api.semanticscholar.org, and a request waiting
+# on S2 holds no worker thread.
+_client: httpx.AsyncClient | None = None
 
 
-def get_citation_graph(doi: str, limit: int = 20) -> dict:
+def _http() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(5.0),
+            follow_redirects=True,
+            headers={"User-Agent": _USER_AGENT},
+            # Re-dial a dropped kept-alive connection instead of failing. With
+            # an explicit transport httpx ignores the client's limits=, so the
+            # keepalive settings go on the transport.
+            transport=httpx.AsyncHTTPTransport(
+                retries=1,
+                limits=httpx.Limits(
+                    max_keepalive_connections=4, keepalive_expiry=_KEEPALIVE_S
+                ),
+            ),
+        )
+    return _client
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retry `attempt`: Retry-After if S2 sent a
+    delta-seconds value, else a short exponential step; capped either way."""
+    try:
+        delay = float(resp.headers.get("retry-after", ""))
+    except ValueError:
+        delay = 0.25 * (2**attempt)
+    return min(max(delay, 0.0), _RETRY_CAP_S)
+
+
+async def _get(url: str, params: dict) -> httpx.Response:
+    resp = await _http().get(url, params=params)
+    for attempt in range(_MAX_RETRIES):
+        if resp.status_code not in _RETRY_STATUSES:
+            break
+        await asyncio.sleep(_retry_delay(resp, attempt))
+        resp = await _http().get(url, params=params)
+    return resp
+
+
+def _disk_cache() -> sqlite3.Connection | None:
+    global _disk, _disk_opened
+    with _cache_lock:
+        if not _disk_opened:
+            _disk_opened = True
+            path = get_settings().s2_cache_path
+            if path:
+                try:
+                    db = sqlite3.connect(
+                        path, isolation_level=None, check_same_thread=False
+                    )
+                    db.execute("PRAGMA journal_mode=WAL")
+                    db.execute("PRAGMA synchronous=NORMAL")
+                    db.execute(
+                        "CREATE TABLE IF NOT EXISTS s2_citations ("
+                        "doi TEXT PRIMARY KEY, fetched_at REAL NOT NULL, "
+                        "payload BLOB NOT NULL)"
+                    )
+                    _disk = db
+                except sqlite3.Error as e:
+                    log.warning("S2 disk cache unavailable at %s: %s", path, e)
+    return _disk
+
+
+def _disk_get(doi: str) -> list | None:
+    db = _disk_cache()
+    if db is None:
+        return None
+    try:
+        with _disk_lock:
+            row = db.execute(
+                "SELECT fetched_at, payload FROM s2_citations WHERE doi = ?", (doi,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        log.warning("S2 disk cache read failed for DOI %s: %s", doi, e)
+        return None
+    if row is None or time() - row[0] >= _DISK_TTL:
+        return None
+    try:
+        raw = zlib.decompress(row[1])
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (zlib.error, ValueError) as e:
+        # A damaged row is a cache miss; the fetch that follows rewrites it.
+        log.warning("S2 disk cache row unreadable for DOI %s: %s", doi, e)
+        return None
+
+
+def _disk_put(doi: str, citations: list) -> None:
+    db = _disk_cache()
+    if db is None:
+        return
+    if orjson is not None:
+        raw = orjson.dumps(citations)
+    else:
+        raw = json.dumps(citations, separators=(",", ":")).encode()
+    try:
+        with _disk_lock:
+            db.execute(
+                "INSERT OR REPLACE INTO s2_citations (doi, fetched_at, payload) "
+                "VALUES (?, ?, ?)",
+                (doi, time(), zlib.compress(raw)),
+            )
+    except sqlite3.Error as e:
+        log.warning("S2 disk cache write failed for DOI %s: %s", doi, e)
+
+
+def _remember(doi: str, citations: list) -> None:
+    with _cache_lock:
+        _CACHE.pop(doi, None)  # re-insert at the end: newest
+        _CACHE[doi] = (time(), citations)
+        while len(_CACHE) > _CACHE_MAX:
+            del _CACHE[next(iter(_CACHE))]
+
+
+async def _store(doi: str, citations: list) -> None:
+    """Cache a fresh answer in memory and, off the event loop, on disk."""
+    _remember(doi, citations)
+    await asyncio.to_thread(_disk_put, doi, citations)
+
+
+def _canonical_doi(raw: str) -> str:
+    d = raw.strip().lower()
+    d = _DOI_URL_RE.sub("", d)
+    d = _DOI_SCHEME_RE.sub("", d)
+    return d.strip()
+
+
+async def get_citation_graph(doi: str, limit: int = 20) -> dict:
     """Fetch papers that cite the given DOI from Semantic Scholar.
 
     Returns {citations: [...], total: N, source: "semantic_scholar"}.
-    Uses subprocess curl (macOS SSL workaround) with in-memory cache.
+    Uses a shared async httpx client with an in-memory cache.
     """
+    # DOIs are case-insensitive: one canonical key means "10.1/ABC" and
+    # "https://doi.org/10.1/abc" share a cache entry and an S2 request.
+    doi = _canonical_doi(doi)
     if not doi:
         return {"citations": [], "total": 0, "source": "semantic_scholar"}
 
@@ -30,17 +220,41 @@ def get_citation_graph(doi: str, limit: int = 20) -> dict:
             "source": "semantic_scholar",
         }
 
-    url = f"{_BASE}/paper/DOI:{doi}/citations?fields=title,authors,year,externalIds&limit={limit}"
+    # Concurrent misses for the same DOI share one S2 request. shield() keeps
+    # one caller disconnecting from cancelling the fetch the others await.
+    key = (doi, limit)
+    task = _pending.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_citations(doi, limit))
+        _pending[key] = task
+        task.add_done_callback(lambda _t: _pending.pop(key, None))
+    return await asyncio.shield(task)
+
+
+async def _fetch_citations(doi: str, limit: int) -> dict:
+    # sqlite3 blocks; run the disk lookup in a worker thread.
+    stored = await asyncio.to_thread(_disk_get, doi)
+    if stored is not None:
+        _remember(doi, stored)
+        return {
+            "citations": stored,
+            "total": len(stored),
+            "source": "semantic_scholar",
+        }
+
+    url = f"{_BASE}/paper/DOI:{doi}/citations"
+    params = {"fields": "title,authors,year,externalIds", "limit": limit}
 
     try:
-        result = subprocess.run(
-            ["curl", "-s", "-f", "--max-time", "5", url],
-            capture_output=True,
-            text=True,
-            timeout=8,
-        )
-        if result.returncode != 0:
-            log.warning("S2 API error for DOI %s: exit %d", doi, result.returncode)
+        async with _in_flight:
+            resp = await _get(url, params)
+        if resp.status_code == 404:
+            # S2 has no such paper. That answer is as stable as a citation
+            # list, so cache it too rather than re-asking on every expand.
+            await _store(doi, [])
+            return {"citations": [], "total": 0, "source": "semantic_scholar"}
+        if resp.status_code != 200:
+            log.warning("S2 API error for DOI %s: HTTP %d", doi, resp.status_code)
             return {
                 "citations": [],
                 "total": 0,
@@ -48,7 +262,7 @@ def get_citation_graph(doi: str, limit: int = 20) -> dict:
                 "error": "api_error",
             }
 
-        data = json.loads(result.stdout)
+        data = resp.json()
         citations = []
         for item in data.get("data", []):
             citing = item.get("citingPaper", {})
@@ -65,14 +279,14 @@ def get_citation_graph(doi: str, limit: int = 20) -> dict:
                 }
             )
 
-        _CACHE[doi] = (time(), citations)
+        await _store(doi, citations)
         return {
             "citations": citations,
             "total": len(citations),
             "source": "semantic_scholar",
         }
 
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, Exception) as e:
+    except Exception as e:
         log.warning("S2 citation fetch failed for DOI %s: %s", doi, e)
         return {
             "citations": [],
@@ -1050,7 +1050,8 @@ def _language_supported_str(language: str) -> bool:
 def _should_use_variant_b(genre: str | None) -> bool:
     if not genre:
         return False
-    return any(g in genre.lower() for g in _GENRE_B_VARIANTS)
+    genre_lc = genre.lower()
+    return any(g in genre_lc for g in _GENRE_B_VARIANTS)
 
 
 def _coerce_line_int(label: str) -> int:
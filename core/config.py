@@ -62,6 +62,10 @@ class Settings(BaseSettings):
 
     image_path: str = ""
 
+    # SQLite file backing the Semantic Scholar citation cache across API
+    # workers and restarts. Empty = in-process memory cache only.
+    s2_cache_path: str = ""
+
     storage_backend: str = "local"
     r2_account_id: Optional[str] = Field(
         default=None,
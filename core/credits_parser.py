@@ -228,6 +228,21 @@ _ROLE_PATTERNS: list[tuple[str, re.Pattern[str], bool]] = [
     ),
 ]
 
+# Literal stems each role pattern above is anchored on. parse_credits only
+# runs the patterns whose stem occurs in the credit, so a typical "Lemmatised
+# by X" string costs one regex pass instead of six, and a string with no stem
+# at all is rejected by substring scans alone. Only applied to ASCII input:
+# re.I also folds a few non-ASCII code points (e.g. U+0130) that str.lower()
+# would not map onto these stems.
+_ROLE_STEMS: dict[str, tuple[str, ...]] = {
+    ROLE_DIRECTOR: ("directed",),
+    ROLE_LEMMATIZER: ("lemmati",),
+    ROLE_EDITOR: ("edition", "edited"),
+    ROLE_CREATOR: ("created",),
+    ROLE_ADAPTER: ("adapted",),
+    ROLE_CONTRIBUTOR: ("edition", "identification"),
+}
+
 # Tokens that signal the captured span is an institution/project, not a person.
 # These are dropped wholesale (we attribute people, conservatively).
 _INSTITUTION_HINTS = re.compile(
@@ -294,10 +309,20 @@ def parse_credits(text: str) -> list[CreditMatch]:
     """
     if not text or not text.strip():
         return []
+    patterns = _ROLE_PATTERNS
+    if text.isascii():
+        lowered = text.lower()
+        patterns = [
+            entry
+            for entry in _ROLE_PATTERNS
+            if any(stem in lowered for stem in _ROLE_STEMS[entry[0]])
+        ]
+        if not patterns:
+            return []
 
     seen: set[tuple[str, str]] = set()
     out: list[CreditMatch] = []
-    for role, pat, citation_style in _ROLE_PATTERNS:
+    for role, pat, citation_style in patterns:
         for m in pat.finditer(text):
             for name in _split_names(m.group("names"), citation_style):
                 key = (name.lower(), role)
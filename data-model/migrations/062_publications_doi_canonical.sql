@@ -0,0 +1,59 @@
+-- Migration 062: Canonical DOI column on publications
+--
+-- publications.doi is stored as each source supplied it. orcid-works strips
+-- the resolver prefix before keying ("10.1234/x"), but rows from other
+-- sources can carry "https://doi.org/10.1234/x", "http://dx.doi.org/...",
+-- "doi:10.1234/x" or mixed case. UNIQUE (doi) treats those as different
+-- values, so the same work can land twice and a DOI lookup misses the
+-- prefixed row.
+--
+-- doi_canonical() is the SQL twin of
+-- ingestion/connectors/orcid_works.py::_normalize_doi: trim, lowercase, strip
+-- an http(s)://(dx.)doi.org/ resolver prefix, then a "doi:" scheme prefix.
+-- Keep the two in step. Trimming uses \s, not btrim(): btrim only removes
+-- spaces, while str.strip() also drops tabs and newlines. doi_norm is a
+-- stored generated column over it, so every writer gets it for free and
+-- lookups/joins can hit one index.
+--
+-- The index is deliberately NOT unique: existing prefix-variant duplicates
+-- would make the build fail. Find them with
+--
+--     SELECT doi_norm, array_agg(id) FROM publications
+--     WHERE doi_norm IS NOT NULL GROUP BY doi_norm HAVING count(*) > 1;
+--
+-- and merge before promoting it to UNIQUE.
+--
+-- Idempotent: CREATE OR REPLACE / IF NOT EXISTS throughout.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION doi_canonical(raw text) RETURNS text
+    LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE
+AS $$
+    SELECT nullif(
+        regexp_replace(
+            regexp_replace(
+                regexp_replace(
+                    lower(regexp_replace(raw, '^\s+|\s+$', '', 'g')),
+                    '^https?://(dx\.)?doi\.org/', ''
+                ),
+                '^doi:\s*', ''
+            ),
+            '^\s+|\s+$', '', 'g'
+        ),
+        ''
+    )
+$$;
+
+ALTER TABLE publications
+    ADD COLUMN IF NOT EXISTS doi_norm text
+    GENERATED ALWAYS AS (doi_canonical(doi)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_publications_doi_norm
+    ON publications (doi_norm) WHERE doi_norm IS NOT NULL;
+
+COMMENT ON COLUMN publications.doi_norm IS
+    'doi_canonical(doi): lowercase bare 10.x/... form with resolver and doi: '
+    'prefixes stripped. Use for DOI dedup and joins instead of raw doi.';
+
+COMMIT;
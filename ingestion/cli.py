@@ -14,6 +14,7 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+import time
 from typing import Optional
 
 from core.config import get_settings
@@ -23,6 +24,9 @@ from ingestion.dlq_replay import REPLAY_HANDLERS, replay
 from ingestion.registry import ConnectorRegistry
 from ingestion.runner import run_connector
 
+# Minimum seconds between dlq-replay progress lines.
+PROGRESS_INTERVAL_S = 2.0
+
 
 def _registry() -> ConnectorRegistry:
     return ConnectorRegistry()
@@ -101,26 +105,40 @@ def cmd_run_all(args) -> int:
     settings = get_settings()
     mode = RunMode(args.mode) if args.mode else RunMode.FULL
     failed = 0
-    for cls in reg.ordered():
-        print(f"\n=== {cls.id} ===")
-        try:
-            summary = run_connector(
-                cls,
-                mode=mode,
-                app_env=settings.app_env,
-                force=args.force,
-            )
-            print(f"  → {summary['status']}")
-            if summary.get("status") == "failed":
+    # One session for the whole chain; reopened only if a failed run left it
+    # unusable.
+    db = connect_one_shot()
+    try:
+        for cls in reg.ordered():
+            print(f"\n=== {cls.id} ===")
+            if db.closed or db.broken:
+                db = connect_one_shot()
+            try:
+                summary = run_connector(
+                    cls,
+                    mode=mode,
+                    app_env=settings.app_env,
+                    force=args.force,
+                    db=db,
+                )
+                print(f"  → {summary['status']}")
+                if summary.get("status") == "failed":
+                    failed += 1
+                    if not args.continue_on_failure:
+                        print("Stopping (use --continue-on-failure to keep going).")
+                        return 1
+            except Exception as exc:
                 failed += 1
+                print(f"  → failed: {exc}")
                 if not args.continue_on_failure:
-                    print("Stopping (use --continue-on-failure to keep going).")
                     return 1
-        except Exception as exc:
-            failed += 1
-            print(f"  → failed: {exc}")
-            if not args.continue_on_failure:
-                return 1
+                # Don't hand an aborted transaction to the next connector.
+                try:
+                    db.rollback()
+                except Exception:
+                    pass
+    finally:
+        db.close()
     return 0 if failed == 0 else 1
 
 
@@ -197,8 +215,17 @@ def cmd_dlq_replay(args) -> int:
         return 1
     db = connect_one_shot()
     try:
+        # replay() reports after every batch; print at most every
+        # PROGRESS_INTERVAL_S so a large queue isn't flushing stdout per batch.
+        # The summary below always carries the final counts.
+        last_print = 0.0
 
         def _progress(p: dict) -> None:
+            nonlocal last_print
+            now = time.monotonic()
+            if now - last_print < PROGRESS_INTERVAL_S:
+                return
+            last_print = now
             print(
                 f"  ... examined {p['examined']:,}  "
                 f"{'would-fix' if args.dry_run else 'fixed'} {p['fixed']:,}",
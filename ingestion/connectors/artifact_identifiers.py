@@ -35,13 +35,25 @@ MUSEUM_AUTHORITIES = [
 ]
 
 
+# All prefixes folded into one anchored alternation, compiled once. Alternatives
+# are tried in list order at position 0, so the first listed match still wins
+# ("Ashm" before "AS"); the named group says which entry matched.
+_RE_AUTHORITY = re.compile(
+    "|".join(
+        f"(?P<a{i}>{pattern.removeprefix('^')})"
+        for i, (pattern, _) in enumerate(MUSEUM_AUTHORITIES)
+    ),
+    re.IGNORECASE,
+)
+
+
 def _infer_authority(museum_no: str | None) -> str | None:
     if not museum_no:
         return None
-    for pattern, authority in MUSEUM_AUTHORITIES:
-        if re.match(pattern, museum_no, re.IGNORECASE):
-            return authority
-    return None
+    m = _RE_AUTHORITY.match(museum_no)
+    if m is None or m.lastgroup is None:
+        return None
+    return MUSEUM_AUTHORITIES[int(m.lastgroup[1:])][1]
 
 
 def _normalize_identifier(val: str) -> str:
@@ -66,12 +78,21 @@ class ArtifactIdentifiersConnector(SourceConnector):
             return
         annotation_run_id = ann_row["id"] if isinstance(ann_row, dict) else ann_row[0]
 
-        offset = 0
+        # Keyset paging (OFFSET rescans every skipped row), and artifacts with
+        # no identifier text at all are filtered server-side — they would
+        # yield nothing below.
+        last_p = ""
+        scanned = 0
         while True:
             rows = ctx.db.execute(
                 "SELECT p_number, designation, museum_no, excavation_no, primary_publication "
-                "FROM artifacts ORDER BY p_number LIMIT %s OFFSET %s",
-                (BATCH_SIZE, offset),
+                "FROM artifacts "
+                "WHERE p_number > %s "
+                "  AND COALESCE(NULLIF(designation, ''), NULLIF(museum_no, ''), "
+                "               NULLIF(excavation_no, ''), "
+                "               NULLIF(primary_publication, '')) IS NOT NULL "
+                "ORDER BY p_number LIMIT %s",
+                (last_p, BATCH_SIZE),
             ).fetchall()
             if not rows:
                 break
@@ -127,9 +148,10 @@ class ArtifactIdentifiersConnector(SourceConnector):
                         "annotation_run_id": annotation_run_id,
                         "confidence": 0.9,
                     }
-            offset += BATCH_SIZE
-            if offset % 50000 == 0:
-                ctx.info("artifact_identifiers.progress", offset=offset)
+            last_p = p_number
+            scanned += len(rows)
+            if scanned % 50000 == 0:
+                ctx.info("artifact_identifiers.progress", scanned=scanned)
 
     def load(self, ctx: RunContext, rows: Iterable[dict]) -> LoadStats:
         return upsert_batch(
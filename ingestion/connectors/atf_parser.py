@@ -8,15 +8,18 @@ Depends on: annotation-runs, cdli-catalog
 
 from __future__ import annotations
 
-import json
 import re
 from pathlib import Path
 from typing import Any, Iterable, Iterator
 
 from ingestion.base import LoadStats, RunContext, SourceConnector, SourceManifest
+from ingestion.loader import fetch_key_set
 
 DEFAULT_ATF = Path("source-data/sources/CDLI/metadata/cdliatf_unblocked.atf")
 BATCH_SIZE = 500
+# ctx.info() writes an import_run_events row and commits; one progress event
+# per 20 flushes (10k tablets) is plenty for a ~350k-tablet corpus.
+PROGRESS_EVERY_FLUSHES = 20
 
 SURFACE_MAP = {
     "obverse": "obverse",
@@ -41,6 +44,7 @@ SURFACE_MAP = {
     "bulla": "bulla",
     "tag": None,
 }
+_UNMAPPED: Any = object()
 
 RE_HEADER = re.compile(r"^&(P\d+)\s*=\s*(.+)$")
 RE_LANG = re.compile(r"^#atf:\s*lang\s+(\S+)")
@@ -52,6 +56,37 @@ RE_BLANK = re.compile(r"^\$\s*(beginning|rest|reverse|surface)\s+broken", re.IGN
 RE_COMPOSITE = re.compile(r"^>>(Q\d+)\s*(.*)$")
 RE_TRANSLATION = re.compile(r"^#tr\.(\w+):\s+(.+)$")
 
+# Per-surface / per-line / per-token statements run millions of times per
+# corpus load. They are executed with prepare=True so the server parses and
+# plans each once per session instead of waiting for psycopg's auto-prepare
+# threshold.
+
+# Insert-or-select: an existing surface still comes back with its id in one
+# round trip, without a no-op DO UPDATE rewriting the row on every re-run.
+SQL_SURFACE_UPSERT = (
+    "WITH ins AS ("
+    "  INSERT INTO surfaces (p_number, surface_type) VALUES (%(p)s, %(s)s) "
+    "  ON CONFLICT (p_number, surface_type) DO NOTHING RETURNING id"
+    ") "
+    "SELECT id, true AS inserted FROM ins "
+    "UNION ALL "
+    "SELECT id, false FROM surfaces WHERE p_number = %(p)s AND surface_type = %(s)s "
+    "AND NOT EXISTS (SELECT 1 FROM ins)"
+)
+SQL_LINE_INSERT = (
+    "INSERT INTO text_lines "
+    "(p_number, surface_id, column_number, line_number, raw_atf, is_ruling, is_blank, source) "
+    "VALUES (%s, %s, %s, %s, %s, %s, %s, 'cdli') "
+    "ON CONFLICT (p_number, surface_id, column_number, line_number, source) DO NOTHING RETURNING id"
+)
+# Build the minimal {"frag": ...} GDL server-side rather than json.dumps()
+# per token.
+SQL_TOKEN_INSERT = (
+    "INSERT INTO tokens (line_id, position, gdl_json, lang) "
+    "VALUES (%s, %s, jsonb_build_object('frag', %s::text)::text, %s) "
+    "ON CONFLICT DO NOTHING"
+)
+
 
 def _parse_atf_file(atf_path: Path) -> Iterator[dict[str, Any]]:
     # Heterogeneous accumulator: string fields plus a surfaces dict and three
@@ -68,7 +103,11 @@ def _parse_atf_file(atf_path: Path) -> Iterator[dict[str, Any]]:
             if not line.strip():
                 continue
 
-            m = RE_HEADER.match(line)
+            # Every pattern below is anchored on a literal first character, so
+            # test that before paying for a regex match that cannot succeed.
+            first = line[0]
+
+            m = RE_HEADER.match(line) if first == "&" else None
             if m:
                 if tablet:
                     yield tablet
@@ -88,12 +127,12 @@ def _parse_atf_file(atf_path: Path) -> Iterator[dict[str, Any]]:
             if tablet is None:
                 continue
 
-            m = RE_LANG.match(line)
+            m = RE_LANG.match(line) if first == "#" else None
             if m:
                 tablet["lang"] = m.group(1)
                 continue
 
-            m = RE_SURFACE.match(line)
+            m = RE_SURFACE.match(line) if first == "@" else None
             if m:
                 marker = m.group(1).lower()
                 if marker == "column":
@@ -102,27 +141,29 @@ def _parse_atf_file(atf_path: Path) -> Iterator[dict[str, Any]]:
                         int(col_m.group(1)) if col_m else current_column + 1
                     )
                     continue
-                db_surface = SURFACE_MAP.get(marker)
-                if db_surface is not None:
+                # One lookup: a mapped surface, a known-but-ignored marker
+                # (None, e.g. @tag), or _UNMAPPED for anything else.
+                db_surface = SURFACE_MAP.get(marker, _UNMAPPED)
+                if db_surface is None:
+                    current_surface_type = None
+                elif db_surface is not _UNMAPPED:
                     current_surface_type = db_surface
                     current_column = 0
                     tablet["surfaces"][db_surface] = True
-                elif db_surface is None and marker in SURFACE_MAP:
-                    current_surface_type = None
                 continue
 
-            m = RE_COMPOSITE.match(line)
+            m = RE_COMPOSITE.match(line) if first == ">" else None
             if m:
                 q_number = "Q" + m.group(1)[1:].zfill(6)
                 tablet["composites"].append((q_number, m.group(2).strip()))
                 continue
 
-            m = RE_TRANSLATION.match(line)
+            m = RE_TRANSLATION.match(line) if first == "#" else None
             if m:
                 tablet["translations"].append((m.group(1), m.group(2), line_counter))
                 continue
 
-            if RE_RULING.match(line):
+            if first == "$" and RE_RULING.match(line):
                 line_counter += 1
                 tablet["lines"].append(
                     (
@@ -136,7 +177,7 @@ def _parse_atf_file(atf_path: Path) -> Iterator[dict[str, Any]]:
                 )
                 continue
 
-            if RE_BLANK.match(line) or line.startswith("$ "):
+            if first == "$" and (RE_BLANK.match(line) or line.startswith("$ ")):
                 line_counter += 1
                 tablet["lines"].append(
                     (
@@ -167,7 +208,10 @@ def _parse_atf_file(atf_path: Path) -> Iterator[dict[str, Any]]:
 def _flush_tablets(
     conn, tablets: list, ann_run_atf, ann_run_cdli, known_p: set, stats: dict
 ) -> None:
-    with conn.cursor() as cur:
+    # Pipeline mode: token, translation and composite inserts don't read a
+    # result, so they are queued without waiting on each reply. The surface
+    # and line fetchone() calls sync the pipeline when their id is needed.
+    with conn.pipeline(), conn.cursor() as cur:
         for tablet in tablets:
             p_number = tablet["p_number"]
             if p_number not in known_p:
@@ -177,25 +221,19 @@ def _flush_tablets(
             surface_id_map: dict[str, int] = {}
             for surface_type in tablet["surfaces"]:
                 cur.execute(
-                    "INSERT INTO surfaces (p_number, surface_type) VALUES (%s, %s) "
-                    "ON CONFLICT (p_number, surface_type) DO NOTHING RETURNING id",
-                    (p_number, surface_type),
+                    SQL_SURFACE_UPSERT,
+                    {"p": p_number, "s": surface_type},
+                    prepare=True,
                 )
                 row = cur.fetchone()
                 if row:
-                    surface_id_map[surface_type] = (
-                        row[0] if not isinstance(row, dict) else row["id"]
-                    )
-                    stats["surfaces"] += 1
-                else:
-                    row = cur.execute(
-                        "SELECT id FROM surfaces WHERE p_number = %s AND surface_type = %s",
-                        (p_number, surface_type),
-                    ).fetchone()
-                    if row:
-                        surface_id_map[surface_type] = (
-                            row[0] if not isinstance(row, dict) else row["id"]
-                        )
+                    if isinstance(row, dict):
+                        surface_id, inserted = row["id"], row["inserted"]
+                    else:
+                        surface_id, inserted = row[0], row[1]
+                    surface_id_map[surface_type] = surface_id
+                    if inserted:
+                        stats["surfaces"] += 1
 
             for (
                 surface_type,
@@ -207,10 +245,7 @@ def _flush_tablets(
             ) in tablet["lines"]:
                 surface_id = surface_id_map.get(surface_type) if surface_type else None
                 cur.execute(
-                    "INSERT INTO text_lines "
-                    "(p_number, surface_id, column_number, line_number, raw_atf, is_ruling, is_blank, source) "
-                    "VALUES (%s, %s, %s, %s, %s, %s, %s, 'cdli') "
-                    "ON CONFLICT (p_number, surface_id, column_number, line_number, source) DO NOTHING RETURNING id",
+                    SQL_LINE_INSERT,
                     (
                         p_number,
                         surface_id,
@@ -220,6 +255,7 @@ def _flush_tablets(
                         is_ruling,
                         is_blank,
                     ),
+                    prepare=True,
                 )
                 row = cur.fetchone()
                 if row:
@@ -229,16 +265,11 @@ def _flush_tablets(
                         tokens = [p for p in raw_atf.split() if p and p != ","]
                         for pos, token_text in enumerate(tokens):
                             cur.execute(
-                                "INSERT INTO tokens (line_id, position, gdl_json, lang) "
-                                "VALUES (%s, %s, %s, %s) ON CONFLICT DO NOTHING",
-                                (
-                                    line_id,
-                                    pos,
-                                    json.dumps({"frag": token_text}),
-                                    tablet["lang"],
-                                ),
+                                SQL_TOKEN_INSERT,
+                                (line_id, pos, token_text, tablet["lang"]),
+                                prepare=True,
                             )
-                            stats["tokens"] += 1
+                        stats["tokens"] += len(tokens)
 
             for tr_lang, tr_text, _ in tablet["translations"]:
                 cur.execute(
@@ -246,7 +277,7 @@ def _flush_tablets(
                     "VALUES (%s, %s, %s, %s, 'cdli', %s) ON CONFLICT DO NOTHING",
                     (p_number, None, tr_text, tr_lang, ann_run_cdli),
                 )
-                stats["translations"] += 1
+            stats["translations"] += len(tablet["translations"])
 
             for q_number, label in tablet["composites"]:
                 cur.execute(
@@ -258,7 +289,7 @@ def _flush_tablets(
                     "INSERT INTO artifact_composites (p_number, q_number) VALUES (%s, %s) ON CONFLICT DO NOTHING",
                     (p_number, q_number),
                 )
-                stats["composite_links"] += 1
+            stats["composite_links"] += len(tablet["composites"])
 
             stats["tablets"] += 1
 
@@ -311,10 +342,7 @@ class AtfParserConnector(SourceConnector):
                 else:
                     ann_run_cdli = val
 
-        known_p = {
-            (r["p_number"] if isinstance(r, dict) else r[0])
-            for r in ctx.db.execute("SELECT p_number FROM artifacts").fetchall()
-        }
+        known_p = fetch_key_set(ctx.db, "SELECT p_number FROM artifacts")
         ctx.info("atf_parser.known_artifacts", count=len(known_p))
 
         raw_stats = {
@@ -327,6 +355,7 @@ class AtfParserConnector(SourceConnector):
             "skipped_unknown": 0,
         }
         batch = []
+        flushes = 0
         for tablet in rows:
             batch.append(tablet)
             if len(batch) >= BATCH_SIZE:
@@ -334,6 +363,9 @@ class AtfParserConnector(SourceConnector):
                     ctx.db, batch, ann_run_atf, ann_run_cdli, known_p, raw_stats
                 )
                 batch = []
+                flushes += 1
+                if flushes % PROGRESS_EVERY_FLUSHES:
+                    continue
                 ctx.info(
                     "atf_parser.progress",
                     tablets=raw_stats["tablets"],
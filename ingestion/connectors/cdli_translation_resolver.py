@@ -29,6 +29,10 @@ _SURFACE_RANK = {
     "brick": 13, "cone": 14, "bulla": 15, "column": 16, "face": 17,
 }
 
+# Translation UPDATEs sent per pipeline round. transform() queries text_lines
+# between yields, so batches are flushed outside its cursor work.
+UPDATE_BATCH_SIZE = 1000
+
 
 class CDLITranslationResolver(SourceConnector):
     id = "cdli-translation-resolver"
@@ -136,16 +140,14 @@ class CDLITranslationResolver(SourceConnector):
 
     def load(self, ctx: RunContext, records: Iterator[dict]) -> LoadStats:
         stats = LoadStats()
-        with ctx.db.cursor() as cur:
-            for rec in records:
-                cur.execute(
-                    "UPDATE translations SET line_id = %s WHERE id = %s AND line_id IS NULL",
-                    (rec["line_id"], rec["translation_id"]),
-                )
-                if cur.rowcount:
-                    stats.inserted += 1
-                else:
-                    stats.skipped += 1
+        batch: list[tuple[int, int]] = []
+        for rec in records:
+            batch.append((rec["line_id"], rec["translation_id"]))
+            if len(batch) >= UPDATE_BATCH_SIZE:
+                _patch_line_ids(ctx, batch, stats)
+                batch = []
+        if batch:
+            _patch_line_ids(ctx, batch, stats)
         ctx.db.commit()
         # Mark corresponding dead letters resolved
         with ctx.db.cursor() as cur:
@@ -168,3 +170,23 @@ class CDLITranslationResolver(SourceConnector):
             ctx.db.commit()
         ctx.info("resolver.resolved_dead_letters", resolved=resolved)
         return stats
+
+
+def _patch_line_ids(
+    ctx: RunContext, batch: list[tuple[int, int]], stats: LoadStats
+) -> None:
+    """Send one batch of line_id patches in pipeline mode.
+
+    The per-row UPDATEs are latency-bound; pipelining lets psycopg stream them
+    without waiting on each CommandComplete. rowcount is the cumulative count
+    of patched rows; the rest already had a line_id (idempotent re-run).
+    """
+    with ctx.db.cursor() as cur:
+        with ctx.db.pipeline():
+            cur.executemany(
+                "UPDATE translations SET line_id = %s WHERE id = %s AND line_id IS NULL",
+                batch,
+            )
+        patched = max(cur.rowcount, 0)
+    stats.inserted += patched
+    stats.skipped += len(batch) - patched
@@ -9,7 +9,6 @@ Format: SIGN_NAME ABZ_NUMBER UNICODE_CHAR (space-delimited)
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Iterable, Iterator
 
@@ -49,110 +48,134 @@ class EblSignConcordanceConnector(SourceConnector):
         return SourceManifest(checksum=h.hexdigest()[:32])
 
     def extract(self, ctx: RunContext) -> Iterator[dict]:
+        """Yield one {sign_name, abz_number, unicode_char} record per sign.
+
+        The file is read and split in one pass rather than line by line.
+        """
         if not self.ebl_path.exists():
             ctx.warn("ebl_sign.source_missing", path=str(self.ebl_path))
             return
-        with open(self.ebl_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                parts = line.split()
-                if len(parts) < 3:
-                    continue
-                sign_name = parts[0]
-                abz_raw = parts[1]
-                unicode_char = parts[2] if parts[2] != "None" else None
-                abz_number = None
-                if abz_raw.startswith("ABZ") and not abz_raw.startswith("NoABZ"):
-                    abz_number = abz_raw[3:]
-                yield {
-                    "sign_name": sign_name,
-                    "abz_number": abz_number,
-                    "unicode_char": unicode_char,
-                }
+        text = self.ebl_path.read_text(encoding="utf-8")
+        rows = [ln.split() for ln in text.splitlines()]
+        for p in rows:
+            if len(p) < 3 or p[0].startswith("#"):
+                continue
+            yield {
+                "sign_name": p[0],
+                "abz_number": p[1][3:] if p[1].startswith("ABZ") else None,
+                "unicode_char": p[2] if p[2] != "None" else None,
+            }
 
     def load(self, ctx: RunContext, rows: Iterable[dict]) -> LoadStats:
-        stats = LoadStats()
-
-        # Load existing signs indexed by name
-        existing: dict[str, list[dict]] = {}
-        for row in ctx.db.execute(
-            "SELECT id, sign_name, sign_number, unicode_char, source, source_contributions "
-            "FROM lexical_signs"
-        ).fetchall():
-            if isinstance(row, dict):
-                sid, name, num, uc, src, contributions = (
-                    row["id"],
-                    row["sign_name"],
-                    row["sign_number"],
-                    row["unicode_char"],
-                    row["source"],
-                    row["source_contributions"],
+        # COPY the parsed file into a temp stage and let Postgres merge it into
+        # lexical_signs (idx_lexical_signs_name) — no client-side copy of the
+        # whole table. Existing names get their empty sign_number/unicode_char
+        # filled (one target row per name, lowest id); unknown names are
+        # inserted as eBL-sourced signs.
+        params = {"src": SOURCE_NAME, "cit": SOURCE_CITATION, "url": SOURCE_URL}
+        # Drain extract() first: its source_missing warning is written through
+        # ctx.db, which cur.copy() keeps locked until the COPY block ends.
+        records = [(r["sign_name"], r["abz_number"], r["unicode_char"]) for r in rows]
+        with ctx.db.cursor() as cur:
+            cur.execute(
+                "CREATE TEMP TABLE ebl_sign_stage ("
+                "  ord int, sign_name text, sign_number text, unicode_char text"
+                ") ON COMMIT DROP"
+            )
+            with cur.copy(
+                "COPY ebl_sign_stage (ord, sign_name, sign_number, unicode_char) "
+                "FROM STDIN"
+            ) as cp:
+                for ord_, record in enumerate(records):
+                    cp.write_row((ord_, *record))
+            # Temp tables are never auto-analyzed; without stats the planner
+            # guesses the stage size and may pick a nested loop over
+            # lexical_signs instead of a hash/merge join.
+            cur.execute("ANALYZE ebl_sign_stage")
+            # One MERGE instead of UPDATE + INSERT ... WHERE NOT EXISTS, so
+            # lexical_signs is probed once per staged name. The source is
+            # grouped per name and joined to the lowest-id existing row, so no
+            # target row is touched twice. Repeated names in ebl.txt resolve
+            # as the old line-by-line loop did: an existing sign's empty field
+            # is filled with the LAST non-empty value for it (per field), and a
+            # new sign is inserted from its FIRST line (later lines hit
+            # ON CONFLICT DO NOTHING there). A name with no row is inserted,
+            # which cannot collide on (sign_name, source). RETURNING
+            # merge_action() (PG17) splits the counts.
+            cur.execute(
+                """
+                WITH src AS (
+                    SELECT sign_name,
+                           (array_agg(NULLIF(sign_number, '') ORDER BY ord))[1]
+                               AS first_abz,
+                           (array_agg(NULLIF(unicode_char, '') ORDER BY ord))[1]
+                               AS first_uc,
+                           (array_agg(sign_number ORDER BY ord DESC)
+                               FILTER (WHERE sign_number <> ''))[1] AS last_abz,
+                           (array_agg(unicode_char ORDER BY ord DESC)
+                               FILTER (WHERE unicode_char <> ''))[1] AS last_uc
+                    FROM ebl_sign_stage
+                    GROUP BY sign_name
+                ),
+                merged AS (
+                    MERGE INTO lexical_signs t
+                    USING (
+                        SELECT DISTINCT ON (s.sign_name)
+                               s.sign_name,
+                               l.id AS target_id,
+                               s.first_abz AS abz,
+                               s.first_uc AS uc,
+                               CASE WHEN COALESCE(l.sign_number, '') = ''
+                                    THEN s.last_abz END AS fill_abz,
+                               CASE WHEN COALESCE(l.unicode_char, '') = ''
+                                    THEN s.last_uc END AS fill_uc
+                        FROM src s
+                        LEFT JOIN lexical_signs l ON l.sign_name = s.sign_name
+                        ORDER BY s.sign_name, l.id
+                    ) f
+                    ON t.id = f.target_id
+                    WHEN MATCHED AND (f.fill_abz IS NOT NULL OR f.fill_uc IS NOT NULL)
+                    THEN UPDATE SET
+                        sign_number = COALESCE(f.fill_abz, t.sign_number),
+                        unicode_char = COALESCE(f.fill_uc, t.unicode_char),
+                        source_contributions =
+                            COALESCE(t.source_contributions, '{}'::jsonb)
+                            || jsonb_strip_nulls(jsonb_build_object(
+                                   'sign_number',
+                                   CASE WHEN f.fill_abz IS NOT NULL
+                                        THEN %(src)s::text END,
+                                   'unicode_char',
+                                   CASE WHEN f.fill_uc IS NOT NULL
+                                        THEN %(src)s::text END)),
+                        updated_at = NOW()
+                    WHEN NOT MATCHED THEN INSERT
+                        (sign_name, sign_number, unicode_char, source,
+                         source_citation, source_url, source_contributions)
+                    VALUES
+                        (f.sign_name, f.abz, f.uc, %(src)s, %(cit)s, %(url)s,
+                         jsonb_strip_nulls(jsonb_build_object(
+                             'sign_number',
+                             CASE WHEN f.abz IS NOT NULL THEN %(src)s::text END,
+                             'unicode_char',
+                             CASE WHEN f.uc IS NOT NULL THEN %(src)s::text END)))
+                    RETURNING merge_action() AS action
                 )
-            else:
-                sid, name, num, uc, src, contributions = row
-            existing.setdefault(name, []).append(
-                {
-                    "id": sid,
-                    "sign_number": num,
-                    "unicode_char": uc,
-                    "source": src,
-                    "contributions": contributions or {},
-                }
+                SELECT count(*) FILTER (WHERE action = 'INSERT') AS inserted,
+                       count(*) FILTER (WHERE action = 'UPDATE') AS updated
+                FROM merged
+                """,
+                params,
             )
-
-        for record in rows:
-            name = record["sign_name"]
-            abz = record["abz_number"]
-            uc = record["unicode_char"]
-
-            if name in existing:
-                target = existing[name][0]
-                updates: list[tuple[str, object]] = []
-                contributions = dict(target["contributions"])
-                if abz and not target["sign_number"]:
-                    updates.append(("sign_number", abz))
-                    contributions["sign_number"] = SOURCE_NAME
-                if uc and not target["unicode_char"]:
-                    updates.append(("unicode_char", uc))
-                    contributions["unicode_char"] = SOURCE_NAME
-                if updates:
-                    set_clauses = ", ".join(f"{col} = %s" for col, _ in updates)
-                    set_clauses += ", source_contributions = %s, updated_at = NOW()"
-                    values = [v for _, v in updates] + [
-                        json.dumps(contributions),
-                        target["id"],
-                    ]
-                    ctx.db.execute(
-                        f"UPDATE lexical_signs SET {set_clauses} WHERE id = %s", values
-                    )
-                    stats.updated += 1
-                else:
-                    stats.skipped += 1
+            row = cur.fetchone()
+            if isinstance(row, dict):
+                inserted, updated = row["inserted"], row["updated"]
             else:
-                contributions = {}
-                if abz:
-                    contributions["sign_number"] = SOURCE_NAME
-                if uc:
-                    contributions["unicode_char"] = SOURCE_NAME
-                ctx.db.execute(
-                    "INSERT INTO lexical_signs "
-                    "(sign_name, sign_number, unicode_char, source, source_citation, "
-                    "source_url, source_contributions) "
-                    "VALUES (%s, %s, %s, %s, %s, %s, %s) "
-                    "ON CONFLICT (sign_name, source) DO NOTHING",
-                    (
-                        name,
-                        abz,
-                        uc,
-                        SOURCE_NAME,
-                        SOURCE_CITATION,
-                        SOURCE_URL,
-                        json.dumps(contributions),
-                    ),
-                )
-                stats.inserted += 1
+                inserted, updated = row[0], row[1]
 
+        stats = LoadStats(
+            inserted=inserted,
+            updated=updated,
+            skipped=len(records) - inserted - updated,
+        )
         ctx.db.commit()
         return stats
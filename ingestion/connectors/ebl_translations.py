@@ -33,6 +33,9 @@ GOOD-CITIZEN POLICY (the CDLI IP-ban lesson):
   * A descriptive User-Agent with a contact.
   * Idempotent (ON CONFLICT) so a partial run resumes cleanly.
   * A chapter that fails after retries is dead-lettered (never aborts the run).
+  * Texts and chapters are fetched on one background thread, up to
+    DEFAULT_PREFETCH chapters ahead of the load, so curl round-trips overlap
+    the DB writes. Every request still goes through the shared throttle.
 
 macOS SSL note (CLAUDE.md): all fetches shell out to curl via subprocess.
 """
@@ -40,6 +43,8 @@ macOS SSL note (CLAUDE.md): all fetches shell out to curl via subprocess.
 from __future__ import annotations
 
 import json
+import queue
+import random
 import subprocess
 import threading
 import time
@@ -63,6 +68,12 @@ MAX_RETRIES = 4
 BACKOFF_BASE_S = 2.0
 BACKOFF_CAP_S = 60.0
 
+# Translation lines written per transaction in load().
+COMMIT_EVERY = 500
+
+# Fetched texts/chapters buffered ahead of the consumer in extract().
+DEFAULT_PREFETCH = 8
+
 
 # --- throttled fetch (curl) ------------------------------------------------
 
@@ -86,15 +97,21 @@ class _FetchError(Exception):
 
 def _curl_json(
     url: str, *, user_agent: str, timeout_s: float = 90.0
-) -> tuple[int, bytes]:
-    """GET a URL, returning (http_status, body). Body returned even on 4xx/5xx."""
+) -> tuple[int, bytes, Optional[float]]:
+    """GET a URL, returning (http_status, body, retry_after_s).
+
+    Body returned even on 4xx/5xx; retry_after_s is None without a usable
+    Retry-After header.
+    """
     sep = "\x1e"
-    write_out = f"{sep}__META__{sep}%{{http_code}}"
+    # Trailer: status, then Retry-After (empty when the header is absent).
+    write_out = f"{sep}__META__{sep}%{{http_code}}{sep}%header{{retry-after}}"
     cmd = [
         "curl",
         "-s",
         "-S",
         "-L",
+        "--compressed",
         "-A",
         user_agent,
         "-H",
@@ -120,43 +137,71 @@ def _curl_json(
     if idx < 0:
         raise _FetchError("curl output missing metadata trailer")
     body = stdout[:idx]
-    status = int(stdout[idx + len(marker) :].decode("utf-8", errors="replace") or "0")
-    return status, body
+    trailer = stdout[idx + len(marker) :].decode("utf-8", errors="replace")
+    status, _, retry_after = trailer.partition(sep)
+    return int(status or "0"), body, _retry_after_s(retry_after)
 
 
-def _backoff(attempt: int) -> None:
-    time.sleep(min(BACKOFF_BASE_S * (2**attempt), BACKOFF_CAP_S))
+def _retry_after_s(value: str) -> Optional[float]:
+    """Delta-seconds Retry-After as a float; None if absent or an HTTP-date."""
+    try:
+        return max(0.0, float(value.strip()))
+    except ValueError:
+        return None
+
+
+def _backoff(attempt: int, retry_after: Optional[float] = None) -> None:
+    """Sleep before retry `attempt`: the server's Retry-After when it sent one,
+    else exponential backoff with up to a second of jitter. Capped either way."""
+    if retry_after is None:
+        retry_after = BACKOFF_BASE_S * (2**attempt) + random.random()
+    time.sleep(min(retry_after, BACKOFF_CAP_S))
 
 
 def _fetch_json(
-    url: str, *, user_agent: str, interval_s: float, ctx: RunContext
+    url: str,
+    *,
+    user_agent: str,
+    interval_s: float,
+    events: list[tuple[str, str, dict]],
 ) -> Optional[Any]:
-    """Fetch + parse JSON with backoff on 429/5xx/timeout. None on final failure."""
+    """Fetch + parse JSON with backoff on 429/5xx/timeout. None on final failure.
+
+    Runs on the prefetch thread, so it never touches the DB: run events are
+    appended to ``events`` as (level, message, context) for the caller to
+    replay through ctx.log() on the main thread.
+    """
     for attempt in range(MAX_RETRIES + 1):
         _throttle(interval_s)
         try:
-            status, body = _curl_json(url, user_agent=user_agent)
+            status, body, retry_after = _curl_json(url, user_agent=user_agent)
         except _FetchError as e:
             if attempt < MAX_RETRIES:
                 _backoff(attempt)
                 continue
-            ctx.warn("ebl.fetch_error", url=url, error=str(e))
+            events.append(("warn", "ebl.fetch_error", {"url": url, "error": str(e)}))
             return None
         if status == 200:
             try:
                 return json.loads(body)
             except (json.JSONDecodeError, ValueError) as e:
-                ctx.warn("ebl.bad_json", url=url, error=str(e))
+                events.append(("warn", "ebl.bad_json", {"url": url, "error": str(e)}))
                 return None
         if status == 429 or 500 <= status < 600:
             if attempt < MAX_RETRIES:
-                ctx.info("ebl.retry", url=url, status=status, attempt=attempt + 1)
-                _backoff(attempt)
+                events.append(
+                    (
+                        "info",
+                        "ebl.retry",
+                        {"url": url, "status": status, "attempt": attempt + 1},
+                    )
+                )
+                _backoff(attempt, retry_after)
                 continue
-            ctx.warn("ebl.exhausted", url=url, status=status)
+            events.append(("warn", "ebl.exhausted", {"url": url, "status": status}))
             return None
         # Other 4xx — retrying won't help (404 chapter, etc.).
-        ctx.warn("ebl.http_error", url=url, status=status)
+        events.append(("warn", "ebl.http_error", {"url": url, "status": status}))
         return None
     return None
 
@@ -263,13 +308,65 @@ class EblTranslationsConnector(SourceConnector):
         # idempotent, so we re-pull and upsert. No cheap upstream checksum.
         return SourceManifest()
 
-    def _get(self, path: str, ctx: RunContext) -> Optional[Any]:
-        return _fetch_json(
+    def _fetch(self, path: str) -> tuple[Optional[Any], list]:
+        events: list[tuple[str, str, dict]] = []
+        payload = _fetch_json(
             f"{EBL_API_BASE}/{path}",
             user_agent=self.user_agent,
             interval_s=self.request_interval_s,
-            ctx=ctx,
+            events=events,
         )
+        return payload, events
+
+    def _get(self, path: str, ctx: RunContext) -> Optional[Any]:
+        payload, events = self._fetch(path)
+        for level, message, context in events:
+            ctx.log(level, message, **context)
+        return payload
+
+    def _walk(self, catalogue: list, out: queue.Queue, stop: threading.Event) -> None:
+        """Prefetch thread: fetch every text, then its chapters, in catalogue
+        order onto `out` as ("text"|"chapter", key, payload, events). Ends with
+        ("done", ...), or ("error", exc, ...) if the walk itself blew up."""
+
+        def put(item: tuple) -> bool:
+            while not stop.is_set():
+                try:
+                    out.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            for entry in catalogue:
+                genre = entry.get("genre")
+                category = entry.get("category")
+                index = entry.get("index")
+                if genre is None or category is None or index is None:
+                    continue
+                text, events = self._fetch(f"texts/{genre}/{category}/{index}")
+                if not put(("text", None, text, events)):
+                    return
+                if not isinstance(text, dict):
+                    continue
+                for ch in text.get("chapters") or []:
+                    stage = ch.get("stage")
+                    name = ch.get("name")
+                    if stage is None or name is None:
+                        continue
+                    stage_q = urllib.parse.quote(str(stage), safe="")
+                    name_q = urllib.parse.quote(str(name), safe="")
+                    chapter, events = self._fetch(
+                        f"texts/{genre}/{category}/{index}/chapters/{stage_q}/{name_q}"
+                    )
+                    key = (genre, category, index, entry.get("name"), stage, name)
+                    if not put(("chapter", key, chapter, events)):
+                        return
+        except Exception as e:  # noqa: BLE001 - re-raised on the main thread
+            put(("error", e, None, []))
+            return
+        put(("done", None, None, []))
 
     def extract(self, ctx: RunContext) -> Iterator[dict]:
         limit = ctx.config.get("limit_texts", self.limit_texts)
@@ -284,32 +381,29 @@ class EblTranslationsConnector(SourceConnector):
 
         texts_done = chapters_done = lines_emitted = chapters_failed = 0
 
-        for entry in catalogue:
-            genre = entry.get("genre")
-            category = entry.get("category")
-            index = entry.get("index")
-            text_name = entry.get("name")
-            if genre is None or category is None or index is None:
-                continue
-
-            text = self._get(f"texts/{genre}/{category}/{index}", ctx)
-            if not isinstance(text, dict):
-                continue
-            texts_done += 1
-            chapters = text.get("chapters") or []
-
-            for ch in chapters:
-                stage = ch.get("stage")
-                name = ch.get("name")
-                if stage is None or name is None:
+        depth = max(1, int(ctx.config.get("prefetch", DEFAULT_PREFETCH)))
+        fetched: queue.Queue = queue.Queue(maxsize=depth)
+        stop = threading.Event()
+        walker = threading.Thread(
+            target=self._walk, args=(catalogue, fetched, stop), daemon=True
+        )
+        walker.start()
+        try:
+            while True:
+                kind, key, payload, events = fetched.get()
+                for level, message, context in events:
+                    ctx.log(level, message, **context)
+                if kind == "done":
+                    break
+                if kind == "error":
+                    raise key
+                if kind == "text":
+                    if isinstance(payload, dict):
+                        texts_done += 1
                     continue
-                stage_q = urllib.parse.quote(str(stage), safe="")
-                name_q = urllib.parse.quote(str(name), safe="")
-                chapter = self._get(
-                    f"texts/{genre}/{category}/{index}/chapters/{stage_q}/{name_q}",
-                    ctx,
-                )
-                if not isinstance(chapter, dict) or "lines" not in chapter:
+
+                genre, category, index, text_name, stage, name = key
+                if not isinstance(payload, dict) or "lines" not in payload:
                     chapters_failed += 1
                     ctx.dead_letter(
                         category="no_match",
@@ -327,7 +421,7 @@ class EblTranslationsConnector(SourceConnector):
                     continue
                 chapters_done += 1
 
-                for line in chapter.get("lines") or []:
+                for line in payload.get("lines") or []:
                     en = extract_en(line.get("translation"))
                     if not en:
                         continue
@@ -346,6 +440,10 @@ class EblTranslationsConnector(SourceConnector):
                         "translation_en": en,
                         "reconstruction": _reconstruction_str(line),
                     }
+        finally:
+            # An aborted run (generator closed early) stops the walk instead of
+            # waiting out the rest of the catalogue.
+            stop.set()
 
         ctx.info(
             "ebl.extract_summary",
@@ -357,11 +455,14 @@ class EblTranslationsConnector(SourceConnector):
 
     def load(self, ctx: RunContext, rows: Iterable[dict]) -> LoadStats:
         stats = LoadStats()
-        for r in rows:
+        # Commit every COMMIT_EVERY lines instead of per line; a savepoint per
+        # line still lets one bad row roll back alone and be dead-lettered.
+        for i, r in enumerate(rows, 1):
+            ctx.db.execute("SAVEPOINT ebl_line")
             try:
                 self._load_one(ctx, r, stats)
             except Exception as e:  # noqa: BLE001 — route, don't abort the run
-                ctx.db.rollback()
+                ctx.db.execute("ROLLBACK TO SAVEPOINT ebl_line")
                 ctx.dead_letter(
                     category="other",
                     subcategory="load_failed",
@@ -381,6 +482,11 @@ class EblTranslationsConnector(SourceConnector):
                     reason=f"load failed: {e}",
                 )
                 stats.dead_lettered += 1
+            else:
+                ctx.db.execute("RELEASE SAVEPOINT ebl_line")
+            if i % COMMIT_EVERY == 0:
+                ctx.db.commit()
+        ctx.db.commit()
         return stats
 
     def _load_one(self, ctx: RunContext, r: dict, stats: LoadStats) -> None:
@@ -415,7 +521,6 @@ class EblTranslationsConnector(SourceConnector):
             ),
         ).fetchone()
         inserted = row["inserted"] if isinstance(row, dict) else row[0]
-        ctx.db.commit()
         if inserted:
             stats.inserted += 1
         else:
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Iterable, Iterator
 
 from ingestion.base import LoadStats, RunContext, SourceConnector
+from ingestion.loader import copy_insert, fetch_key_map, load_json
 
 EPSD2_BASE = Path("source-data/sources/ORACC/epsd2/json/epsd2")
 SIGN_LIST_FILE = EPSD2_BASE / "epsd2-sl.json"
@@ -26,6 +27,58 @@ SOURCE_CITATION = (
 )
 SOURCE_URL = "http://psd.museum.upenn.edu/epsd2/"
 
+# Column order of the rows load() COPYs into each lexical table.
+SIGN_COLUMNS = [
+    "sign_name",
+    "unicode_char",
+    "sign_number",
+    "shape_category",
+    "component_signs",
+    "values",
+    "determinative_function",
+    "language_codes",
+    "dialects",
+    "periods",
+    "regions",
+    "source",
+    "source_citation",
+    "source_url",
+]
+LEMMA_COLUMNS = [
+    "citation_form",
+    "guide_word",
+    "pos",
+    "language_code",
+    "base_form",
+    "verbal_class",
+    "nominal_pattern",
+    "dialect",
+    "period",
+    "region",
+    "cognates",
+    "derived_from",
+    "attestation_count",
+    "tablet_count",
+    "lemma_type",
+    "source",
+    "source_citation",
+    "source_url",
+]
+SENSE_COLUMNS = [
+    "lemma_id",
+    "sense_number",
+    "definition_parts",
+    "usage_notes",
+    "semantic_domain",
+    "typical_context",
+    "example_passages",
+    "translations",
+    "context_distribution",
+    "source",
+    "source_citation",
+    "source_url",
+]
+
 
 def _normalize_for_matching(value: str) -> str:
     no_subscripts = re.sub(r"[₀-₉]+", "", value)
@@ -45,8 +98,7 @@ class Epsd2Connector(SourceConnector):
     def extract(self, ctx: RunContext) -> Iterator[dict]:
         # Phase 1: signs from epsd2-sl.json
         if SIGN_LIST_FILE.exists():
-            with open(SIGN_LIST_FILE, encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json(SIGN_LIST_FILE)
             for sign_name, sign_data in data.get("signs", {}).items():
                 values = [
                     unicodedata.normalize("NFC", v) for v in sign_data.get("values", [])
@@ -73,8 +125,7 @@ class Epsd2Connector(SourceConnector):
 
         # Phase 2: lemmas + senses from gloss-sux.json
         if GLOSSARY_FILE.exists():
-            with open(GLOSSARY_FILE, encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json(GLOSSARY_FILE)
             for entry in data.get("entries", []):
                 cf = entry.get("cf")
                 if not cf:
@@ -139,72 +190,66 @@ class Epsd2Connector(SourceConnector):
 
         stats = LoadStats()
 
-        # Insert signs
+        # Signs, lemmas and senses go in through one COPY + INSERT ... SELECT
+        # each (copy_insert commits) instead of a statement per row.
         if signs:
-            with ctx.db.cursor() as cur:
-                cur.executemany(
-                    "INSERT INTO lexical_signs "
-                    "(sign_name, unicode_char, sign_number, shape_category, component_signs, "
-                    "values, determinative_function, language_codes, dialects, periods, regions, "
-                    "source, source_citation, source_url) "
-                    "VALUES (%(sign_name)s, %(unicode_char)s, %(sign_number)s, %(shape_category)s, "
-                    "%(component_signs)s, %(values)s, %(determinative_function)s, %(language_codes)s, "
-                    "%(dialects)s, %(periods)s, %(regions)s, %(source)s, %(source_citation)s, %(source_url)s) "
-                    "ON CONFLICT (sign_name, source) DO NOTHING",
-                    signs,
+            stats = stats.merge(
+                copy_insert(
+                    ctx.db,
+                    table="lexical_signs",
+                    columns=SIGN_COLUMNS,
+                    rows=[tuple(sg[c] for c in SIGN_COLUMNS) for sg in signs],
+                    on_conflict="ON CONFLICT (sign_name, source) DO NOTHING",
                 )
-            ctx.db.commit()
-            stats.inserted += len(signs)
+            )
 
-        # Insert lemmas
         if lemmas:
-            with ctx.db.cursor() as cur:
-                cur.executemany(
-                    "INSERT INTO lexical_lemmas "
-                    "(citation_form, guide_word, pos, language_code, base_form, verbal_class, "
-                    "nominal_pattern, dialect, period, region, cognates, derived_from, "
-                    "attestation_count, tablet_count, lemma_type, source, source_citation, source_url) "
-                    "VALUES (%(citation_form)s, %(guide_word)s, %(pos)s, %(language_code)s, %(base_form)s, "
-                    "%(verbal_class)s, %(nominal_pattern)s, %(dialect)s, %(period)s, %(region)s, "
-                    "%(cognates)s, %(derived_from)s, %(attestation_count)s, %(tablet_count)s, "
-                    "%(lemma_type)s, %(source)s, %(source_citation)s, %(source_url)s) "
-                    "ON CONFLICT (cf_gw_pos, source) DO NOTHING",
-                    lemmas,
-                )
-            ctx.db.commit()
+            copy_insert(
+                ctx.db,
+                table="lexical_lemmas",
+                columns=LEMMA_COLUMNS,
+                rows=[tuple(lm[c] for c in LEMMA_COLUMNS) for lm in lemmas],
+                on_conflict="ON CONFLICT (cf_gw_pos, source) DO NOTHING",
+            )
 
         # Resolve lemma IDs and insert senses
         if senses_pending:
+            # Resolve every distinct citation form in one query rather than a
+            # SELECT per form (forms with no lemma used to be re-queried for
+            # each of their senses).
+            unique_cfs = list({sense["_lemma_cf"] for sense in senses_pending})
             lemma_id_map: dict[str, int] = {}
+            for row in ctx.db.execute(
+                "SELECT DISTINCT ON (citation_form) citation_form, id "
+                "FROM lexical_lemmas "
+                "WHERE citation_form = ANY(%s) AND source = 'epsd2' "
+                "ORDER BY citation_form, id",
+                (unique_cfs,),
+            ).fetchall():
+                if isinstance(row, dict):
+                    lemma_id_map[row["citation_form"]] = row["id"]
+                else:
+                    lemma_id_map[row[0]] = row[1]
             for sense in senses_pending:
-                cf = sense.pop("_lemma_cf")
-                if cf not in lemma_id_map:
-                    row = ctx.db.execute(
-                        "SELECT id FROM lexical_lemmas WHERE citation_form = %s AND source = 'epsd2' LIMIT 1",
-                        (cf,),
-                    ).fetchone()
-                    if row:
-                        lemma_id_map[cf] = (
-                            row["id"] if isinstance(row, dict) else row[0]
-                        )
-                if cf in lemma_id_map:
-                    sense["lemma_id"] = lemma_id_map[cf]
+                lemma_id = lemma_id_map.get(sense.pop("_lemma_cf"))
+                if lemma_id is not None:
+                    sense["lemma_id"] = lemma_id
 
-            senses_to_insert = [s for s in senses_pending if "lemma_id" in s]
+            senses_to_insert = [
+                tuple(sense[c] for c in SENSE_COLUMNS)
+                for sense in senses_pending
+                if "lemma_id" in sense
+            ]
             if senses_to_insert:
-                with ctx.db.cursor() as cur:
-                    cur.executemany(
-                        "INSERT INTO lexical_senses "
-                        "(lemma_id, sense_number, definition_parts, usage_notes, semantic_domain, "
-                        "typical_context, example_passages, translations, context_distribution, "
-                        "source, source_citation, source_url) "
-                        "VALUES (%(lemma_id)s, %(sense_number)s, %(definition_parts)s, %(usage_notes)s, "
-                        "%(semantic_domain)s, %(typical_context)s, %(example_passages)s, "
-                        "%(translations)s::jsonb, %(context_distribution)s, %(source)s, "
-                        "%(source_citation)s, %(source_url)s)",
-                        senses_to_insert,
-                    )
-                ctx.db.commit()
+                # No conflict target: lexical_senses has no natural key, and
+                # the old per-row INSERT had no ON CONFLICT either.
+                copy_insert(
+                    ctx.db,
+                    table="lexical_senses",
+                    columns=SENSE_COLUMNS,
+                    rows=senses_to_insert,
+                    on_conflict="",
+                )
 
         # Phase 3: sign-lemma associations
         if signs:
@@ -213,51 +258,60 @@ class Epsd2Connector(SourceConnector):
         return stats
 
     def _create_associations(self, ctx: RunContext, signs: list[dict]) -> None:
-        associations = []
+        # Only (sign_id, lemma_id, value) varies per association; reading
+        # type, source and citation are the same for every row, so they are
+        # bound once and the varying columns go up as three arrays.
+        #
+        # Sign and lemma ids are resolved up front with one query each rather
+        # than a SELECT per sign and per reading.
+        sign_id_map = fetch_key_map(
+            ctx.db,
+            "SELECT sign_name, id FROM lexical_signs "
+            "WHERE sign_name = ANY(%s) AND source = 'epsd2-sl'",
+            ([sign["sign_name"] for sign in signs],),
+        )
+        readings = {
+            _normalize_for_matching(value)
+            for sign in signs
+            for value in sign.get("values", [])
+        }
+        lemma_id_map = fetch_key_map(
+            ctx.db,
+            "SELECT DISTINCT ON (LOWER(citation_form)) LOWER(citation_form), id "
+            "FROM lexical_lemmas "
+            "WHERE LOWER(citation_form) = ANY(%s) "
+            "AND language_code = 'sux' AND source = 'epsd2' "
+            "ORDER BY LOWER(citation_form), id",
+            (list(readings),),
+        )
+
+        sign_ids: list[int] = []
+        lemma_ids: list[int] = []
+        values: list[str] = []
         for sign in signs:
-            sign_row = ctx.db.execute(
-                "SELECT id FROM lexical_signs WHERE sign_name = %s AND source = 'epsd2-sl' LIMIT 1",
-                (sign["sign_name"],),
-            ).fetchone()
-            if not sign_row:
+            sign_id = sign_id_map.get(sign["sign_name"])
+            if sign_id is None:
                 continue
-            sign_id = sign_row["id"] if isinstance(sign_row, dict) else sign_row[0]
             for value in sign.get("values", []):
-                normalized = _normalize_for_matching(value)
-                lemma_row = ctx.db.execute(
-                    "SELECT id FROM lexical_lemmas WHERE LOWER(citation_form) = %s "
-                    "AND language_code = 'sux' AND source = 'epsd2' LIMIT 1",
-                    (normalized,),
-                ).fetchone()
-                if lemma_row:
-                    associations.append(
-                        {
-                            "sign_id": sign_id,
-                            "lemma_id": lemma_row["id"]
-                            if isinstance(lemma_row, dict)
-                            else lemma_row[0],
-                            "value": value,
-                            "reading_type": "logographic",
-                            "frequency": 0,
-                            "context_distribution": None,
-                            "source": "epsd2-sl",
-                            "source_citation": SOURCE_CITATION,
-                            "source_url": SOURCE_URL,
-                        }
-                    )
-        if associations:
-            with ctx.db.cursor() as cur:
-                cur.executemany(
-                    "INSERT INTO lexical_sign_lemma_associations "
-                    "(sign_id, lemma_id, value, reading_type, frequency, context_distribution, "
-                    "source, source_citation, source_url) "
-                    "VALUES (%(sign_id)s, %(lemma_id)s, %(value)s, %(reading_type)s, %(frequency)s, "
-                    "%(context_distribution)s, %(source)s, %(source_citation)s, %(source_url)s) "
-                    "ON CONFLICT DO NOTHING",
-                    associations,
-                )
+                lemma_id = lemma_id_map.get(_normalize_for_matching(value))
+                if lemma_id is not None:
+                    sign_ids.append(sign_id)
+                    lemma_ids.append(lemma_id)
+                    values.append(value)
+        if sign_ids:
+            ctx.db.execute(
+                "INSERT INTO lexical_sign_lemma_associations "
+                "(sign_id, lemma_id, value, reading_type, frequency, context_distribution, "
+                "source, source_citation, source_url) "
+                "SELECT t.sign_id, t.lemma_id, t.value, 'logographic', 0, NULL, "
+                "'epsd2-sl', %s, %s "
+                "FROM unnest(%s::integer[], %s::integer[], %s::text[]) "
+                "AS t(sign_id, lemma_id, value) "
+                "ON CONFLICT DO NOTHING",
+                (SOURCE_CITATION, SOURCE_URL, sign_ids, lemma_ids, values),
+            )
             ctx.db.commit()
-            ctx.info("epsd2.associations_created", count=len(associations))
+            ctx.info("epsd2.associations_created", count=len(sign_ids))
 
     def verify(self, ctx: RunContext) -> None:
         for table, minimum in (("lexical_signs", 100), ("lexical_lemmas", 1000)):
@@ -201,15 +201,10 @@ def build_index(dump_paths: list[Path]) -> dict[str, list[dict]]:
     """
     index: dict[str, list[dict]] = {}
 
-    def add(key: str, cand: dict) -> None:
-        if not key:
-            return
-        bucket = index.setdefault(key, [])
-        # Dedup by geonames_id within a key (one place, many spellings).
-        if not any(c["geonames_id"] == cand["geonames_id"] for c in bucket):
-            bucket.append(cand)
-
-    for path in dump_paths:
+    # A geonameid occurs on exactly one row of one country dump, so deduping
+    # a place's spellings within its own row is enough to bucket it once per
+    # key — no run-wide (key, geonames_id) set held for millions of names.
+    for path in dict.fromkeys(dump_paths):
         with zipfile.ZipFile(path) as zf:
             inner = path.stem + ".txt"  # e.g. IQ.zip → IQ.txt
             names = zf.namelist()
@@ -249,10 +244,13 @@ def build_index(dump_paths: list[Path]) -> dict[str, list[dict]]:
                         "feature_code": row[_COL_FEATURE_CODE],
                         "country": row[_COL_COUNTRY],
                     }
-                    add(fold(row[_COL_NAME]), cand)
-                    add(fold(row[_COL_ASCIINAME]), cand)
-                    for alt in (row[_COL_ALTNAMES] or "").split(","):
-                        add(fold(alt), cand)
+                    keys = {fold(row[_COL_NAME]), fold(row[_COL_ASCIINAME])}
+                    keys.update(
+                        fold(alt) for alt in (row[_COL_ALTNAMES] or "").split(",")
+                    )
+                    keys.discard("")
+                    for key in keys:
+                        index.setdefault(key, []).append(cand)
     return index
 
 
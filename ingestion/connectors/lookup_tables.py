@@ -19,7 +19,6 @@ All inserts are ON CONFLICT DO UPDATE so re-runs are safe.
 
 from __future__ import annotations
 
-import csv
 import hashlib
 import re
 from collections import Counter
@@ -33,7 +32,7 @@ from ingestion.base import (
     SourceConnector,
     SourceManifest,
 )
-from ingestion.loader import upsert_batch
+from ingestion.loader import iter_csv_columns, upsert_batch
 
 DEFAULT_CSV = Path("source-data/sources/CDLI/metadata/cdli_cat.csv")
 
@@ -541,6 +540,14 @@ for (_reg, _sub), _names in PROVENIENCE_REGIONS.items():
     for _n in _names:
         _PROV_PREFIX[_n.lower()] = (_reg, _sub)
 
+# The same entries bucketed by first character, each as (rank, name, region),
+# where rank is the _PROV_PREFIX insertion order. A name can only be a prefix
+# or substring of a string that contains its first character, so matching
+# scans a few buckets instead of every entry.
+_PROV_BY_INITIAL: dict[str, list[tuple[int, str, tuple[str, str]]]] = {}
+for _rank, (_n, _region_sub) in enumerate(_PROV_PREFIX.items()):
+    _PROV_BY_INITIAL.setdefault(_n[0], []).append((_rank, _n, _region_sub))
+
 # Map raw genre parts (lowercased) → canonical name
 GENRE_NORMALIZE: dict[str, str] = {
     "administrative": "Administrative",
@@ -657,14 +664,15 @@ class LookupTablesConnector(SourceConnector):
         genres: Counter[str] = Counter()
         proveniences: Counter[str] = Counter()
 
-        with open(self.csv_path, encoding="utf-8", newline="") as f:
-            for row in csv.DictReader(f):
-                if row.get("period", "").strip():
-                    periods[row["period"].strip()] += 1
-                if row.get("genre", "").strip():
-                    genres[row["genre"].strip()] += 1
-                if row.get("provenience", "").strip():
-                    proveniences[row["provenience"].strip()] += 1
+        for period, genre, provenience in iter_csv_columns(
+            self.csv_path, ("period", "genre", "provenience")
+        ):
+            if period := period.strip():
+                periods[period] += 1
+            if genre := genre.strip():
+                genres[genre] += 1
+            if provenience := provenience.strip():
+                proveniences[provenience] += 1
 
         ctx.info(
             "lookup.csv_scanned",
@@ -877,10 +885,17 @@ def _match_provenience_region(ancient_name: str) -> tuple[str, str]:
     lower = ancient_name.lower()
     if lower in _PROV_PREFIX:
         return _PROV_PREFIX[lower]
-    for prefix, region_sub in _PROV_PREFIX.items():
+    for _, prefix, region_sub in _PROV_BY_INITIAL.get(lower[0], ()):
         if lower.startswith(prefix):
             return region_sub
-    for prefix, region_sub in _PROV_PREFIX.items():
-        if prefix in lower:
-            return region_sub
-    return ("Unknown", "")
+    # Earliest-ranked name contained anywhere in the string, as a full scan of
+    # _PROV_PREFIX in insertion order would find.
+    best: tuple[int, str, tuple[str, str]] | None = None
+    for ch in set(lower):
+        for entry in _PROV_BY_INITIAL.get(ch, ()):
+            if best is not None and entry[0] >= best[0]:
+                break
+            if entry[1] in lower:
+                best = entry
+                break
+    return best[2] if best is not None else ("Unknown", "")
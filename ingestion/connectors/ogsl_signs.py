@@ -21,7 +21,7 @@ from ingestion.base import (
     SourceConnector,
     SourceManifest,
 )
-from ingestion.loader import upsert_batch
+from ingestion.loader import load_json, upsert_batch
 
 DEFAULT_OGSL = Path("source-data/sources/ORACC/ogsl/json/ogsl/ogsl-sl.json")
 
@@ -98,8 +98,7 @@ class OgslSignsConnector(SourceConnector):
         if not self.ogsl_path.exists():
             ctx.warn("ogsl.source_missing", path=str(self.ogsl_path))
             return
-        with open(self.ogsl_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json(self.ogsl_path)
         signs_data = data.get("signs", {})
         ctx.info("ogsl.extract_start", sign_count=len(signs_data))
 
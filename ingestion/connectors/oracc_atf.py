@@ -30,12 +30,15 @@ Depends on: cdli-catalog (for the artifacts guard) + annotation-runs.
 from __future__ import annotations
 
 import json
+import os
 import re
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Iterable, Iterator
+from typing import Iterable, Iterator, Optional
 
 from ingestion.base import LoadStats, RunContext, SourceConnector
 from ingestion.dead_letters import DeadLetterCategory
+from ingestion.loader import fetch_key_set, load_json
 from ingestion.connectors.oracc_lemmatizations import (
     ORACC_PROJECTS,
     _find_corpus_dirs,
@@ -45,6 +48,15 @@ from ingestion.connectors.oracc_lemmatizations import (
 BATCH_SIZE = 200
 DEAD_LETTER_FLUSH_EVERY = 5000
 
+# Projects with at least this many corpusjson files are read and walked on a
+# process pool while the main process writes; smaller ones don't repay the
+# Pool start-up and pickling cost.
+PARALLEL_PARSE_MIN_FILES = 500
+PARSE_CHUNKSIZE = 32
+
+# Natural key of an ORACC text_lines row: (p_number, surface_id, line_number).
+_LineKey = tuple[str, Optional[int], str]
+
 # ORACC frag strings carry GDL-internal control markers (e.g. "a-na\t", "TA@v\m")
 # that are NOT part of the ATF surface text — they encode sign modifiers/flags
 # the renderer uses, not characters a scholar reads. Strip them when building
@@ -178,6 +190,22 @@ def _parse_tablet(data: dict) -> dict | None:
     return {"p_number": p_number, "surfaces": sorted(surfaces), "lines": out_lines}
 
 
+def _read_cdl(path: str) -> tuple[str, Optional[str], Optional[dict]]:
+    """Read + walk one corpusjson file: (status, p_number, tablet).
+
+    status is "ok", "malformed" (not JSON) or "no_p_number". Pure and
+    DB-free, so load() can fan it out over a Pool.
+    """
+    try:
+        data = load_json(path)
+    except (json.JSONDecodeError, ValueError, OSError):
+        return "malformed", None, None
+    p_number = data.get("textid", "")
+    if not p_number:
+        return "no_p_number", None, None
+    return "ok", p_number, _parse_tablet(data)
+
+
 class OraccAtfConnector(SourceConnector):
     id = "oracc-atf"
     display_name = "ORACC CDL ATF -> text_lines"
@@ -208,10 +236,7 @@ class OraccAtfConnector(SourceConnector):
                 yield {"project": project, "cdl_files": [str(p) for p in cdl_files]}
 
     def load(self, ctx: RunContext, rows: Iterable[dict]) -> LoadStats:
-        known_p = {
-            (r["p_number"] if isinstance(r, dict) else r[0])
-            for r in ctx.db.execute("SELECT p_number FROM artifacts").fetchall()
-        }
+        known_p = fetch_key_set(ctx.db, "SELECT p_number FROM artifacts")
         ctx.info("oracc_atf.known_artifacts", count=len(known_p))
 
         stats = {
@@ -229,69 +254,77 @@ class OraccAtfConnector(SourceConnector):
                 ctx.dead_letter_many(dl_buffer)
                 dl_buffer = []
 
-        for batch in rows:
-            project = batch["project"]
-            cdl_files = [Path(p) for p in batch["cdl_files"]]
-            pending: list[dict] = []
-
-            for cdl_file in cdl_files:
-                try:
-                    with open(cdl_file, encoding="utf-8") as f:
-                        data = json.load(f)
-                except (json.JSONDecodeError, ValueError, OSError):
-                    dl_buffer.append(
-                        {
-                            "category": DeadLetterCategory.VALIDATION_FAILED.value,
-                            "subcategory": "malformed_cdl",
-                            "source_key": f"{project}/{cdl_file.stem}",
-                            "payload": {"project": project, "file": str(cdl_file)},
-                            "reason": "corpusjson failed to parse as JSON",
-                        }
-                    )
-                    continue
-
-                p_number = data.get("textid", "")
-                if not p_number:
-                    dl_buffer.append(
-                        {
-                            "category": DeadLetterCategory.VALIDATION_FAILED.value,
-                            "subcategory": "missing_p_number",
-                            "source_key": f"{project}/{cdl_file.stem}",
-                            "payload": {"project": project, "file": str(cdl_file)},
-                            "reason": "corpusjson has no textid",
-                        }
-                    )
-                    continue
-
-                # Fix A scope: only tablets already in artifacts. The remaining
-                # bucket waits for Fix C (#238) and is silently skipped, NOT
-                # dead-lettered (it is expected, not an error).
-                if p_number not in known_p:
-                    stats["skipped_not_in_artifacts"] += 1
-                    continue
-
-                tablet = _parse_tablet(data)
-                if tablet is None:
-                    stats["skipped_no_data"] += 1
-                    continue
-                pending.append(tablet)
-
-                if len(pending) >= BATCH_SIZE:
+        workers = int(ctx.config.get("parse_workers") or os.cpu_count() or 1)
+        pool = None
+        try:
+            for batch in rows:
+                project = batch["project"]
+                cdl_files = batch["cdl_files"]
+                pending: list[dict] = []
+
+                parsed: Iterator[tuple[str, Optional[str], Optional[dict]]]
+                if workers > 1 and len(cdl_files) >= PARALLEL_PARSE_MIN_FILES:
+                    if pool is None:
+                        pool = Pool(workers)
+                    parsed = pool.imap(_read_cdl, cdl_files, chunksize=PARSE_CHUNKSIZE)
+                else:
+                    parsed = map(_read_cdl, cdl_files)
+
+                for cdl_file, (status, p_number, tablet) in zip(cdl_files, parsed):
+                    if status == "malformed":
+                        dl_buffer.append(
+                            {
+                                "category": DeadLetterCategory.VALIDATION_FAILED.value,
+                                "subcategory": "malformed_cdl",
+                                "source_key": f"{project}/{Path(cdl_file).stem}",
+                                "payload": {"project": project, "file": cdl_file},
+                                "reason": "corpusjson failed to parse as JSON",
+                            }
+                        )
+                        continue
+                    if status == "no_p_number":
+                        dl_buffer.append(
+                            {
+                                "category": DeadLetterCategory.VALIDATION_FAILED.value,
+                                "subcategory": "missing_p_number",
+                                "source_key": f"{project}/{Path(cdl_file).stem}",
+                                "payload": {"project": project, "file": cdl_file},
+                                "reason": "corpusjson has no textid",
+                            }
+                        )
+                        continue
+
+                    # Fix A scope: only tablets already in artifacts. The
+                    # remaining bucket waits for Fix C (#238) and is silently
+                    # skipped, NOT dead-lettered (it is expected, not an error).
+                    if p_number not in known_p:
+                        stats["skipped_not_in_artifacts"] += 1
+                        continue
+
+                    if tablet is None:
+                        stats["skipped_no_data"] += 1
+                        continue
+                    pending.append(tablet)
+
+                    if len(pending) >= BATCH_SIZE:
+                        self._flush(ctx, pending, stats)
+                        pending = []
+                    if len(dl_buffer) >= DEAD_LETTER_FLUSH_EVERY:
+                        flush_dl()
+
+                if pending:
                     self._flush(ctx, pending, stats)
-                    pending = []
-                if len(dl_buffer) >= DEAD_LETTER_FLUSH_EVERY:
-                    flush_dl()
-
-            if pending:
-                self._flush(ctx, pending, stats)
-            flush_dl()
-            ctx.info(
-                "oracc_atf.project_done",
-                project=project,
-                tablets=stats["tablets"],
-                lines=stats["lines"],
-                tokens=stats["tokens"],
-            )
+                flush_dl()
+                ctx.info(
+                    "oracc_atf.project_done",
+                    project=project,
+                    tablets=stats["tablets"],
+                    lines=stats["lines"],
+                    tokens=stats["tokens"],
+                )
+        finally:
+            if pool is not None:
+                pool.terminate()
 
         flush_dl()
         ctx.info("oracc_atf.done", **stats)
@@ -301,7 +334,15 @@ class OraccAtfConnector(SourceConnector):
         )
 
     def _flush(self, ctx: RunContext, tablets: list[dict], stats: dict) -> None:
+        # The surface/line/token statements below repeat for every line of
+        # every tablet; prepare=True has the server plan each one on first use
+        # rather than after psycopg's default five executions.
         with ctx.db.cursor() as cur:
+            # (line, natural key, line_id) in order; line_id None = the line
+            # was already stored.
+            placed: list[tuple[dict, _LineKey, Optional[int]]] = []
+            # Natural keys of the lines that hit ON CONFLICT (re-run / CDLI dup).
+            existing_keys: list[_LineKey] = []
             for tablet in tablets:
                 p_number = tablet["p_number"]
                 surface_id_map = self._ensure_surfaces(
@@ -312,7 +353,8 @@ class OraccAtfConnector(SourceConnector):
                     surface_id = (
                         surface_id_map.get(line["surface"]) if line["surface"] else None
                     )
-                    cur.execute(
+                    key = (p_number, surface_id, line["line_number"])
+                    row = cur.execute(
                         "INSERT INTO text_lines "
                         "(p_number, surface_id, column_number, line_number, raw_atf, "
                         "is_ruling, is_blank, source) "
@@ -320,61 +362,93 @@ class OraccAtfConnector(SourceConnector):
                         "ON CONFLICT (p_number, surface_id, column_number, line_number, source) "
                         "DO NOTHING RETURNING id",
                         (p_number, surface_id, line["line_number"], line["raw_atf"]),
-                    )
-                    row = cur.fetchone()
+                        prepare=True,
+                    ).fetchone()
                     if row is None:
-                        # Line already exists (re-run / CDLI dup) — fetch its id
-                        # so tokens still land idempotently.
-                        row = cur.execute(
-                            "SELECT id FROM text_lines WHERE p_number = %s "
-                            "AND surface_id IS NOT DISTINCT FROM %s "
-                            "AND column_number = 0 AND line_number = %s "
-                            "AND source = 'oracc'",
-                            (p_number, surface_id, line["line_number"]),
-                        ).fetchone()
-                        if row is None:
-                            continue
+                        existing_keys.append(key)
+                        placed.append((line, key, None))
                     else:
                         stats["lines"] += 1
-                    line_id = row["id"] if isinstance(row, dict) else row[0]
-
-                    for tok in line["tokens"]:
-                        cur.execute(
-                            "INSERT INTO tokens (line_id, position, gdl_json, lang, raw_form) "
-                            "VALUES (%s, %s, %s, %s, %s) "
-                            "ON CONFLICT (line_id, position) DO NOTHING",
-                            (
-                                line_id,
-                                tok["position"],
-                                json.dumps(tok["gdl"], ensure_ascii=False)
-                                if tok["gdl"] is not None
-                                else None,
-                                tok["lang"],
-                                tok["form"],
-                            ),
-                        )
-                        if cur.rowcount:
-                            stats["tokens"] += 1
+                        line_id = row["id"] if isinstance(row, dict) else row[0]
+                        placed.append((line, key, line_id))
                 stats["tablets"] += 1
+
+            # Resolve every line that already existed with one SELECT for the
+            # whole flush, so tokens still land idempotently.
+            existing_ids = self._existing_line_ids(cur, existing_keys)
+
+            for line, key, line_id in placed:
+                if line_id is None:
+                    line_id = existing_ids.get(key)
+                    if line_id is None:
+                        continue
+                for tok in line["tokens"]:
+                    cur.execute(
+                        "INSERT INTO tokens (line_id, position, gdl_json, lang, raw_form) "
+                        "VALUES (%s, %s, %s, %s, %s) "
+                        "ON CONFLICT (line_id, position) DO NOTHING",
+                        (
+                            line_id,
+                            tok["position"],
+                            json.dumps(tok["gdl"], ensure_ascii=False)
+                            if tok["gdl"] is not None
+                            else None,
+                            tok["lang"],
+                            tok["form"],
+                        ),
+                        prepare=True,
+                    )
+                    if cur.rowcount:
+                        stats["tokens"] += 1
         ctx.db.commit()
 
+    @staticmethod
+    def _existing_line_ids(cur, keys: list[_LineKey]) -> dict[_LineKey, int]:
+        """Map (p_number, surface_id, line_number) -> id for stored ORACC lines."""
+        if not keys:
+            return {}
+        p_numbers, surface_ids, line_numbers = (list(col) for col in zip(*keys))
+        cur.execute(
+            "SELECT t.id, t.p_number, t.surface_id, t.line_number "
+            "FROM unnest(%s::text[], %s::int[], %s::text[]) "
+            "AS k(p_number, surface_id, line_number) "
+            "JOIN text_lines t ON t.p_number = k.p_number "
+            "AND t.surface_id IS NOT DISTINCT FROM k.surface_id "
+            "AND t.line_number = k.line_number "
+            "WHERE t.column_number = 0 AND t.source = 'oracc'",
+            (p_numbers, surface_ids, line_numbers),
+        )
+        found: dict[_LineKey, int] = {}
+        for row in cur.fetchall():
+            if isinstance(row, dict):
+                key = (row["p_number"], row["surface_id"], row["line_number"])
+                found.setdefault(key, row["id"])
+            else:
+                found.setdefault((row[1], row[2], row[3]), row[0])
+        return found
+
     @staticmethod
     def _ensure_surfaces(
         cur, p_number: str, surface_types: list[str]
     ) -> dict[str, int]:
         surface_id_map: dict[str, int] = {}
         for surface_type in surface_types:
+            # Insert-or-select in one statement: the id comes back new or
+            # existing without a second round trip, and without rewriting an
+            # existing row the way a no-op DO UPDATE would.
             cur.execute(
-                "INSERT INTO surfaces (p_number, surface_type) VALUES (%s, %s) "
-                "ON CONFLICT (p_number, surface_type) DO NOTHING RETURNING id",
-                (p_number, surface_type),
+                "WITH ins AS ("
+                "  INSERT INTO surfaces (p_number, surface_type) VALUES (%(p)s, %(s)s) "
+                "  ON CONFLICT (p_number, surface_type) DO NOTHING RETURNING id"
+                ") "
+                "SELECT id FROM ins "
+                "UNION ALL "
+                "SELECT id FROM surfaces WHERE p_number = %(p)s AND surface_type = %(s)s "
+                "AND NOT EXISTS (SELECT 1 FROM ins)",
+                {"p": p_number, "s": surface_type},
+                prepare=True,
             )
             row = cur.fetchone()
-            if row is None:
-                row = cur.execute(
-                    "SELECT id FROM surfaces WHERE p_number = %s AND surface_type = %s",
-                    (p_number, surface_type),
-                ).fetchone()
             if row:
                 surface_id_map[surface_type] = (
                     row["id"] if isinstance(row, dict) else row[0]
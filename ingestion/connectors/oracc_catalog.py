@@ -40,13 +40,13 @@ oracc-atf finally sees these P-numbers.
 
 from __future__ import annotations
 
-import glob
 import json
 import os
 from pathlib import Path
 from typing import Iterable, Iterator
 
 from ingestion.base import LoadStats, RunContext, SourceConnector
+from ingestion.loader import fetch_key_set, load_json
 
 ORACC_BASE = Path("source-data/sources/ORACC")
 
@@ -89,8 +89,6 @@ ARTIFACT_COLUMNS = [
     "db_source",
 ]
 
-BATCH_SIZE = 500
-
 
 def _clean(val: object) -> str | None:
     """Normalize a catalogue value to a trimmed string or None.
@@ -132,40 +130,36 @@ def _pick(
     return None
 
 
-def _iter_catalogues(base: Path) -> Iterator[Path]:
-    pattern = str(base / "**" / "catalogue.json")
-    for path_str in glob.glob(pattern, recursive=True):
-        yield Path(path_str)
-
-
-def _corpusjson_p_numbers(base: Path) -> set[str]:
-    """Every P-number that has a corpusjson file on disk (parseable by oracc-atf)."""
-    return set(_corpusjson_p_to_project(base))
+def _scan_tree(base: Path) -> tuple[list[Path], dict[str, str]]:
+    """Find every catalogue.json and corpusjson P-number under ``base``.
 
+    One directory walk serves both: separate recursive globs for
+    ``**/catalogue.json`` and ``**/corpusjson/P*.json`` each re-list the whole
+    ORACC tree, including the corpusjson dirs with tens of thousands of files.
 
-def _corpusjson_p_to_project(base: Path) -> dict[str, str]:
-    """Map each on-disk corpusjson P-number to its ORACC project.
-
-    The project is derived from the path: the directory tree between ORACC_BASE
-    and the `corpusjson/` dir (e.g. ".../ORACC/saao/saa19/corpusjson/P*.json"
-    -> "saao/saa19"). Used so corpusjson-only tablets absent from every
-    catalogue.json still get a minimal row carrying their project.
+    The corpusjson map is P-number -> project, where the project is the
+    directory tree between ``base`` and the `corpusjson/` dir (e.g.
+    ".../ORACC/saao/saa19/corpusjson/P*.json" -> "saao/saa19"). Used so
+    corpusjson-only tablets absent from every catalogue.json still get a
+    minimal row carrying their project.
     """
-    out: dict[str, str] = {}
-    base_parts = base.parts
-    pattern = str(base / "**" / "corpusjson" / "P*.json")
-    for path_str in glob.glob(pattern, recursive=True):
-        p = os.path.splitext(os.path.basename(path_str))[0]
-        parts = Path(path_str).parts
-        try:
-            cj = parts.index("corpusjson")
-        except ValueError:
-            out.setdefault(p, "")
+    catalogues: list[Path] = []
+    on_disk: dict[str, str] = {}
+    for root, dirnames, filenames in os.walk(base, followlinks=True):
+        # Match glob's "**", which never descends into hidden directories.
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        if "catalogue.json" in filenames:
+            catalogues.append(Path(root) / "catalogue.json")
+        if os.path.basename(root) != "corpusjson":
             continue
-        project = "/".join(parts[len(base_parts) : cj])
-        # first project wins (a P-number under multiple project dirs is rare)
-        out.setdefault(p, project)
-    return out
+        rel = Path(root).relative_to(base).parts
+        project = "/".join(rel[: rel.index("corpusjson")])
+        for name in filenames:
+            if name.startswith("P") and name.endswith(".json"):
+                # first project wins (a P-number under multiple project dirs
+                # is rare)
+                on_disk.setdefault(name[:-5], project)
+    return catalogues, on_disk
 
 
 class OraccCatalogConnector(SourceConnector):
@@ -190,6 +184,17 @@ class OraccCatalogConnector(SourceConnector):
 
     def __init__(self, base: Path | None = None) -> None:
         self.base = Path(base) if base else ORACC_BASE
+        self._tree: tuple[list[Path], dict[str, str]] | None = None
+
+    def _scan(self) -> tuple[list[Path], dict[str, str]]:
+        """(catalogue paths, corpusjson P-number -> project), walked once.
+
+        extract() needs both; load() needs the corpusjson map again for the
+        parseable guard.
+        """
+        if self._tree is None:
+            self._tree = _scan_tree(self.base)
+        return self._tree
 
     def extract(self, ctx: RunContext) -> Iterator[dict]:
         """Merge every ORACC catalogue.json into one record per P-number.
@@ -198,15 +203,14 @@ class OraccCatalogConnector(SourceConnector):
         entries can be filled by a later project). `projects` accumulates every
         project a P-number appears in, for the oracc_projects array.
         """
-        catalogues = list(_iter_catalogues(self.base))
+        catalogues = self._scan()[0]
         ctx.info("oracc_catalog.scan_start", catalogue_count=len(catalogues))
 
         seen: dict[str, dict] = {}
         for cat_path in catalogues:
             try:
-                with open(cat_path, encoding="utf-8") as f:
-                    data = json.load(f)
-            except (json.JSONDecodeError, ValueError, OSError):
+                data = load_json(cat_path)
+            except (ValueError, OSError):
                 ctx.warn("oracc_catalog.bad_json", path=str(cat_path))
                 continue
 
@@ -238,7 +242,7 @@ class OraccCatalogConnector(SourceConnector):
         # still need a minimal row so oracc-atf can parse them. Emit a
         # p_number-only record (all metadata NULL — nothing is fabricated),
         # carrying only the project derived from the corpusjson path.
-        on_disk = _corpusjson_p_to_project(self.base)
+        on_disk = self._scan()[1]
         catless = 0
         for p, project in on_disk.items():
             if p in seen:
@@ -259,49 +263,37 @@ class OraccCatalogConnector(SourceConnector):
 
     def load(self, ctx: RunContext, rows: Iterable[dict]) -> LoadStats:
         # Tablets already cataloged (CDLI or otherwise) — never touched.
-        known_p: set[str] = {
-            (r["p_number"] if isinstance(r, dict) else r[0])
-            for r in ctx.db.execute("SELECT p_number FROM artifacts").fetchall()
-        }
+        known_p: set[str] = fetch_key_set(ctx.db, "SELECT p_number FROM artifacts")
         ctx.info("oracc_catalog.known_artifacts", count=len(known_p))
 
         # Only catalog tablets that oracc-atf can actually parse (corpusjson on
         # disk). A catalogue member without corpusjson would create an artifact
         # row that never gets text_lines — pointless and misleading.
-        on_disk = _corpusjson_p_numbers(self.base)
+        on_disk = self._scan()[1]
         ctx.info("oracc_catalog.corpusjson_on_disk", count=len(on_disk))
 
-        stats = LoadStats()
-        batch: list[tuple] = []
-
-        def _flush(cur) -> None:
-            if not batch:
-                return
-            placeholders = ", ".join(["%s"] * len(ARTIFACT_COLUMNS))
-            cur.executemany(
-                f"INSERT INTO artifacts ({', '.join(ARTIFACT_COLUMNS)}) "
-                f"VALUES ({placeholders}) "
-                f"ON CONFLICT (p_number) DO NOTHING",
-                batch,
-            )
-            batch.clear()
-
+        # Filter and build the stage rows before the COPY opens: the first
+        # next() on `rows` runs extract(), whose ctx.info/ctx.warn write to
+        # ctx.db, and a connection inside cur.copy() cannot run anything else.
+        # Then insert them with one COPY, one statement and one commit, instead
+        # of per-batch executemany round trips.
+        col_list = ", ".join(ARTIFACT_COLUMNS)
         considered = 0
         skipped_existing = 0
         skipped_no_corpusjson = 0
-
-        with ctx.db.cursor() as cur:
-            for rec in rows:
-                considered += 1
-                p = rec["p_number"]
-                if p in known_p:
-                    skipped_existing += 1
-                    continue
-                if p not in on_disk:
-                    skipped_no_corpusjson += 1
-                    continue
-                projects = sorted(rec.get("projects") or [])
-                values = (
+        staged: list[tuple] = []
+        for rec in rows:
+            considered += 1
+            p = rec["p_number"]
+            if p in known_p:
+                skipped_existing += 1
+                continue
+            if p not in on_disk:
+                skipped_no_corpusjson += 1
+                continue
+            projects = sorted(rec.get("projects") or [])
+            staged.append(
+                (
                     p,
                     rec.get("designation"),
                     rec.get("period"),
@@ -319,17 +311,26 @@ class OraccCatalogConnector(SourceConnector):
                     json.dumps(projects) if projects else None,
                     "oracc",
                 )
-                batch.append(values)
-                if len(batch) >= BATCH_SIZE:
-                    _flush(cur)
-                    ctx.db.commit()
+            )
 
-            _flush(cur)
-            ctx.db.commit()
+        with ctx.db.cursor() as cur:
+            cur.execute(
+                "CREATE TEMP TABLE oracc_artifact_stage ON COMMIT DROP AS "
+                f"SELECT {col_list} FROM artifacts WITH NO DATA"
+            )
+            with cur.copy(f"COPY oracc_artifact_stage ({col_list}) FROM STDIN") as cp:
+                for row in staged:
+                    cp.write_row(row)
+            # ON CONFLICT still guards against a concurrent insert of a
+            # P-number that was not in known_p.
+            cur.execute(
+                f"INSERT INTO artifacts ({col_list}) "
+                f"SELECT {col_list} FROM oracc_artifact_stage "
+                "ON CONFLICT (p_number) DO NOTHING"
+            )
+            inserted = max(cur.rowcount, 0)
+        ctx.db.commit()
 
-        # inserted = rows that did not already exist (we filtered known_p, but
-        # ON CONFLICT also guards against a concurrent insert); count via a
-        # fresh query for an honest number.
         after = ctx.db.execute(
             "SELECT COUNT(*) AS n FROM artifacts WHERE db_source = 'oracc'"
         ).fetchone()
@@ -338,13 +339,15 @@ class OraccCatalogConnector(SourceConnector):
         ctx.info(
             "oracc_catalog.done",
             considered=considered,
+            inserted=inserted,
             skipped_existing=skipped_existing,
             skipped_no_corpusjson=skipped_no_corpusjson,
             artifacts_with_oracc_source=oracc_rows,
         )
-        stats.inserted = oracc_rows
-        stats.skipped = skipped_existing + skipped_no_corpusjson
-        return stats
+        return LoadStats(
+            inserted=inserted,
+            skipped=skipped_existing + skipped_no_corpusjson,
+        )
 
     def verify(self, ctx: RunContext) -> None:
         row = ctx.db.execute(
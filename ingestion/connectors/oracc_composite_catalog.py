@@ -20,11 +20,11 @@ Runs after: atf-parser (so composite rows already exist for ATF-seen Q-numbers)
 from __future__ import annotations
 
 import glob
-import json
 from pathlib import Path
 from typing import Iterable, Iterator
 
 from ingestion.base import LoadStats, RunContext, SourceConnector
+from ingestion.loader import iter_json_members
 
 ORACC_BASE = Path("source-data/sources/ORACC")
 
@@ -71,21 +71,24 @@ class OraccCompositeCatalogConnector(SourceConnector):
         ctx.info("oracc_composite_catalog.scan_start", catalogue_count=len(catalogues))
 
         for cat_path in catalogues:
+            # Collect the file's Q entries before merging any of them, so a
+            # catalogue that fails part-way through is skipped whole.
             try:
-                with open(cat_path, encoding="utf-8") as f:
-                    data = json.load(f)
-            except (json.JSONDecodeError, ValueError, OSError):
+                entries = [
+                    (key, entry)
+                    for key, entry in iter_json_members(cat_path)
+                    if key.startswith("Q")
+                ]
+            except (ValueError, OSError):
                 ctx.warn("oracc_composite_catalog.bad_json", path=str(cat_path))
                 continue
 
-            members = data.get("members", {})
-
-            for key, entry in members.items():
-                if not key.startswith("Q"):
-                    continue
-
-                if key not in seen:
-                    seen[key] = {
+            for key, entry in entries:
+                # One lookup on the hot path; only a new Q-number pays for
+                # the insert.
+                rec = seen.get(key)
+                if rec is None:
+                    rec = seen[key] = {
                         "q_number": key,
                         "designation": None,
                         "language": None,
@@ -93,7 +96,6 @@ class OraccCompositeCatalogConnector(SourceConnector):
                         "genre": None,
                     }
 
-                rec = seen[key]
                 # Fill gaps: first non-null value per field wins
                 if rec["designation"] is None:
                     rec["designation"] = _clean(entry.get("designation"))
@@ -143,11 +145,12 @@ class OraccCompositeCatalogConnector(SourceConnector):
                         row["genre"],
                     )
                 )
+                stats.inserted += 1
                 if len(batch) >= 500:
                     _flush(cur)
-                    ctx.db.commit()
-                    stats.inserted += 500
 
+            # One commit for the whole merge (a few thousand composites)
+            # rather than one per executemany batch.
             _flush(cur)
             ctx.db.commit()
 
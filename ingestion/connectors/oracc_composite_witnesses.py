@@ -56,12 +56,14 @@ only fill genuine gaps).
 from __future__ import annotations
 
 import glob
-import json
 import re
 from pathlib import Path
 from typing import Iterable, Iterator
 
+from psycopg.rows import tuple_row
+
 from ingestion.base import LoadStats, RunContext, SourceConnector
+from ingestion.loader import iter_json_members
 
 ORACC_BASE = Path("source-data/sources/ORACC")
 
@@ -69,8 +71,6 @@ ORACC_BASE = Path("source-data/sources/ORACC")
 # digits; we match P + 5-or-more digits to be tolerant and normalise below.
 _PNUM = re.compile(r"\bP\d{5,}\b")
 
-BATCH_SIZE = 1000
-
 
 def _iter_catalogues(base: Path) -> Iterator[Path]:
     pattern = str(base / "**" / "catalogue.json")
@@ -129,30 +129,36 @@ class OraccCompositeWitnessesConnector(SourceConnector):
         q_without_mapping: set[str] = set()
 
         for cat_path in catalogues:
+            # Per-file sets, merged only once the whole file has parsed: a
+            # catalogue that breaks part-way contributes nothing.
+            file_pairs: set[tuple[str, str]] = set()
+            file_mapped: set[str] = set()
+            file_unmapped: set[str] = set()
             try:
-                with open(cat_path, encoding="utf-8") as f:
-                    data = json.load(f)
-            except (json.JSONDecodeError, ValueError, OSError):
+                for key, entry in iter_json_members(cat_path):
+                    if not key.startswith("Q") or not isinstance(entry, dict):
+                        continue
+                    raw = entry.get("cdli_id_numbers")
+                    if not raw:
+                        file_unmapped.add(key)
+                        continue
+                    # Parse ONLY the cdli_id_numbers value. cdli_composite_id (the
+                    # composite's own artifact P-number) lives in a different key
+                    # and is never read here, so it cannot be mistaken for a
+                    # witness.
+                    ps = _PNUM.findall(str(raw))
+                    if not ps:
+                        file_unmapped.add(key)
+                        continue
+                    file_mapped.add(key)
+                    for p in ps:
+                        file_pairs.add((_norm_p(p), key))
+            except (ValueError, OSError):
                 ctx.warn("oracc_composite_witnesses.bad_json", path=str(cat_path))
                 continue
-
-            for key, entry in data.get("members", {}).items():
-                if not key.startswith("Q") or not isinstance(entry, dict):
-                    continue
-                raw = entry.get("cdli_id_numbers")
-                if not raw:
-                    q_without_mapping.add(key)
-                    continue
-                # Parse ONLY the cdli_id_numbers value. cdli_composite_id (the
-                # composite's own artifact P-number) lives in a different key and
-                # is never read here, so it cannot be mistaken for a witness.
-                ps = _PNUM.findall(str(raw))
-                if not ps:
-                    q_without_mapping.add(key)
-                    continue
-                q_with_mapping.add(key)
-                for p in ps:
-                    pairs.add((_norm_p(p), key))
+            pairs |= file_pairs
+            q_with_mapping |= file_mapped
+            q_without_mapping |= file_unmapped
 
         # A Q that has a mapping in one project but not another is still mapped.
         q_without_mapping -= q_with_mapping
@@ -168,62 +174,54 @@ class OraccCompositeWitnessesConnector(SourceConnector):
             yield {"p_number": p, "q_number": q}
 
     def load(self, ctx: RunContext, rows: Iterable[dict]) -> LoadStats:
-        # Guard sets: a link's FKs require the Q in composites and the P in
-        # artifacts. Load both once so we can route un-resolvable pairs to a skip
-        # count instead of letting the INSERT raise.
-        known_q: set[str] = {
-            (r[0] if isinstance(r, tuple) else r["q_number"])
-            for r in ctx.db.execute("SELECT q_number FROM composites").fetchall()
-        }
-        known_p: set[str] = {
-            (r[0] if isinstance(r, tuple) else r["p_number"])
-            for r in ctx.db.execute("SELECT p_number FROM artifacts").fetchall()
-        }
-        ctx.info(
-            "oracc_composite_witnesses.guards",
-            composites=len(known_q),
-            artifacts=len(known_p),
-        )
-
         stats = LoadStats()
-        touched_q: set[str] = set()
-        considered = 0
-        skipped_no_composite = 0
-        skipped_no_artifact = 0
-        batch: list[tuple[str, str]] = []
-
-        def _flush(cur) -> None:
-            if not batch:
-                return
-            cur.executemany(
-                "INSERT INTO artifact_composites (p_number, q_number) "
-                "VALUES (%s, %s) ON CONFLICT (p_number, q_number) DO NOTHING",
-                batch,
+        # Drain extract() before the COPY: it logs through ctx.db, which is
+        # locked for the duration of cur.copy().
+        pairs = [(row["p_number"], row["q_number"]) for row in rows]
+        considered = len(pairs)
+
+        with ctx.db.cursor(row_factory=tuple_row) as cur:
+            # COPY the pairs into a stage and resolve them against composites
+            # and artifacts in SQL, instead of pulling every artifact P-number
+            # into a Python guard set and inserting in executemany batches.
+            cur.execute(
+                "CREATE TEMP TABLE composite_witness_stage "
+                "(p_number text, q_number text) ON COMMIT DROP"
+            )
+            with cur.copy(
+                "COPY composite_witness_stage (p_number, q_number) FROM STDIN"
+            ) as cp:
+                for pair in pairs:
+                    cp.write_row(pair)
+
+            # A link's FKs require the Q in composites and the P in artifacts.
+            # Pairs failing either guard are counted as skips, not forced in:
+            # a witness list can reference a composite we don't hold, or a
+            # tablet not in our catalog (no corpusjson / not in CDLI).
+            cur.execute(
+                """
+                SELECT
+                    count(*) FILTER (WHERE c.q_number IS NULL),
+                    count(*) FILTER (WHERE c.q_number IS NOT NULL
+                                       AND a.p_number IS NULL),
+                    count(DISTINCT s.q_number) FILTER (WHERE c.q_number IS NOT NULL
+                                                         AND a.p_number IS NOT NULL)
+                FROM composite_witness_stage s
+                LEFT JOIN composites c ON c.q_number = s.q_number
+                LEFT JOIN artifacts a ON a.p_number = s.p_number
+                """
+            )
+            skipped_no_composite, skipped_no_artifact, touched = cur.fetchone()
+            cur.execute(
+                """
+                INSERT INTO artifact_composites (p_number, q_number)
+                SELECT s.p_number, s.q_number
+                FROM composite_witness_stage s
+                JOIN composites c ON c.q_number = s.q_number
+                JOIN artifacts a ON a.p_number = s.p_number
+                ON CONFLICT (p_number, q_number) DO NOTHING
+                """
             )
-            batch.clear()
-
-        with ctx.db.cursor() as cur:
-            for row in rows:
-                considered += 1
-                p = row["p_number"]
-                q = row["q_number"]
-                if q not in known_q:
-                    # Witness list references a composite we don't hold — skip,
-                    # don't fabricate the composite.
-                    skipped_no_composite += 1
-                    continue
-                if p not in known_p:
-                    # Witness tablet not in our catalog (no corpusjson / not in
-                    # CDLI) — would violate the FK and could never show ATF. Skip.
-                    skipped_no_artifact += 1
-                    continue
-                batch.append((p, q))
-                touched_q.add(q)
-                if len(batch) >= BATCH_SIZE:
-                    _flush(cur)
-                    ctx.db.commit()
-
-            _flush(cur)
             ctx.db.commit()
 
             # Recompute exemplar_count from the authoritative link rows for ALL
@@ -265,7 +263,7 @@ class OraccCompositeWitnessesConnector(SourceConnector):
             linkable_pairs=considered - stats.skipped,
             skipped_no_composite=skipped_no_composite,
             skipped_no_artifact=skipped_no_artifact,
-            touched_composites=len(touched_q),
+            touched_composites=touched,
             exemplar_counts_updated=updated_counts,
         )
         stats.inserted = considered - stats.skipped
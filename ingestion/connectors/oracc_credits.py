@@ -10,12 +10,17 @@ Depends on: cdli-catalog (artifacts must be loaded)
 from __future__ import annotations
 
 import json
+import os
+from multiprocessing import Pool
 from pathlib import Path
 from typing import Iterable, Iterator
 
 from collections import Counter
 
+from psycopg.rows import tuple_row
+
 from core.credits_parser import (
+    CreditMatch,
     GivenToken,
     normalize_name,
     parse_credits,
@@ -23,7 +28,7 @@ from core.credits_parser import (
     resolve_prose_fullname,
 )
 from ingestion.base import ConflictPolicy, LoadStats, RunContext, SourceConnector
-from ingestion.loader import upsert_batch
+from ingestion.loader import fetch_key_set, iter_json_members, upsert_batch
 
 ORACC_BASE = Path("source-data/sources/ORACC")
 
@@ -169,6 +174,25 @@ ORACC_PROJECTS = [
 ]
 
 
+# Below this many distinct credit strings, parsing in-process beats paying the
+# Pool start-up cost. Full ORACC runs are well above it.
+PARALLEL_PARSE_MIN_TEXTS = 2000
+PARSE_CHUNKSIZE = 256
+
+
+def _parse_texts(texts: list[str], workers: int) -> dict[str, list[CreditMatch]]:
+    """credits_text -> parse_credits(credits_text), fanned out over a Pool.
+
+    ``parse_credits`` is pure and DB-free, so the regex work parallelises
+    cleanly; the caller keeps all DB I/O in the main process.
+    """
+    if workers <= 1 or len(texts) < PARALLEL_PARSE_MIN_TEXTS:
+        return {t: parse_credits(t) for t in texts}
+    with Pool(workers) as pool:
+        parsed = pool.imap(parse_credits, texts, chunksize=PARSE_CHUNKSIZE)
+        return dict(zip(texts, parsed))
+
+
 def _project_base(project: str) -> Path:
     parts = project.split("/")
     return ORACC_BASE.joinpath(*parts)
@@ -194,22 +218,16 @@ class OraccCreditsConnector(SourceConnector):
     upstream_url = "https://oracc.museum.upenn.edu/"
 
     def extract(self, ctx: RunContext) -> Iterator[dict]:
-        # Load Q→P and valid-P maps once
-        q_to_p: dict[str, list[str]] = {}
-        for row in ctx.db.execute(
-            "SELECT q_number, p_number FROM artifact_composites"
-        ).fetchall():
-            q, p = (
-                (row["q_number"], row["p_number"])
-                if isinstance(row, dict)
-                else (row[0], row[1])
+        # Load Q→P and valid-P maps once; Postgres groups the witnesses so we
+        # get one row per composite instead of one per link.
+        with ctx.db.cursor(row_factory=tuple_row) as cur:
+            cur.execute(
+                "SELECT q_number, array_agg(p_number) "
+                "FROM artifact_composites GROUP BY q_number"
             )
-            q_to_p.setdefault(q, []).append(p)
+            q_to_p: dict[str, list[str]] = {q: ps for q, ps in cur}
 
-        valid_p = {
-            (row["p_number"] if isinstance(row, dict) else row[0])
-            for row in ctx.db.execute("SELECT p_number FROM artifacts").fetchall()
-        }
+        valid_p = fetch_key_set(ctx.db, "SELECT p_number FROM artifacts")
         ctx.info(
             "oracc_credits.loaded_maps", q_numbers=len(q_to_p), p_numbers=len(valid_p)
         )
@@ -218,30 +236,31 @@ class OraccCreditsConnector(SourceConnector):
             cat_path = _find_catalogue(project)
             if not cat_path:
                 continue
+            rows: list[dict] = []
             try:
-                with open(cat_path, encoding="utf-8") as f:
-                    catalogue = json.load(f)
+                for text_id, entry in iter_json_members(cat_path):
+                    credits = entry.get("credits", "").strip()
+                    if not credits:
+                        continue
+                    p_numbers: list[str] = []
+                    if text_id.startswith("P"):
+                        p_numbers = [text_id]
+                    elif text_id.startswith("Q"):
+                        p_numbers = q_to_p.get(text_id, [])
+                    for p_number in p_numbers:
+                        if p_number not in valid_p:
+                            continue
+                        rows.append(
+                            {
+                                "p_number": p_number,
+                                "oracc_project": project,
+                                "credits_text": credits,
+                            }
+                        )
             except (json.JSONDecodeError, ValueError):
                 ctx.warn("oracc_credits.bad_json", project=project)
                 continue
-
-            for text_id, entry in catalogue.get("members", {}).items():
-                credits = entry.get("credits", "").strip()
-                if not credits:
-                    continue
-                p_numbers: list[str] = []
-                if text_id.startswith("P"):
-                    p_numbers = [text_id]
-                elif text_id.startswith("Q"):
-                    p_numbers = q_to_p.get(text_id, [])
-                for p_number in p_numbers:
-                    if p_number not in valid_p:
-                        continue
-                    yield {
-                        "p_number": p_number,
-                        "oracc_project": project,
-                        "credits_text": credits,
-                    }
+            yield from rows
 
     def load(self, ctx: RunContext, rows: Iterable[dict]) -> LoadStats:
         stats = upsert_batch(
@@ -317,48 +336,84 @@ class OraccCreditsConnector(SourceConnector):
         """
         index = self._scholar_index(ctx)
         full_index = self._scholar_full_index(ctx)
-        credits = ctx.db.execute(
-            "SELECT id, p_number, oracc_project, credits_text FROM artifact_credits"
-        ).fetchall()
+        # Every credit row is held for the whole pass; plain tuples instead of
+        # the connection's dict rows keep that list compact and let the loop
+        # below unpack positionally.
+        with ctx.db.cursor(row_factory=tuple_row) as cur:
+            credits = cur.execute(
+                "SELECT id, p_number, oracc_project, credits_text FROM artifact_credits"
+            ).fetchall()
 
-        def _g(r: object, key: str, idx: int) -> object:
-            return r[key] if isinstance(r, dict) else r[idx]  # type: ignore[index]
+        # Parse each distinct credit string once, across worker processes.
+        workers = int(ctx.config.get("parse_workers") or os.cpu_count() or 1)
+        texts = list(dict.fromkeys(c[3] for c in credits))
+        parsed = _parse_texts(texts, workers)
+        ctx.info("oracc_credits.parsed", texts=len(texts), workers=workers)
+
+        # The same few hundred names recur across tens of thousands of credits;
+        # resolve each distinct name once. name -> (scholar id, via prose pass)
+        resolved: dict[str, tuple[int | None, bool]] = {}
+
+        def _resolve(name: str) -> tuple[int | None, bool]:
+            hit = resolved.get(name)
+            if hit is None:
+                nn = normalize_name(name)
+                sid = index.get(nn) if nn else None
+                if sid is not None:
+                    hit = (sid, False)
+                else:
+                    # Pass 2: prose full-name disambiguation (globally unique).
+                    hit = (resolve_prose_fullname(name, full_index), True)
+                resolved[name] = hit
+            return hit
 
         matched = 0
         matched_prose = 0
         unmatched = 0
-        for c in credits:
-            text = str(_g(c, "credits_text", 3))
-            for m in parse_credits(text):
-                nn = normalize_name(m.name)
-                sid = index.get(nn) if nn else None
+        # First link per (p_number, scholar, role, project) wins, matching the
+        # row-at-a-time ON CONFLICT DO NOTHING order; it also keeps the stage
+        # free of rows the insert would only discard.
+        links: dict[tuple, tuple] = {}
+        for credit_id, p_number, project, text in credits:
+            for m in parsed[text]:
+                sid, via_prose = _resolve(m.name)
                 if sid is None:
-                    # Pass 2: prose full-name disambiguation (globally unique).
-                    sid = resolve_prose_fullname(m.name, full_index)
-                    if sid is None:
-                        unmatched += 1
-                        continue
+                    unmatched += 1
+                    continue
+                if via_prose:
                     matched_prose += 1
                 else:
                     matched += 1
-                ctx.db.execute(
-                    """
-                    INSERT INTO artifact_contributors
-                        (p_number, scholar_id, role, oracc_project,
-                         source_credit_id, matched_name)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (p_number, scholar_id, role, oracc_project)
-                    DO NOTHING
-                    """,
-                    (
-                        _g(c, "p_number", 1),
-                        sid,
-                        m.role,
-                        _g(c, "oracc_project", 2),
-                        _g(c, "id", 0),
-                        m.name,
-                    ),
-                )
+                key = (p_number, sid, m.role, project)
+                if key not in links:
+                    links[key] = (*key, credit_id, m.name)
+        # The links need no RETURNING, so COPY them into a stage and insert
+        # with one statement instead of a round-trip per link.
+        with ctx.db.cursor() as cur:
+            cur.execute(
+                "CREATE TEMP TABLE artifact_contributor_stage ("
+                "  p_number text, scholar_id integer, role text,"
+                "  oracc_project text, source_credit_id integer, matched_name text"
+                ") ON COMMIT DROP"
+            )
+            with cur.copy(
+                "COPY artifact_contributor_stage (p_number, scholar_id, role, "
+                "oracc_project, source_credit_id, matched_name) FROM STDIN"
+            ) as cp:
+                for link in links.values():
+                    cp.write_row(link)
+            cur.execute(
+                """
+                INSERT INTO artifact_contributors
+                    (p_number, scholar_id, role, oracc_project,
+                     source_credit_id, matched_name)
+                SELECT p_number, scholar_id, role, oracc_project,
+                       source_credit_id, matched_name
+                FROM artifact_contributor_stage
+                ON CONFLICT (p_number, scholar_id, role, oracc_project)
+                DO NOTHING
+                """
+            )
         ctx.db.commit()
         ctx.info(
             "oracc_credits.attributed",
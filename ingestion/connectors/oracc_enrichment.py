@@ -13,9 +13,13 @@ from pathlib import Path
 from typing import Iterable, Iterator
 
 from ingestion.base import LoadStats, RunContext, SourceConnector
+from ingestion.loader import load_json
 
 ORACC_BASE = Path("source-data/sources/ORACC")
 
+# Shared fallback for members without geo data; read-only.
+_NO_GEO: dict = {}
+
 ORACC_PROJECTS = [
     # --- previously integrated ---
     "dcclt",
@@ -166,8 +170,7 @@ def _load_geojson(project: str) -> dict[str, dict]:
     if not path.exists():
         return {}
     try:
-        with open(path, encoding="utf-8") as f:
-            geo = json.load(f)
+        geo = load_json(path)
     except (json.JSONDecodeError, ValueError):
         return {}
     result = {}
@@ -207,9 +210,8 @@ class OraccEnrichmentConnector(SourceConnector):
             if not cat_path.exists():
                 continue
             try:
-                with open(cat_path, encoding="utf-8") as f:
-                    catalogue = json.load(f)
-            except (json.JSONDecodeError, ValueError):
+                catalogue = load_json(cat_path)
+            except ValueError:
                 ctx.warn("oracc_enrichment.bad_json", project=project)
                 continue
             geo_data = _load_geojson(project)
@@ -231,7 +233,7 @@ class OraccEnrichmentConnector(SourceConnector):
             updates = []
             for p_num, entry in members.items():
                 oracc_project_map.setdefault(p_num, set()).add(project)
-                geo = geo_data.get(p_num, {})
+                geo = geo_data.get(p_num) or _NO_GEO
                 updates.append(
                     (
                         entry.get("supergenre"),
@@ -244,16 +246,30 @@ class OraccEnrichmentConnector(SourceConnector):
                 )
 
             if updates:
+                # Stage the project's members with COPY and apply them in one
+                # UPDATE ... FROM join, instead of one UPDATE per member.
                 with ctx.db.cursor() as cur:
-                    cur.executemany(
-                        """UPDATE artifacts SET
-                            supergenre  = COALESCE(supergenre, %s),
-                            subgenre    = COALESCE(subgenre, %s),
-                            pleiades_id = COALESCE(pleiades_id, %s),
-                            latitude    = COALESCE(latitude, %s),
-                            longitude   = COALESCE(longitude, %s)
-                           WHERE p_number = %s""",
-                        updates,
+                    cur.execute(
+                        "CREATE TEMP TABLE oracc_enrichment_stage ("
+                        "supergenre text, subgenre text, pleiades_id text, "
+                        "latitude real, longitude real, p_number text"
+                        ") ON COMMIT DROP"
+                    )
+                    with cur.copy(
+                        "COPY oracc_enrichment_stage (supergenre, subgenre, "
+                        "pleiades_id, latitude, longitude, p_number) FROM STDIN"
+                    ) as cp:
+                        for row in updates:
+                            cp.write_row(row)
+                    cur.execute(
+                        """UPDATE artifacts a SET
+                            supergenre  = COALESCE(a.supergenre, s.supergenre),
+                            subgenre    = COALESCE(a.subgenre, s.subgenre),
+                            pleiades_id = COALESCE(a.pleiades_id, s.pleiades_id),
+                            latitude    = COALESCE(a.latitude, s.latitude),
+                            longitude   = COALESCE(a.longitude, s.longitude)
+                           FROM oracc_enrichment_stage s
+                           WHERE a.p_number = s.p_number"""
                     )
                 ctx.db.commit()
                 stats.updated += len(updates)
@@ -263,14 +279,19 @@ class OraccEnrichmentConnector(SourceConnector):
 
         # Update oracc_projects JSON array
         if oracc_project_map:
-            project_updates = [
-                (json.dumps(sorted(projects)), p_num)
-                for p_num, projects in oracc_project_map.items()
-            ]
             with ctx.db.cursor() as cur:
-                cur.executemany(
-                    "UPDATE artifacts SET oracc_projects = %s WHERE p_number = %s",
-                    project_updates,
+                cur.execute(
+                    "CREATE TEMP TABLE oracc_projects_stage "
+                    "(p_number text, oracc_projects text) ON COMMIT DROP"
+                )
+                with cur.copy(
+                    "COPY oracc_projects_stage (p_number, oracc_projects) FROM STDIN"
+                ) as cp:
+                    for p_num, projects in oracc_project_map.items():
+                        cp.write_row((p_num, json.dumps(sorted(projects))))
+                cur.execute(
+                    "UPDATE artifacts a SET oracc_projects = s.oracc_projects "
+                    "FROM oracc_projects_stage s WHERE a.p_number = s.p_number"
                 )
             ctx.db.commit()
 
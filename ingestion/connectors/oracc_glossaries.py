@@ -13,9 +13,13 @@ from pathlib import Path
 from typing import Iterable, Iterator
 
 from ingestion.base import ConflictPolicy, LoadStats, RunContext, SourceConnector
+from ingestion.loader import fetch_key_map, load_json, upsert_batch
 
 ORACC_BASE = Path("source-data/sources/ORACC")
 
+# Entries buffered before load() writes them (and then their forms).
+ENTRY_FLUSH_EVERY = 5000
+
 ORACC_PROJECTS = [
     # --- previously integrated ---
     "dcclt",
@@ -179,21 +183,17 @@ class OraccGlossariesConnector(SourceConnector):
 
     def extract(self, ctx: RunContext) -> Iterator[dict]:
         # Load annotation_run IDs — source_name is always "oracc/{project}"
-        ann_run_ids: dict[str, int] = {}
-        for project in ORACC_PROJECTS:
-            row = ctx.db.execute(
-                "SELECT id FROM annotation_runs WHERE source_name = %s",
-                (f"oracc/{project}",),
-            ).fetchone()
-            if row:
-                ann_run_ids[project] = row["id"] if isinstance(row, dict) else row[0]
+        ann_run_ids = fetch_key_map(
+            ctx.db,
+            "SELECT source_name, id FROM annotation_runs WHERE source_name = ANY(%s)",
+            ([f"oracc/{p}" for p in ORACC_PROJECTS],),
+        )
 
         for project in ORACC_PROJECTS:
-            ann_run_id = ann_run_ids.get(project, 1)
+            ann_run_id = ann_run_ids.get(f"oracc/{project}", 1)
             for gfile in _find_glossary_files(project):
                 try:
-                    with open(gfile, encoding="utf-8") as f:
-                        data = json.load(f)
+                    data = load_json(gfile)
                 except (json.JSONDecodeError, ValueError):
                     continue
                 lang = data.get("lang", "und")
@@ -204,7 +204,7 @@ class OraccGlossariesConnector(SourceConnector):
                     global_id = f"{project}/{entry_id}"
                     cf = entry.get("cf", "")
                     headword = entry.get("headword", "")
-                    normalized = cf.lower().strip() if cf else headword.lower().strip()
+                    normalized = (cf or headword).lower().strip()
                     norms = entry.get("norms")
                     periods = entry.get("periods")
                     yield {
@@ -243,38 +243,48 @@ class OraccGlossariesConnector(SourceConnector):
                         }
 
     def load(self, ctx: RunContext, rows: Iterable[dict]) -> LoadStats:
+        # Stream the glossaries through in bounded batches rather than holding
+        # every project's entries and forms in memory at once. extract() yields
+        # each entry before its forms, so writing entries before forms at every
+        # flush keeps glossary_forms' FK to glossary_entries satisfied.
         entries: list[dict] = []
         forms: list[dict] = []
+        total = LoadStats()
+
+        def flush() -> None:
+            nonlocal total
+            if entries:
+                total = total.merge(
+                    upsert_batch(
+                        ctx.db,
+                        table="glossary_entries",
+                        rows=entries,
+                        unique_key=["entry_id"],
+                        policy=ConflictPolicy.SKIP,
+                    )
+                )
+                entries.clear()
+            if forms:
+                total = total.merge(
+                    upsert_batch(
+                        ctx.db,
+                        table="glossary_forms",
+                        rows=forms,
+                        unique_key=["entry_id", "form"],
+                        policy=ConflictPolicy.SKIP,
+                    )
+                )
+                forms.clear()
+
         for row in rows:
             target = row.pop("_target")
             if target == "glossary_entries":
+                if len(entries) >= ENTRY_FLUSH_EVERY:
+                    flush()
                 entries.append(row)
             else:
                 forms.append(row)
-
-        total = LoadStats()
-        if entries:
-            from ingestion.loader import upsert_batch
-
-            stats = upsert_batch(
-                ctx.db,
-                table="glossary_entries",
-                rows=entries,
-                unique_key=["entry_id"],
-                policy=ConflictPolicy.SKIP,
-            )
-            total = total.merge(stats)
-        if forms:
-            from ingestion.loader import upsert_batch
-
-            stats = upsert_batch(
-                ctx.db,
-                table="glossary_forms",
-                rows=forms,
-                unique_key=["entry_id", "form"],
-                policy=ConflictPolicy.SKIP,
-            )
-            total = total.merge(stats)
+        flush()
         return total
 
     def verify(self, ctx: RunContext) -> None:
@@ -8,19 +8,38 @@ Depends on: atf-parser (text_lines + tokens must exist)
 
 from __future__ import annotations
 
+import concurrent.futures
 import json
 import os
 import re
 from pathlib import Path
 from typing import Iterable, Iterator
 
+from core.database import connect_one_shot
 from ingestion.base import LoadStats, RunContext, SourceConnector
-from ingestion.dead_letters import DeadLetterCategory
+from ingestion.dead_letters import DeadLetterCategory, DeadLetterSink
+from ingestion.loader import copy_insert, fetch_key_map, load_json
 
 ORACC_BASE = Path("source-data/sources/ORACC")
 
 DEAD_LETTER_FLUSH_EVERY = 5000
 
+LEMMATIZATION_COLUMNS = [
+    "token_id",
+    "citation_form",
+    "guide_word",
+    "sense",
+    "pos",
+    "epos",
+    "norm",
+    "base",
+    "signature",
+    "morph_raw",
+    "annotation_run_id",
+    "confidence",
+    "language",
+]
+
 ORACC_PROJECTS = [
     # --- previously integrated ---
     "dcclt",
@@ -158,19 +177,24 @@ def _project_base(project: str) -> Path:
     return ORACC_BASE.joinpath(*parts)
 
 
+_RE_INST_LANG = re.compile(r"^%(\w+(?:-\w+)*):")
+_RE_INST_FORM = re.compile(r"^([^=]+)=")
+_RE_INST_SENSE = re.compile(r"^\[([^/]+)//([^\]]+)\](\w+)")
+
+
 def _parse_inst(inst: str) -> dict:
     result: dict[str, str] = {}
     if not inst:
         return result
-    m = re.match(r"^%(\w+(?:-\w+)*):", inst)
+    m = _RE_INST_LANG.match(inst)
     if m:
         result["lang"] = m.group(1)
         inst = inst[m.end() :]
-    m = re.match(r"^([^=]+)=", inst)
+    m = _RE_INST_FORM.match(inst)
     if m:
         result["form"] = m.group(1)
         rest = inst[m.end() :]
-        m2 = re.match(r"^\[([^/]+)//([^\]]+)\](\w+)", rest)
+        m2 = _RE_INST_SENSE.match(rest)
         if m2:
             result["cf"], result["gw"], result["pos"] = (
                 m2.group(1),
@@ -391,6 +415,16 @@ def _stash_line(
         surf_map[surf] = (line_id, source)
 
 
+def _annotation_run_ids(db, projects: list[str]) -> dict[str, int]:
+    """Map each project to its "oracc/{project}" annotation run, in one query."""
+    by_source = fetch_key_map(
+        db,
+        "SELECT source_name, id FROM annotation_runs WHERE source_name = ANY(%s)",
+        ([f"oracc/{p}" for p in projects],),
+    )
+    return {p: by_source[f"oracc/{p}"] for p in projects if f"oracc/{p}" in by_source}
+
+
 def _build_caches(db, project: str) -> tuple[dict, dict]:
     corpus_dirs = _find_corpus_dirs(project)
     if not corpus_dirs:
@@ -453,6 +487,9 @@ class OraccLemmatizationsConnector(SourceConnector):
     runs_after = ["atf-parser", "annotation-runs", "oracc-atf"]
     license = "CC-BY-SA-3.0"
     upstream_url = "https://oracc.museum.upenn.edu/"
+    # Projects loaded concurrently, one connection each (config key "workers").
+    # 1 keeps the whole run on ctx.db.
+    workers = 4
 
     def extract(self, ctx: RunContext) -> Iterator[dict]:
         """Yield one dict per ORACC project (contains corpus_dirs for that project)."""
@@ -468,124 +505,182 @@ class OraccLemmatizationsConnector(SourceConnector):
 
     def load(self, ctx: RunContext, rows: Iterable[dict]) -> LoadStats:
         # Load annotation_run IDs — source_name is always "oracc/{project}"
-        annotation_run_ids: dict[str, int] = {}
-        for proj in ORACC_PROJECTS:
-            row = ctx.db.execute(
-                "SELECT id FROM annotation_runs WHERE source_name = %s",
-                (f"oracc/{proj}",),
-            ).fetchone()
-            if row:
-                annotation_run_ids[proj] = (
-                    row["id"] if isinstance(row, dict) else row[0]
-                )
+        annotation_run_ids = _annotation_run_ids(ctx.db, ORACC_PROJECTS)
 
         total_lemmas = 0
+        workers = max(1, int(ctx.config.get("workers", self.workers)))
+
+        def report(project: str, counts: tuple[int, int, int, int]) -> None:
+            nonlocal total_lemmas
+            lemmas, no_line, no_token, dead_lettered = counts
+            total_lemmas += lemmas
+            # Workers write dead letters through their own sink, so the count
+            # lands on ctx.stats here rather than via ctx.dead_letter_many().
+            ctx.stats.dead_lettered += dead_lettered
+            ctx.info(
+                "oracc_lemmatizations.project_done",
+                project=project,
+                lemmas=lemmas,
+                no_line_match=no_line,
+                no_token_match=no_token,
+            )
 
-        for batch in rows:
-            project = batch["project"]
-            cdl_files = [Path(p) for p in batch["cdl_files"]]
-            ann_run_id = annotation_run_ids.get(project, 1)
-
-            line_cache, token_cache = _build_caches(ctx.db, project)
-            proj_lemmas = 0
-            proj_no_line = 0
-            proj_no_token = 0
-            dl_buffer: list[dict] = []
-
-            def flush_dead_letters() -> None:
-                nonlocal dl_buffer
-                if not dl_buffer:
-                    return
-                ctx.dead_letter_many(dl_buffer)
-                dl_buffer = []
-
-            for i, cdl_file in enumerate(cdl_files):
-                try:
-                    with open(cdl_file, encoding="utf-8") as f:
-                        data = json.load(f)
-                except (json.JSONDecodeError, ValueError):
-                    continue
+        if workers == 1:
+            for batch in rows:
+                project = batch["project"]
+                counts = self._load_project(
+                    ctx,
+                    ctx.db,
+                    project,
+                    [Path(p) for p in batch["cdl_files"]],
+                    annotation_run_ids.get(project, 1),
+                )
+                report(project, counts)
+        else:
+            # Projects touch disjoint p_numbers, so each one can be matched and
+            # written on its own connection. ctx.db stays on this thread: it
+            # carries the run's event log, which workers must not share.
+            ctx.db.commit()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(
+                        self._load_project_isolated,
+                        ctx,
+                        batch["project"],
+                        [Path(p) for p in batch["cdl_files"]],
+                        annotation_run_ids.get(batch["project"], 1),
+                    ): batch["project"]
+                    for batch in rows
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    report(futures[future], future.result())
+
+        # dead_lettered is already on ctx.stats (see report()); the runner
+        # merges this LoadStats into ctx.stats, so we return only `inserted`
+        # here to avoid double-counting.
+        return LoadStats(inserted=total_lemmas)
 
-                p_number = data.get("textid", "")
-                if not p_number:
-                    continue
+    def _load_project_isolated(
+        self,
+        ctx: RunContext,
+        project: str,
+        cdl_files: list[Path],
+        ann_run_id: int,
+    ) -> tuple[int, int, int, int]:
+        """Run _load_project() on a dedicated connection (worker threads)."""
+        db = connect_one_shot()
+        try:
+            return self._load_project(ctx, db, project, cdl_files, ann_run_id)
+        finally:
+            db.close()
+
+    def _load_project(
+        self,
+        ctx: RunContext,
+        db,
+        project: str,
+        cdl_files: list[Path],
+        ann_run_id: int,
+    ) -> tuple[int, int, int, int]:
+        """Match and insert one project's lemmas through `db`.
+
+        Returns (lemmas, no_line_match, no_token_match, dead_lettered). Only
+        ctx.run_id / ctx.connector_id are read from ctx, so this is safe to
+        call from a worker thread with its own connection.
+        """
+        line_cache, token_cache = _build_caches(db, project)
+        sink = DeadLetterSink(db)
+        proj_lemmas = 0
+        proj_no_line = 0
+        proj_no_token = 0
+        dead_lettered = 0
+        dl_buffer: list[dict] = []
+        lemma_buf: list[tuple] = []
+
+        def flush_lemmas() -> None:
+            # COPY through a temp stage and merge with one INSERT ... SELECT
+            # (commits), instead of an INSERT round-trip per lemma against
+            # the indexed lemmatizations table.
+            copy_insert(
+                db,
+                table="lemmatizations",
+                columns=LEMMATIZATION_COLUMNS,
+                rows=lemma_buf,
+            )
+            lemma_buf.clear()
+
+        def flush_dead_letters() -> None:
+            nonlocal dead_lettered
+            if not dl_buffer:
+                return
+            dead_lettered += sink.write_many(
+                run_id=ctx.run_id, connector_id=ctx.connector_id, rows=dl_buffer
+            )
+            dl_buffer.clear()
 
-                lemmas: list[dict] = []
-                _walk_cdl(
-                    data.get("cdl", []), {"line_number": None, "surface": None}, lemmas
-                )
+        for i, cdl_file in enumerate(cdl_files):
+            try:
+                data = load_json(cdl_file)
+            except (json.JSONDecodeError, ValueError):
+                continue
 
-                with ctx.db.cursor() as cur:
-                    for lemma in lemmas:
-                        line_ids = _resolve_line_ids(
-                            line_cache, p_number, lemma["line_number"]
-                        )
-                        line_id = _select_line_id(
-                            line_ids,
-                            lemma.get("surface"),
-                            token_cache,
-                            lemma.get("position"),
-                        )
-                        if not line_id:
-                            proj_no_line += 1
-                            dl_buffer.append(
-                                _lemma_dead_letter(
-                                    project, p_number, lemma, "no_line_match"
-                                )
-                            )
-                            continue
-                        token_id = token_cache.get((line_id, lemma["position"]))
-                        if token_id is None:
-                            proj_no_token += 1
-                            dl_buffer.append(
-                                _lemma_dead_letter(
-                                    project, p_number, lemma, "no_token_match"
-                                )
-                            )
-                            continue
-                        cur.execute(
-                            "INSERT INTO lemmatizations "
-                            "(token_id, citation_form, guide_word, sense, pos, epos, "
-                            "norm, base, signature, morph_raw, annotation_run_id, confidence, language) "
-                            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 1.0, %s) "
-                            "ON CONFLICT DO NOTHING",
-                            (
-                                token_id,
-                                lemma.get("cf"),
-                                lemma.get("gw"),
-                                lemma.get("sense"),
-                                lemma.get("pos"),
-                                lemma.get("epos"),
-                                lemma.get("norm"),
-                                lemma.get("base"),
-                                lemma.get("signature"),
-                                lemma.get("morph_raw"),
-                                ann_run_id,
-                                lemma.get("lang"),
-                            ),
-                        )
-                        proj_lemmas += 1
-
-                if (i + 1) % 200 == 0:
-                    ctx.db.commit()
-                if len(dl_buffer) >= DEAD_LETTER_FLUSH_EVERY:
-                    flush_dead_letters()
+            p_number = data.get("textid", "")
+            if not p_number:
+                continue
 
-            ctx.db.commit()
-            flush_dead_letters()
-            total_lemmas += proj_lemmas
-            ctx.info(
-                "oracc_lemmatizations.project_done",
-                project=project,
-                lemmas=proj_lemmas,
-                no_line_match=proj_no_line,
-                no_token_match=proj_no_token,
+            lemmas: list[dict] = []
+            _walk_cdl(
+                data.get("cdl", []), {"line_number": None, "surface": None}, lemmas
             )
 
-        # dead_lettered count is tracked by ctx.dead_letter_many() on
-        # ctx.stats already; the runner merges this LoadStats into ctx.stats,
-        # so we return only `inserted` here to avoid double-counting.
-        return LoadStats(inserted=total_lemmas)
+            for lemma in lemmas:
+                line_ids = _resolve_line_ids(line_cache, p_number, lemma["line_number"])
+                line_id = _select_line_id(
+                    line_ids,
+                    lemma.get("surface"),
+                    token_cache,
+                    lemma.get("position"),
+                )
+                if not line_id:
+                    proj_no_line += 1
+                    dl_buffer.append(
+                        _lemma_dead_letter(project, p_number, lemma, "no_line_match")
+                    )
+                    continue
+                token_id = token_cache.get((line_id, lemma["position"]))
+                if token_id is None:
+                    proj_no_token += 1
+                    dl_buffer.append(
+                        _lemma_dead_letter(project, p_number, lemma, "no_token_match")
+                    )
+                    continue
+                lemma_buf.append(
+                    (
+                        token_id,
+                        lemma.get("cf"),
+                        lemma.get("gw"),
+                        lemma.get("sense"),
+                        lemma.get("pos"),
+                        lemma.get("epos"),
+                        lemma.get("norm"),
+                        lemma.get("base"),
+                        lemma.get("signature"),
+                        lemma.get("morph_raw"),
+                        ann_run_id,
+                        1.0,
+                        lemma.get("lang"),
+                    )
+                )
+                proj_lemmas += 1
+
+            if (i + 1) % 200 == 0:
+                flush_lemmas()
+            if len(dl_buffer) >= DEAD_LETTER_FLUSH_EVERY:
+                flush_dead_letters()
+
+        flush_lemmas()
+        flush_dead_letters()
+        return proj_lemmas, proj_no_line, proj_no_token, dead_lettered
 
     def verify(self, ctx: RunContext) -> None:
         row = ctx.db.execute("SELECT COUNT(*) AS n FROM lemmatizations").fetchone()
@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Iterable, Iterator
 
 from ingestion.base import LoadStats, RunContext, SourceConnector
+from ingestion.loader import load_json
 
 ORACC_BASE = Path("source-data/sources/ORACC")
 
@@ -235,8 +236,7 @@ class OraccLexicalGlossariesConnector(SourceConnector):
         for project in ORACC_PROJECTS:
             for gfile in _find_glossary_files(project):
                 try:
-                    with open(gfile, encoding="utf-8") as f:
-                        data = json.load(f)
+                    data = load_json(gfile)
                 except (json.JSONDecodeError, ValueError):
                     continue
                 entries = data.get("entries", [])
@@ -323,24 +323,41 @@ class OraccLexicalGlossariesConnector(SourceConnector):
             stats.inserted += len(lemmas)
 
         if senses_pending:
+            # Resolve every distinct (cf, language, source) key in one join
+            # against unnest()ed key arrays rather than a SELECT per key.
+            for sense in senses_pending:
+                sense["_key"] = (
+                    sense.pop("_lemma_cf"),
+                    sense.pop("_language_code"),
+                    sense["source"],
+                )
+            unique_keys = list({sense["_key"] for sense in senses_pending})
             lemma_id_map: dict[tuple, int] = {}
+            for row in ctx.db.execute(
+                "SELECT DISTINCT ON (ll.citation_form, ll.language_code, ll.source) "
+                "ll.citation_form, ll.language_code, ll.source, ll.id "
+                "FROM lexical_lemmas ll "
+                "JOIN unnest(%s::text[], %s::text[], %s::text[]) "
+                "  AS k(citation_form, language_code, source) "
+                "  ON ll.citation_form = k.citation_form "
+                "  AND ll.language_code = k.language_code "
+                "  AND ll.source = k.source "
+                "ORDER BY ll.citation_form, ll.language_code, ll.source, ll.id",
+                (
+                    [k[0] for k in unique_keys],
+                    [k[1] for k in unique_keys],
+                    [k[2] for k in unique_keys],
+                ),
+            ).fetchall():
+                if isinstance(row, dict):
+                    key = (row["citation_form"], row["language_code"], row["source"])
+                    lemma_id_map[key] = row["id"]
+                else:
+                    lemma_id_map[(row[0], row[1], row[2])] = row[3]
             for sense in senses_pending:
-                cf = sense.pop("_lemma_cf")
-                language_code = sense.pop("_language_code")
-                source = sense["source"]
-                key = (cf, language_code, source)
-                if key not in lemma_id_map:
-                    row = ctx.db.execute(
-                        "SELECT id FROM lexical_lemmas WHERE citation_form = %s "
-                        "AND language_code = %s AND source = %s LIMIT 1",
-                        (cf, language_code, source),
-                    ).fetchone()
-                    if row:
-                        lemma_id_map[key] = (
-                            row["id"] if isinstance(row, dict) else row[0]
-                        )
-                if key in lemma_id_map:
-                    sense["lemma_id"] = lemma_id_map[key]
+                lemma_id = lemma_id_map.get(sense.pop("_key"))
+                if lemma_id is not None:
+                    sense["lemma_id"] = lemma_id
 
             senses_to_insert = [s for s in senses_pending if "lemma_id" in s]
             if senses_to_insert:
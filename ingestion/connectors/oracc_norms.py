@@ -17,8 +17,21 @@ from pathlib import Path
 from typing import Iterable, Iterator
 
 from ingestion.base import LoadStats, RunContext, SourceConnector
+from ingestion.loader import copy_insert, load_json
 
 ORACC_BASE = Path("source-data/sources/ORACC")
+# (norm, lemma_id, source) keys resolved to norm ids per lookup query.
+NORM_ID_LOOKUP_BATCH = 10_000
+
+NORM_COLUMNS = [
+    "norm",
+    "lemma_id",
+    "attestation_count",
+    "attestation_pct",
+    "source",
+    "source_id",
+]
+NORM_FORM_COLUMNS = ["norm_id", "written_form", "attestation_count", "source"]
 
 ALL_PROJECTS = [
     # --- previously integrated ---
@@ -205,8 +218,7 @@ class OraccNormsConnector(SourceConnector):
         for project in ALL_PROJECTS:
             for gfile in _find_glossary_files(project):
                 try:
-                    with open(gfile, encoding="utf-8") as f:
-                        data = json.load(f)
+                    data = load_json(gfile)
                 except (json.JSONDecodeError, ValueError):
                     continue
 
@@ -266,55 +278,64 @@ class OraccNormsConnector(SourceConnector):
         stats = LoadStats()
 
         if norms_batch:
-            with ctx.db.cursor() as cur:
-                cur.executemany(
-                    "INSERT INTO lexical_norms "
-                    "(norm, lemma_id, attestation_count, attestation_pct, source, source_id) "
-                    "VALUES (%(norm)s, %(lemma_id)s, %(attestation_count)s, %(attestation_pct)s, "
-                    "%(source)s, %(source_id)s) "
-                    "ON CONFLICT (norm, lemma_id, source) DO NOTHING",
-                    norms_batch,
+            # COPY + one INSERT ... SELECT (commits) rather than a statement
+            # per norm; the stats now report real inserts vs. conflict skips.
+            stats = stats.merge(
+                copy_insert(
+                    ctx.db,
+                    table="lexical_norms",
+                    columns=NORM_COLUMNS,
+                    rows=[tuple(n[c] for c in NORM_COLUMNS) for n in norms_batch],
+                    on_conflict="ON CONFLICT (norm, lemma_id, source) DO NOTHING",
                 )
-            ctx.db.commit()
-            stats.inserted += len(norms_batch)
+            )
 
         if forms_pending:
-            # Build norm_id cache
+            # Build norm_id cache: resolve keys in bulk by joining lexical_norms
+            # to unnest()ed key arrays, instead of one SELECT per key.
             norm_id_cache: dict[tuple, int] = {}
-            unique_keys = {nf["norm_key"] for nf in forms_pending}
-            for norm_text, lemma_id, src in unique_keys:
-                row = ctx.db.execute(
-                    "SELECT id FROM lexical_norms WHERE norm = %s AND lemma_id = %s AND source = %s",
-                    (norm_text, lemma_id, src),
-                ).fetchone()
-                if row:
-                    norm_id_cache[(norm_text, lemma_id, src)] = (
-                        row["id"] if isinstance(row, dict) else row[0]
-                    )
+            unique_keys = list({nf["norm_key"] for nf in forms_pending})
+            for start in range(0, len(unique_keys), NORM_ID_LOOKUP_BATCH):
+                chunk = unique_keys[start : start + NORM_ID_LOOKUP_BATCH]
+                for row in ctx.db.execute(
+                    "SELECT ln.id, ln.norm, ln.lemma_id, ln.source "
+                    "FROM lexical_norms ln "
+                    "JOIN unnest(%s::text[], %s::integer[], %s::text[]) "
+                    "  AS k(norm, lemma_id, source) "
+                    "  ON ln.norm = k.norm AND ln.lemma_id = k.lemma_id "
+                    "  AND ln.source = k.source",
+                    (
+                        [k[0] for k in chunk],
+                        [k[1] for k in chunk],
+                        [k[2] for k in chunk],
+                    ),
+                ).fetchall():
+                    if isinstance(row, dict):
+                        key = (row["norm"], row["lemma_id"], row["source"])
+                        norm_id_cache[key] = row["id"]
+                    else:
+                        norm_id_cache[(row[1], row[2], row[3])] = row[0]
 
             forms_to_insert = []
             for nf in forms_pending:
                 norm_id = norm_id_cache.get(nf["norm_key"])
                 if norm_id:
                     forms_to_insert.append(
-                        {
-                            "norm_id": norm_id,
-                            "written_form": nf["written_form"],
-                            "attestation_count": nf["attestation_count"],
-                            "source": nf["source"],
-                        }
+                        (
+                            norm_id,
+                            nf["written_form"],
+                            nf["attestation_count"],
+                            nf["source"],
+                        )
                     )
 
-            if forms_to_insert:
-                with ctx.db.cursor() as cur:
-                    cur.executemany(
-                        "INSERT INTO lexical_norm_forms "
-                        "(norm_id, written_form, attestation_count, source) "
-                        "VALUES (%(norm_id)s, %(written_form)s, %(attestation_count)s, %(source)s) "
-                        "ON CONFLICT (norm_id, written_form) DO NOTHING",
-                        forms_to_insert,
-                    )
-                ctx.db.commit()
+            copy_insert(
+                ctx.db,
+                table="lexical_norm_forms",
+                columns=NORM_FORM_COLUMNS,
+                rows=forms_to_insert,
+                on_conflict="ON CONFLICT (norm_id, written_form) DO NOTHING",
+            )
 
         # Backfill lemmatizations.norm_id
         ctx.info("oracc_norms.backfill_start")
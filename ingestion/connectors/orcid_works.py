@@ -20,10 +20,17 @@ Good-citizen policy (the CDLI IP-ban lesson):
   - ~421 scholars ⇒ ~421 API calls. A polite delay (default ~1.1s) is enforced
     between requests via a process-wide throttle.
   - A descriptive User-Agent identifies us and gives ORCID a contact.
-  - 429 / 5xx responses trigger bounded exponential backoff with retries; a
-    final failure routes the scholar to the dead-letter queue rather than
-    aborting the run.
+  - 429 / 5xx responses trigger bounded retries, waiting for Retry-After (or
+    jittered exponential backoff) on the shared throttle; a final failure
+    routes the scholar to the dead-letter queue rather than aborting the run.
   - Runs are idempotent, so a partial run resumes cleanly with no duplicates.
+    To resume without re-fetching, pass ``after_id`` (keyset on scholars.id;
+    each scholar's id is logged as it is committed) and/or ``only_unlinked``
+    (skip scholars that already have publication_authors rows).
+  - Fetches for the next few scholars are prefetched on a small thread pool so
+    curl round-trips overlap the DB writes for the current scholar. Requests
+    still pass through the shared throttle, so the polite interval holds; DB
+    work (loads, run events, dead letters) stays on the main thread.
 
 macOS SSL note (CLAUDE.md): we shell out to ``curl`` via subprocess. urllib /
 requests have intermittent SSL failures on macOS against some HTTPS endpoints,
@@ -33,12 +40,16 @@ on the VPS where it can reach external hosts.
 
 from __future__ import annotations
 
+import concurrent.futures
 import json
+import random
 import re
 import subprocess
 import threading
 import time
 import unicodedata
+from collections import deque
+from functools import lru_cache
 from typing import Any, Iterable, Iterator, Optional
 
 from ingestion.base import LoadStats, RunContext, SourceConnector
@@ -59,6 +70,9 @@ MAX_RETRIES = 4
 BACKOFF_BASE_S = 2.0
 BACKOFF_CAP_S = 30.0
 
+# Scholars whose works are fetched ahead of the one currently being loaded.
+DEFAULT_PREFETCH = 4
+
 # ORCID work-type → our publications.publication_type enum. ORCID's vocabulary
 # is broad; anything unmapped falls back to "other" so we never violate the
 # enum CHECK constraint.
@@ -81,6 +95,12 @@ _TYPE_MAP = {
     "other": "other",
 }
 
+# Per-work normalization patterns, compiled once.
+_DOI_URL_RE = re.compile(r"^https?://(dx\.)?doi\.org/")
+_DOI_SCHEME_RE = re.compile(r"^doi:\s*")
+_TITLE_PUNCT_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 # ── HTTP fetch (curl, throttled) ──────────────────────────────────────────────
 
@@ -104,25 +124,40 @@ def _throttle(interval_s: float) -> None:
         _next_allowed_at = now + interval_s
 
 
+def _penalize(delay_s: float) -> None:
+    """Push the shared next-allowed timestamp out by `delay_s` after a 429/5xx.
+
+    Every prefetch thread passes through _throttle(), so one throttled answer
+    holds them all back instead of each sleeping (and re-hitting ORCID) on its
+    own schedule.
+    """
+    global _next_allowed_at
+    with _lock:
+        _next_allowed_at = max(_next_allowed_at, time.monotonic() + delay_s)
+
+
 class _FetchError(Exception):
     """curl-level failure (network/timeout/no response). Retryable upstream."""
 
 
 def _curl_json(
     url: str, *, user_agent: str, timeout_s: float = 30.0
-) -> tuple[int, bytes]:
-    """Fetch ``url`` with curl, returning (http_status, body).
+) -> tuple[int, bytes, Optional[float]]:
+    """Fetch ``url`` with curl, returning (http_status, body, retry_after_s).
 
-    Returns the body even on 4xx/5xx so the caller decides retry vs dead-letter.
+    Returns the body even on 4xx/5xx so the caller decides retry vs dead-letter;
+    retry_after_s is None without a usable Retry-After header.
     Raises _FetchError only on curl-level failures.
     """
     sep = "\x1e"  # ASCII record separator — won't appear in ORCID JSON
-    write_out = f"{sep}__META__{sep}%{{http_code}}"
+    # Trailer: status, then Retry-After (empty when the header is absent).
+    write_out = f"{sep}__META__{sep}%{{http_code}}{sep}%header{{retry-after}}"
     cmd = [
         "curl",
         "-s",
         "-S",
         "-L",
+        "--compressed",
         "-A",
         user_agent,
         "-H",
@@ -150,49 +185,80 @@ def _curl_json(
     if idx < 0:
         raise _FetchError(f"curl output missing metadata trailer for {url}")
     body = stdout[:idx]
-    status = int(stdout[idx + len(marker) :].decode("utf-8", errors="replace") or "0")
-    return status, body
+    trailer = stdout[idx + len(marker) :].decode("utf-8", errors="replace")
+    status, _, retry_after = trailer.partition(sep)
+    return int(status or "0"), body, _retry_after_s(retry_after)
+
+
+def _retry_after_s(value: str) -> Optional[float]:
+    """Delta-seconds Retry-After as a float; None if absent or an HTTP-date."""
+    try:
+        return max(0.0, float(value.strip()))
+    except ValueError:
+        return None
 
 
 def _fetch_works(
-    orcid: str, *, user_agent: str, interval_s: float, ctx: RunContext
+    orcid: str,
+    *,
+    user_agent: str,
+    interval_s: float,
+    events: list[tuple[str, str, dict]],
 ) -> Optional[dict]:
     """Fetch the works summary for one ORCID, with backoff on 429/5xx.
 
     Returns the parsed JSON dict, or None if the record is unavailable after
     retries (caller dead-letters). 404 → None immediately (no retry — the ORCID
     is wrong or the record is private/deactivated).
+
+    Runs on prefetch worker threads, so it never touches the DB: run events
+    are appended to ``events`` as (level, message, context) and the caller
+    replays them through ctx.log() on the main thread.
     """
     url = f"{ORCID_API_BASE}/{orcid}/works"
     for attempt in range(MAX_RETRIES + 1):
         _throttle(interval_s)
         try:
-            status, body = _curl_json(url, user_agent=user_agent)
+            status, body, retry_after = _curl_json(url, user_agent=user_agent)
         except _FetchError as e:
             if attempt < MAX_RETRIES:
                 _backoff(attempt)
                 continue
-            ctx.warn("orcid.fetch_error", orcid=orcid, error=str(e))
+            events.append(
+                ("warn", "orcid.fetch_error", {"orcid": orcid, "error": str(e)})
+            )
             return None
 
         if status == 200:
             try:
                 return json.loads(body)
             except (json.JSONDecodeError, ValueError) as e:
-                ctx.warn("orcid.bad_json", orcid=orcid, error=str(e))
+                events.append(
+                    ("warn", "orcid.bad_json", {"orcid": orcid, "error": str(e)})
+                )
                 return None
         if status == 404:
-            ctx.info("orcid.not_found", orcid=orcid)
+            events.append(("info", "orcid.not_found", {"orcid": orcid}))
             return None
         if status == 429 or 500 <= status < 600:
             if attempt < MAX_RETRIES:
-                ctx.info("orcid.retry", orcid=orcid, status=status, attempt=attempt + 1)
-                _backoff(attempt)
+                events.append(
+                    (
+                        "info",
+                        "orcid.retry",
+                        {"orcid": orcid, "status": status, "attempt": attempt + 1},
+                    )
+                )
+                # The wait goes on the shared throttle, which the next
+                # attempt (and every other prefetch thread) then honours.
+                _penalize(_retry_delay(attempt, retry_after))
                 continue
-            ctx.warn("orcid.exhausted", orcid=orcid, status=status)
+            events.append(
+                ("warn", "orcid.exhausted", {"orcid": orcid, "status": status})
+            )
             return None
         # Other 4xx (e.g. 400 malformed orcid) — no point retrying.
-        ctx.warn("orcid.http_error", orcid=orcid, status=status)
+        events.append(("warn", "orcid.http_error", {"orcid": orcid, "status": status}))
         return None
     return None
 
@@ -201,6 +267,14 @@ def _backoff(attempt: int) -> None:
     time.sleep(min(BACKOFF_BASE_S * (2**attempt), BACKOFF_CAP_S))
 
 
+def _retry_delay(attempt: int, retry_after: Optional[float]) -> float:
+    """Seconds before retry `attempt`: ORCID's Retry-After when it sent one,
+    else exponential backoff with up to a second of jitter. Capped either way."""
+    if retry_after is None:
+        retry_after = BACKOFF_BASE_S * (2**attempt) + random.random()
+    return min(retry_after, BACKOFF_CAP_S)
+
+
 # ── Parsing ───────────────────────────────────────────────────────────────────
 
 
@@ -215,20 +289,27 @@ def _text(node: Any) -> Optional[str]:
 
 
 def _normalize_doi(raw: str) -> str:
-    """Normalize a DOI to a bare lowercase '10.x/...' form for stable keying."""
+    """Normalize a DOI to a bare lowercase '10.x/...' form for stable keying.
+
+    Mirrors the doi_canonical() SQL function behind publications.doi_norm
+    (migration 062); keep the two in step."""
     d = raw.strip().lower()
-    d = re.sub(r"^https?://(dx\.)?doi\.org/", "", d)
-    d = re.sub(r"^doi:\s*", "", d)
+    d = _DOI_URL_RE.sub("", d)
+    d = _DOI_SCHEME_RE.sub("", d)
     return d.strip()
 
 
+@lru_cache(maxsize=65536)
 def _normalize_title(raw: str) -> str:
     """Aggressive title normalization for no-DOI dedup: NFC, lowercase, strip
     punctuation, collapse whitespace. Conservative on purpose — a near-match
-    collapses to the same key so we don't create near-duplicate pubs."""
+    collapses to the same key so we don't create near-duplicate pubs.
+
+    Memoized: co-authored pubs recur in every author's bibliography, and a
+    rerun normalizes the same titles again."""
     t = unicodedata.normalize("NFC", raw).lower()
-    t = re.sub(r"[^\w\s]", " ", t)
-    return re.sub(r"\s+", " ", t).strip()
+    t = _TITLE_PUNCT_RE.sub(" ", t)
+    return _WHITESPACE_RE.sub(" ", t).strip()
 
 
 def parse_works(orcid: str, payload: dict) -> list[dict]:
@@ -324,13 +405,20 @@ class OrcidWorksConnector(SourceConnector):
         user_agent: str = DEFAULT_USER_AGENT,
         limit: Optional[int] = None,
         orcids: Optional[list[str]] = None,
+        prefetch: int = DEFAULT_PREFETCH,
     ) -> None:
         # `limit` caps how many scholars are processed (subset runs); `orcids`
         # restricts to an explicit allow-list (targeted reruns / testing).
+        # `prefetch` is how many scholars' fetches run ahead of the load.
         self.request_interval_s = request_interval_s
         self.user_agent = user_agent
         self.limit = limit
         self.orcids = orcids
+        self.prefetch = prefetch
+        # Bibliography of the scholar currently being loaded, as
+        # (normalized title, publication id, year); see _scholar_pubs().
+        self._pubs_for: Optional[int] = None
+        self._pubs: list[tuple[str, int, Optional[int]]] = []
 
     # --- scholar selection ---
 
@@ -340,12 +428,23 @@ class OrcidWorksConnector(SourceConnector):
         # the connector with no args — can still cap a subset for staged rollout).
         limit = self.limit if self.limit is not None else ctx.config.get("limit")
         orcids = self.orcids if self.orcids is not None else ctx.config.get("orcids")
+        after_id = ctx.config.get("after_id")
 
         clauses = ["orcid IS NOT NULL", "trim(orcid) <> ''"]
         params: list[Any] = []
         if orcids:
             clauses.append("orcid = ANY(%s)")
             params.append(list(orcids))
+        if after_id:
+            # Keyset resume: pick up after the last scholar a previous run
+            # committed (see orcid.scholar_done) instead of starting over.
+            clauses.append("id > %s")
+            params.append(int(after_id))
+        if ctx.config.get("only_unlinked"):
+            clauses.append(
+                "NOT EXISTS (SELECT 1 FROM publication_authors pa "
+                "WHERE pa.scholar_id = scholars.id)"
+            )
         sql = (
             "SELECT id, name, orcid FROM scholars "
             f"WHERE {' AND '.join(clauses)} "
@@ -358,43 +457,86 @@ class OrcidWorksConnector(SourceConnector):
 
     # --- lifecycle ---
 
+    def _fetch(self, orcid: str) -> tuple[Optional[dict], list]:
+        events: list[tuple[str, str, dict]] = []
+        payload = _fetch_works(
+            orcid,
+            user_agent=self.user_agent,
+            interval_s=self.request_interval_s,
+            events=events,
+        )
+        return payload, events
+
     def extract(self, ctx: RunContext) -> Iterator[dict]:
         scholars = self._scholars_with_orcid(ctx)
         ctx.info("orcid.scholars_selected", count=len(scholars))
-        for sch in scholars:
-            orcid = sch["orcid"].strip()
-            payload = _fetch_works(
-                orcid,
-                user_agent=self.user_agent,
-                interval_s=self.request_interval_s,
-                ctx=ctx,
-            )
-            if payload is None:
-                ctx.dead_letter(
-                    category="no_match",
-                    subcategory="orcid_unavailable",
-                    source_key=orcid,
-                    payload={"scholar_id": sch["id"], "orcid": orcid},
-                    reason="ORCID works record unavailable after retries (404/429/5xx/parse).",
+        depth = max(1, int(ctx.config.get("prefetch", self.prefetch)))
+
+        # Keep `depth` fetches in flight and consume them in scholar order, so
+        # the loader sees the same sequence as a serial run.
+        pending: deque = deque()
+        todo = iter(scholars)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=depth)
+        try:
+            for sch in todo:
+                pending.append(
+                    (sch, executor.submit(self._fetch, sch["orcid"].strip()))
                 )
-                continue
-            works = parse_works(orcid, payload)
-            ctx.info(
-                "orcid.fetched", orcid=orcid, scholar_id=sch["id"], works=len(works)
-            )
-            for w in works:
-                w["scholar_id"] = sch["id"]
-                w["scholar_name"] = sch["name"]
-                yield w
+                if len(pending) >= depth:
+                    break
+            while pending:
+                sch, future = pending.popleft()
+                nxt = next(todo, None)
+                if nxt is not None:
+                    pending.append(
+                        (nxt, executor.submit(self._fetch, nxt["orcid"].strip()))
+                    )
+
+                orcid = sch["orcid"].strip()
+                payload, events = future.result()
+                for level, message, context in events:
+                    ctx.log(level, message, **context)
+                if payload is None:
+                    ctx.dead_letter(
+                        category="no_match",
+                        subcategory="orcid_unavailable",
+                        source_key=orcid,
+                        payload={"scholar_id": sch["id"], "orcid": orcid},
+                        reason="ORCID works record unavailable after retries (404/429/5xx/parse).",
+                    )
+                    continue
+                works = parse_works(orcid, payload)
+                ctx.info(
+                    "orcid.fetched", orcid=orcid, scholar_id=sch["id"], works=len(works)
+                )
+                for w in works:
+                    w["scholar_id"] = sch["id"]
+                    w["scholar_name"] = sch["name"]
+                    yield w
+        finally:
+            # An aborted run (generator closed early) drops queued fetches
+            # instead of waiting on them.
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def load(self, ctx: RunContext, rows: Iterable[dict]) -> LoadStats:
         stats = LoadStats()
+        self._pubs_for = None
+        # Works arrive grouped by scholar; commit once per scholar rather than
+        # per work. A savepoint per work keeps a failing row from taking the
+        # rest of the scholar's batch down with it.
+        current_scholar = None
         for w in rows:
+            if w["scholar_id"] != current_scholar:
+                ctx.db.commit()
+                if current_scholar is not None:
+                    ctx.info("orcid.scholar_done", scholar_id=current_scholar)
+                current_scholar = w["scholar_id"]
+            ctx.db.execute("SAVEPOINT orcid_work")
             try:
                 self._load_one(ctx, w, stats)
             except Exception as e:  # noqa: BLE001 - route, don't abort the run
                 # Roll back only this row's partial work, then dead-letter it.
-                ctx.db.rollback()
+                ctx.db.execute("ROLLBACK TO SAVEPOINT orcid_work")
                 ctx.dead_letter(
                     category="other",
                     subcategory="load_failed",
@@ -405,6 +547,11 @@ class OrcidWorksConnector(SourceConnector):
                     reason=f"load failed: {e}",
                 )
                 stats.dead_lettered += 1
+            else:
+                ctx.db.execute("RELEASE SAVEPOINT orcid_work")
+        ctx.db.commit()
+        if current_scholar is not None:
+            ctx.info("orcid.scholar_done", scholar_id=current_scholar)
         return stats
 
     def _load_one(self, ctx: RunContext, w: dict, stats: LoadStats) -> None:
@@ -423,10 +570,12 @@ class OrcidWorksConnector(SourceConnector):
         year = w.get("year")
         doi = w.get("doi")
 
+        pub_id: Optional[int]
         if doi:
-            pub_id, inserted = self._upsert_by_doi(ctx, w)
+            pub_id, inserted, pub_title, pub_year = self._upsert_by_doi(ctx, w)
         else:
             pub_id, inserted = self._upsert_no_doi(ctx, w, scholar_id, title, year)
+            pub_title, pub_year = title, year
 
         if pub_id is None:
             stats.skipped += 1
@@ -436,23 +585,48 @@ class OrcidWorksConnector(SourceConnector):
         else:
             stats.skipped += 1  # existing pub, no new pub row created
 
-        self._link_author(ctx, pub_id, scholar_id)
-        ctx.db.commit()
+        if self._link_author(ctx, pub_id, scholar_id):
+            # Keep the cached bibliography in step with publication_authors so
+            # later DOI-less works of this scholar can match this pub.
+            self._scholar_pubs(ctx, scholar_id).append(
+                (_normalize_title(pub_title or ""), pub_id, pub_year)
+            )
 
-    def _upsert_by_doi(self, ctx: RunContext, w: dict) -> tuple[Optional[int], bool]:
-        """ON CONFLICT (doi) upsert. Existing rows are left untouched (we do not
+    def _upsert_by_doi(
+        self, ctx: RunContext, w: dict
+    ) -> tuple[int, bool, Optional[str], Optional[int]]:
+        """ON CONFLICT (doi) insert. Existing rows are left untouched (we do not
         overwrite richer CDLI/OpenAlex metadata with ORCID summaries — accuracy
-        over coverage). Returns (publication_id, was_inserted)."""
+        over coverage). Returns (publication_id, was_inserted, title, year) of
+        the stored row.
+
+        An existing row is found on doi_norm (migration 062), so a pub another
+        source stored as "https://doi.org/..." or "doi:..." is reused rather
+        than duplicated; only when none exists is a row inserted. This also
+        avoids a no-op DO UPDATE rewriting every known pub on a rerun.
+        """
         bibtex_key = f"orcid:{w['doi']}"
         row = ctx.db.execute(
             """
-            INSERT INTO publications
-                (doi, bibtex_key, title, publication_type, year, url, authors)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (doi) DO UPDATE SET doi = EXCLUDED.doi
-            RETURNING id, (xmax = 0) AS inserted
+            WITH existing AS (
+                SELECT id, title, year FROM publications
+                WHERE doi_norm = %s
+                ORDER BY id
+                LIMIT 1
+            ), ins AS (
+                INSERT INTO publications
+                    (doi, bibtex_key, title, publication_type, year, url, authors)
+                SELECT %s, %s, %s, %s, %s, %s, %s
+                WHERE NOT EXISTS (SELECT 1 FROM existing)
+                ON CONFLICT (doi) DO NOTHING
+                RETURNING id, title, year
+            )
+            SELECT id, true AS inserted, title, year FROM ins
+            UNION ALL
+            SELECT id, false, title, year FROM existing
             """,
             (
+                w["doi"],
                 w["doi"],
                 bibtex_key,
                 w["title"],
@@ -462,9 +636,36 @@ class OrcidWorksConnector(SourceConnector):
                 w.get("scholar_name") or "",
             ),
         ).fetchone()
-        pub_id = row["id"] if isinstance(row, dict) else row[0]
-        inserted = row["inserted"] if isinstance(row, dict) else row[1]
-        return pub_id, bool(inserted)
+        if isinstance(row, dict):
+            return row["id"], bool(row["inserted"]), row["title"], row["year"]
+        return row[0], bool(row[1]), row[2], row[3]
+
+    def _scholar_pubs(
+        self, ctx: RunContext, scholar_id: int
+    ) -> list[tuple[str, int, Optional[int]]]:
+        """(normalized title, id, year) of every pub linked to `scholar_id`.
+
+        Selected and normalized once per scholar, then extended by _load_one()
+        as links are added, rather than re-reading the scholar's whole
+        bibliography for every DOI-less work."""
+        if self._pubs_for != scholar_id:
+            rows = ctx.db.execute(
+                """
+                SELECT p.id, p.title, p.year
+                FROM publications p
+                JOIN publication_authors pa ON pa.publication_id = p.id
+                WHERE pa.scholar_id = %s
+                """,
+                (scholar_id,),
+            ).fetchall()
+            self._pubs = []
+            for r in rows:
+                r = dict(r)
+                self._pubs.append(
+                    (_normalize_title(r["title"] or ""), r["id"], r["year"])
+                )
+            self._pubs_for = scholar_id
+        return self._pubs
 
     def _upsert_no_doi(
         self,
@@ -486,26 +687,16 @@ class OrcidWorksConnector(SourceConnector):
         # Look only among pubs already attributed to this scholar — narrow, so
         # we never collide two different scholars' same-titled works, and never
         # grab an unrelated corpus pub. accuracy over coverage.
-        candidates = ctx.db.execute(
-            """
-            SELECT p.id, p.title, p.year
-            FROM publications p
-            JOIN publication_authors pa ON pa.publication_id = p.id
-            WHERE pa.scholar_id = %s
-            """,
-            (scholar_id,),
-        ).fetchall()
-        for c in candidates:
-            c = dict(c)
-            if _normalize_title(c["title"] or "") != norm:
+        for c_norm, c_id, c_year in self._scholar_pubs(ctx, scholar_id):
+            if c_norm != norm:
                 continue
             # If both carry a year and they disagree, treat as a different work.
-            if year is not None and c["year"] is not None and c["year"] != year:
+            if year is not None and c_year is not None and c_year != year:
                 continue
-            return c["id"], False
+            return c_id, False
 
         # Deterministic key so reruns are idempotent even without a DOI.
-        digest = _normalize_title(title)[:120].replace(" ", "_")
+        digest = norm[:120].replace(" ", "_")
         bibtex_key = f"orcid:{scholar_id}:{year or 'na'}:{digest}"
         row = ctx.db.execute(
             """
@@ -528,10 +719,11 @@ class OrcidWorksConnector(SourceConnector):
         inserted = row["inserted"] if isinstance(row, dict) else row[1]
         return pub_id, bool(inserted)
 
-    def _link_author(self, ctx: RunContext, pub_id: int, scholar_id: int) -> None:
+    def _link_author(self, ctx: RunContext, pub_id: int, scholar_id: int) -> bool:
         """Link scholar↔publication as author. ON CONFLICT on the existing
-        (publication_id, scholar_id, role) unique constraint → idempotent."""
-        ctx.db.execute(
+        (publication_id, scholar_id, role) unique constraint → idempotent.
+        Returns True when a new link row was written."""
+        cur = ctx.db.execute(
             """
             INSERT INTO publication_authors (publication_id, scholar_id, role)
             VALUES (%s, %s, 'author')
@@ -539,6 +731,7 @@ class OrcidWorksConnector(SourceConnector):
             """,
             (pub_id, scholar_id),
         )
+        return cur.rowcount > 0
 
     def verify(self, ctx: RunContext) -> None:
         # Sanity: every ORCID-sourced publication must be linked to at least one
@@ -9,15 +9,14 @@ Names are normalized (unicode NFC, whitespace collapsed) and inserted once.
 
 from __future__ import annotations
 
-import csv
-import json
 import re
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Iterator
 
 from ingestion.base import ConflictPolicy, LoadStats, RunContext, SourceConnector
-from ingestion.loader import upsert_batch
+from ingestion.loader import iter_csv_columns, iter_json_members, upsert_batch
 
 DEFAULT_CSV = Path("source-data/sources/CDLI/metadata/cdli_cat.csv")
 ORACC_BASE = Path("source-data/sources/ORACC")
@@ -34,22 +33,47 @@ ORACC_PROJECTS = [
     "rimanum",
 ]
 
+_RE_ET_AL = re.compile(r"\s*(et al\.|& others|and others)\s*", re.IGNORECASE)
+_RE_WHITESPACE = re.compile(r"\s+")
+_RE_NAME_SEP = re.compile(r"\s*[&;]\s*|\s+and\s+")
+
 
 def _normalize_name(raw: str) -> str:
     name = raw.strip()
-    name = re.sub(r"\s*(et al\.|& others|and others)\s*", "", name, flags=re.IGNORECASE)
+    name = _RE_ET_AL.sub("", name)
     name = name.strip().strip(",").strip()
     if not name:
         return ""
     name = unicodedata.normalize("NFC", name)
-    return re.sub(r"\s+", " ", name)
+    return _RE_WHITESPACE.sub(" ", name)
 
 
-def _parse_name_list(raw: str) -> list[str]:
+@lru_cache(maxsize=65536)
+def _parse_names(raw: str) -> tuple[str, ...]:
+    """Memoized core of _parse_name_list. The CDLI author / atf_source
+    columns repeat the same few thousand strings across ~350k rows, so most
+    calls are cache hits."""
     if not raw or not raw.strip():
-        return []
-    parts = re.split(r"\s*[&;]\s*|\s+and\s+", raw)
-    return [n for p in parts if len(n := _normalize_name(p)) > 2]
+        return ()
+    parts = _RE_NAME_SEP.split(raw)
+    return tuple(n for p in parts if len(n := _normalize_name(p)) > 2)
+
+
+def _parse_name_list(raw: str) -> list[str]:
+    return list(_parse_names(raw))
+
+
+def _iter_names(records: Iterable[dict], fields: tuple[str, ...]) -> Iterator[str]:
+    """Yield every normalized name in ``fields`` across ``records``.
+
+    Used for the ORACC catalogue members; empty fields are skipped without a
+    parse.
+    """
+    for record in records:
+        for field in fields:
+            raw = record.get(field)
+            if raw:
+                yield from _parse_names(raw)
 
 
 def _find_catalogue(project: str) -> Path | None:
@@ -81,25 +105,23 @@ class ScholarsConnector(SourceConnector):
 
         if self.csv_path.exists():
             ctx.info("scholars.scan_cdli", path=str(self.csv_path))
-            with open(self.csv_path, encoding="utf-8") as f:
-                for row in csv.DictReader(f):
-                    for field in ("atf_source", "author"):
-                        for name in _parse_name_list(row.get(field, "")):
-                            names.add(name)
+            for values in iter_csv_columns(self.csv_path, ("atf_source", "author")):
+                for raw in values:
+                    if raw:
+                        names.update(_parse_names(raw))
 
         for proj in ORACC_PROJECTS:
             cat_path = _find_catalogue(proj)
             if not cat_path:
                 continue
+            members = (entry for _, entry in iter_json_members(cat_path))
+            # Gather the file's names first so a catalogue that fails to parse
+            # part-way adds none of them.
             try:
-                with open(cat_path, encoding="utf-8") as f:
-                    catalogue = json.load(f)
-            except (json.JSONDecodeError, ValueError):
+                file_names = set(_iter_names(members, ("author", "atf_source")))
+            except ValueError:
                 continue
-            for entry in catalogue.get("members", {}).values():
-                for field in ("author", "atf_source"):
-                    for name in _parse_name_list(entry.get(field, "")):
-                        names.add(name)
+            names |= file_names
 
         ctx.info("scholars.collected", count=len(names))
         for name in sorted(names):
@@ -79,14 +79,22 @@ class TokenReadingsConnector(SourceConnector):
         total = total_row["cnt"] if isinstance(total_row, dict) else total_row[0]
         ctx.info("token_readings.total_tokens", count=total)
 
+        # Keyset pagination on id: each batch is an index range scan starting
+        # where the last one ended, where OFFSET re-walked every earlier token
+        # (quadratic over millions of rows). A server-side cursor wouldn't
+        # survive: load() commits between batches on this same connection.
         offset = 0
+        after_id = 0
         while True:
             tokens = ctx.db.execute(
-                "SELECT id, gdl_json FROM tokens WHERE gdl_json IS NOT NULL ORDER BY id LIMIT %s OFFSET %s",
-                (BATCH_SIZE, offset),
+                "SELECT id, gdl_json FROM tokens WHERE gdl_json IS NOT NULL "
+                "AND id > %s ORDER BY id LIMIT %s",
+                (after_id, BATCH_SIZE),
             ).fetchall()
             if not tokens:
                 break
+            last = tokens[-1]
+            after_id = last["id"] if isinstance(last, dict) else last[0]
             for token in tokens:
                 tid = token["id"] if isinstance(token, dict) else token[0]
                 gdl = token["gdl_json"] if isinstance(token, dict) else token[1]
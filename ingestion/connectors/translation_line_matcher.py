@@ -29,6 +29,9 @@ from ingestion.base import (
     SourceConnector,
 )
 from ingestion.dead_letters import DeadLetterCategory
+from ingestion.loader import fetch_key_set
+
+DEAD_LETTER_BATCH_SIZE = 1000
 
 
 class TranslationLineMatcher(SourceConnector):
@@ -45,6 +48,11 @@ class TranslationLineMatcher(SourceConnector):
     def extract(self, ctx: RunContext) -> Iterator[dict]:
         """Yield every translation row whose line_id doesn't resolve."""
         ctx.info("matcher.extract_start")
+        # Known p_numbers, loaded once so transform() classifies by set
+        # membership rather than a SELECT per translation.
+        self._artifact_p_numbers = fetch_key_set(
+            ctx.db, "SELECT p_number FROM artifacts"
+        )
         with ctx.db.cursor() as cur:
             cur.execute(
                 """
@@ -62,16 +70,17 @@ class TranslationLineMatcher(SourceConnector):
         # Classify the unmatchable reason and route to dead-letters
         if record.get("line_id") is None:
             subcategory = "no_line_ref"
-        elif _has_no_artifact(ctx, record["p_number"]):
+        elif record["p_number"] not in self._artifact_p_numbers:
             subcategory = "missing_artifact"
         else:
             subcategory = "stale_line_ref"
 
-        ctx.dead_letter(
-            category=DeadLetterCategory.NO_MATCH.value,
-            subcategory=subcategory,
-            source_key=f"{record['p_number']}/{record['translation_id']}",
-            payload={
+        # The "rows" this connector loads are dead letters; load() batches them.
+        yield {
+            "category": DeadLetterCategory.NO_MATCH.value,
+            "subcategory": subcategory,
+            "source_key": f"{record['p_number']}/{record['translation_id']}",
+            "payload": {
                 "translation_id": record["translation_id"],
                 "p_number": record["p_number"],
                 "line_id": record.get("line_id"),
@@ -79,16 +88,20 @@ class TranslationLineMatcher(SourceConnector):
                 "language": record.get("language"),
                 "source": record.get("source"),
             },
-            reason=_reason_for(subcategory),
-        )
-        return  # dead-letters only; yield from [] would also work but this is clearer
-        yield  # makes this a generator function so runner's `yield from` works
+            "reason": _reason_for(subcategory),
+        }
 
     def load(self, ctx: RunContext, rows: Iterable[dict]) -> LoadStats:
-        # All work happened in transform via dead_letter(); no rows to load.
-        # Consume the generator so transform() runs for every record.
-        for _ in rows:
-            pass
+        # Every transformed row is a dead letter; write them in bulk instead
+        # of one commit per dead_letter() call. Nothing lands in a data table.
+        batch: list[dict] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= DEAD_LETTER_BATCH_SIZE:
+                ctx.dead_letter_many(batch)
+                batch = []
+        if batch:
+            ctx.dead_letter_many(batch)
         return LoadStats()
 
     def verify(self, ctx: RunContext) -> None:
@@ -104,14 +117,6 @@ class TranslationLineMatcher(SourceConnector):
         ctx.info("matcher.dead_letters_written", count=n)
 
 
-def _has_no_artifact(ctx: RunContext, p_number: str) -> bool:
-    row = ctx.db.execute(
-        "SELECT 1 FROM artifacts WHERE p_number = %s LIMIT 1",
-        (p_number,),
-    ).fetchone()
-    return row is None
-
-
 def _reason_for(subcategory: str) -> str:
     return {
         "no_line_ref": "translation.line_id is NULL — never attached to a specific text_line",
@@ -8,12 +8,12 @@ Source: source-data/sources/ePSD2/unicode/cuneiform-signs.json
 
 from __future__ import annotations
 
-import json
 import re
 from pathlib import Path
 from typing import Iterable, Iterator
 
 from ingestion.base import LoadStats, RunContext, SourceConnector, SourceManifest
+from ingestion.loader import iter_json_items
 
 DEFAULT_UNICODE_FILE = Path("source-data/sources/ePSD2/unicode/cuneiform-signs.json")
 
@@ -22,14 +22,24 @@ SOURCE_CITATION = "The Unicode Standard, Unicode Consortium"
 SOURCE_URL = "https://www.unicode.org/charts/PDF/U12000.pdf"
 
 
+RE_CUNEIFORM_SIGN = re.compile(r"^CUNEIFORM SIGN (.+)$")
+RE_TIMES = re.compile(r"\s+TIMES\s+")
+RE_OVER = re.compile(r"\s+OVER\s+")
+RE_OPPOSING = re.compile(r"\s+OPPOSING\s+")
+
+
 def _parse_sign_name(unicode_name: str) -> str | None:
-    m = re.match(r"^CUNEIFORM SIGN (.+)$", unicode_name)
+    m = RE_CUNEIFORM_SIGN.match(unicode_name)
     if not m:
         return None
     raw = m.group(1)
-    raw = re.sub(r"\s+TIMES\s+", "×", raw)
-    raw = re.sub(r"\s+OVER\s+", "&", raw)
-    raw = re.sub(r"\s+OPPOSING\s+", ".OPPOSING.", raw)
+    # Most names carry no operator; a substring check is far cheaper than
+    # running the three substitutions.
+    if "TIMES" not in raw and "OVER" not in raw and "OPPOSING" not in raw:
+        return raw
+    raw = RE_TIMES.sub("×", raw)
+    raw = RE_OVER.sub("&", raw)
+    raw = RE_OPPOSING.sub(".OPPOSING.", raw)
     return raw
 
 
@@ -60,9 +70,7 @@ class UnicodeSignsConnector(SourceConnector):
         if not self.unicode_path.exists():
             ctx.warn("unicode_signs.source_missing", path=str(self.unicode_path))
             return
-        with open(self.unicode_path, encoding="utf-8") as f:
-            data = json.load(f)
-        for sign in data.get("signs", []):
+        for sign in iter_json_items(self.unicode_path, "signs.item"):
             yield {
                 "character": sign["character"],
                 "codepoint": sign["codePoint"],
@@ -70,77 +78,84 @@ class UnicodeSignsConnector(SourceConnector):
             }
 
     def load(self, ctx: RunContext, rows: Iterable[dict]) -> LoadStats:
-        stats = LoadStats()
-
-        # Index existing signs by unicode_char
-        by_unicode: dict[str, dict] = {}
-        for row in ctx.db.execute(
-            "SELECT id, sign_name, unicode_char, source_contributions "
-            "FROM lexical_signs WHERE unicode_char IS NOT NULL"
-        ).fetchall():
-            if isinstance(row, dict):
-                sid, name, uc, contributions = (
-                    row["id"],
-                    row["sign_name"],
-                    row["unicode_char"],
-                    row["source_contributions"],
-                )
-            else:
-                sid, name, uc, contributions = row
-            if uc not in by_unicode:
-                by_unicode[uc] = {
-                    "id": sid,
-                    "name": name,
-                    "contributions": contributions or {},
-                }
-
-        for record in rows:
-            char = record["character"]
-            codepoint = record["codepoint"]
-            name = record["name"]
-
-            if char in by_unicode:
-                target = by_unicode[char]
-                contributions = dict(target["contributions"])
-                contributions["unicode_codepoint"] = SOURCE_NAME
-                contributions["unicode_name"] = SOURCE_NAME
-                ctx.db.execute(
-                    "UPDATE lexical_signs SET unicode_codepoint = %s, unicode_name = %s, "
-                    "source_contributions = %s, updated_at = NOW() WHERE id = %s",
-                    (codepoint, name, json.dumps(contributions), target["id"]),
-                )
-                stats.updated += 1
-            else:
-                parsed_name = _parse_sign_name(name)
-                if not parsed_name:
-                    stats.skipped += 1
-                    continue
-                contributions = {
-                    "unicode_char": SOURCE_NAME,
-                    "unicode_codepoint": SOURCE_NAME,
-                    "unicode_name": SOURCE_NAME,
-                }
-                ctx.db.execute(
-                    "INSERT INTO lexical_signs "
-                    "(sign_name, unicode_char, unicode_codepoint, unicode_name, "
-                    "source, source_citation, source_url, source_contributions) "
-                    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s) "
-                    "ON CONFLICT (sign_name, source) DO NOTHING",
-                    (
-                        parsed_name,
-                        char,
-                        codepoint,
-                        name,
-                        SOURCE_NAME,
-                        SOURCE_CITATION,
-                        SOURCE_URL,
-                        json.dumps(contributions),
-                    ),
+        # COPY the chart into a temp stage, then merge set-based: one UPDATE
+        # enriches the existing sign carrying each character (lowest id), one
+        # INSERT adds parseable characters no sign carries yet. The stage rows
+        # are built before the COPY opens, because extract() may log through
+        # ctx.db and the connection is locked while cur.copy() is active.
+        staged = [
+            (
+                record["character"],
+                record["codepoint"],
+                record["name"],
+                _parse_sign_name(record["name"]),
+            )
+            for record in rows
+        ]
+        with ctx.db.cursor() as cur:
+            cur.execute(
+                "CREATE TEMP TABLE unicode_sign_stage ("
+                "  char text, codepoint text, name text, parsed_name text"
+                ") ON COMMIT DROP"
+            )
+            with cur.copy(
+                "COPY unicode_sign_stage (char, codepoint, name, parsed_name) "
+                "FROM STDIN"
+            ) as cp:
+                for row in staged:
+                    cp.write_row(row)
+            # Autovacuum skips temp tables; give the planner real row counts.
+            cur.execute("ANALYZE unicode_sign_stage")
+            cur.execute(
+                """
+                WITH target AS (
+                    SELECT DISTINCT ON (l.unicode_char)
+                           l.id, s.codepoint, s.name
+                    FROM unicode_sign_stage s
+                    JOIN lexical_signs l ON l.unicode_char = s.char
+                    ORDER BY l.unicode_char, l.id
                 )
-                stats.inserted += 1
+                UPDATE lexical_signs t
+                SET unicode_codepoint = f.codepoint,
+                    unicode_name = f.name,
+                    source_contributions =
+                        COALESCE(t.source_contributions, '{}'::jsonb)
+                        || jsonb_build_object('unicode_codepoint', %(src)s::text,
+                                              'unicode_name', %(src)s::text),
+                    updated_at = NOW()
+                FROM target f
+                WHERE t.id = f.id
+                """,
+                {"src": SOURCE_NAME},
+            )
+            updated = max(cur.rowcount, 0)
+            cur.execute(
+                """
+                INSERT INTO lexical_signs
+                    (sign_name, unicode_char, unicode_codepoint, unicode_name,
+                     source, source_citation, source_url, source_contributions)
+                SELECT s.parsed_name, s.char, s.codepoint, s.name,
+                       %(src)s, %(cit)s, %(url)s,
+                       jsonb_build_object('unicode_char', %(src)s::text,
+                                          'unicode_codepoint', %(src)s::text,
+                                          'unicode_name', %(src)s::text)
+                FROM unicode_sign_stage s
+                WHERE s.parsed_name IS NOT NULL
+                  AND NOT EXISTS (
+                      SELECT 1 FROM lexical_signs l WHERE l.unicode_char = s.char
+                  )
+                ON CONFLICT (sign_name, source) DO NOTHING
+                """,
+                {"src": SOURCE_NAME, "cit": SOURCE_CITATION, "url": SOURCE_URL},
+            )
+            inserted = max(cur.rowcount, 0)
 
         ctx.db.commit()
-        return stats
+        return LoadStats(
+            inserted=inserted,
+            updated=updated,
+            skipped=len(staged) - inserted - updated,
+        )
 
     def verify(self, ctx: RunContext) -> None:
         row = ctx.db.execute(
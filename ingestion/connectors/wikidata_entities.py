@@ -53,6 +53,7 @@ uses. This connector is intended to run on the VPS where it reaches WDQS.
 from __future__ import annotations
 
 import json
+import random
 import subprocess
 import threading
 import time
@@ -117,20 +118,22 @@ class _FetchError(Exception):
 
 def _curl_sparql(
     query: str, *, user_agent: str, timeout_s: float = 60.0
-) -> tuple[int, bytes]:
-    """POST a SPARQL query to WDQS, returning (http_status, body).
+) -> tuple[int, bytes, Optional[float]]:
+    """POST a SPARQL query to WDQS, returning (http_status, body, retry_after_s).
 
     Uses POST (not GET) so a large VALUES clause never bumps into URL-length
     limits. Returns the body even on 4xx/5xx so the caller decides retry vs
     dead-letter. Raises _FetchError only on curl-level failures.
     """
     sep = "\x1e"  # ASCII record separator — won't appear in JSON results
-    write_out = f"{sep}__META__{sep}%{{http_code}}"
+    # Trailer: status, then Retry-After (empty when the header is absent).
+    write_out = f"{sep}__META__{sep}%{{http_code}}{sep}%header{{retry-after}}"
     cmd = [
         "curl",
         "-s",
         "-S",
         "-L",
+        "--compressed",
         "-A",
         user_agent,
         "-H",
@@ -160,12 +163,25 @@ def _curl_sparql(
     if idx < 0:
         raise _FetchError("curl output missing metadata trailer")
     body = stdout[:idx]
-    status = int(stdout[idx + len(marker) :].decode("utf-8", errors="replace") or "0")
-    return status, body
+    trailer = stdout[idx + len(marker) :].decode("utf-8", errors="replace")
+    status, _, retry_after = trailer.partition(sep)
+    return int(status or "0"), body, _retry_after_s(retry_after)
 
 
-def _backoff(attempt: int) -> None:
-    time.sleep(min(BACKOFF_BASE_S * (2**attempt), BACKOFF_CAP_S))
+def _retry_after_s(value: str) -> Optional[float]:
+    """Delta-seconds Retry-After as a float; None if absent or an HTTP-date."""
+    try:
+        return max(0.0, float(value.strip()))
+    except ValueError:
+        return None
+
+
+def _backoff(attempt: int, retry_after: Optional[float] = None) -> None:
+    """Sleep before retry `attempt`: the server's Retry-After when it sent one,
+    else exponential backoff with up to a second of jitter. Capped either way."""
+    if retry_after is None:
+        retry_after = BACKOFF_BASE_S * (2**attempt) + random.random()
+    time.sleep(min(retry_after, BACKOFF_CAP_S))
 
 
 def _run_sparql(
@@ -179,7 +195,7 @@ def _run_sparql(
     for attempt in range(MAX_RETRIES + 1):
         _throttle(interval_s)
         try:
-            status, body = _curl_sparql(query, user_agent=user_agent)
+            status, body, retry_after = _curl_sparql(query, user_agent=user_agent)
         except _FetchError as e:
             if attempt < MAX_RETRIES:
                 _backoff(attempt)
@@ -196,7 +212,7 @@ def _run_sparql(
         if status == 429 or 500 <= status < 600:
             if attempt < MAX_RETRIES:
                 ctx.info("wikidata.retry", status=status, attempt=attempt + 1)
-                _backoff(attempt)
+                _backoff(attempt, retry_after)
                 continue
             ctx.warn("wikidata.exhausted", status=status)
             return None
@@ -25,6 +25,10 @@ class DeadLetterCategory(str, Enum):
     OTHER = "other"
 
 
+# Checked on every write(); built once rather than per dead letter.
+_VALID_CATEGORIES = frozenset(c.value for c in DeadLetterCategory)
+
+
 class DeadLetterSink:
     """Writes to `import_dead_letters`. One instance per RunContext."""
 
@@ -43,7 +47,7 @@ class DeadLetterSink:
         source_key: Optional[str] = None,
     ) -> int:
         """Insert one dead-letter row, returning its id."""
-        if category not in {c.value for c in DeadLetterCategory}:
+        if category not in _VALID_CATEGORIES:
             raise ValueError(
                 f"Invalid dead-letter category: {category!r}. "
                 f"Valid: {[c.value for c in DeadLetterCategory]}"
@@ -85,13 +89,13 @@ class DeadLetterSink:
         """
         if not rows:
             return 0
-        valid = {c.value for c in DeadLetterCategory}
         params = []
         for row in rows:
             cat = row["category"]
-            if cat not in valid:
+            if cat not in _VALID_CATEGORIES:
                 raise ValueError(
-                    f"Invalid dead-letter category: {cat!r}. Valid: {sorted(valid)}"
+                    f"Invalid dead-letter category: {cat!r}. "
+                    f"Valid: {sorted(_VALID_CATEGORIES)}"
                 )
             params.append(
                 (
@@ -44,6 +44,7 @@ _PHOTO_THUMB_RE = re.compile(r"/dl/tn_photo/(P\d+)\.jpg", re.IGNORECASE)
 _LINEART_THUMB_RE = re.compile(r"/dl/tn_lineart/(P\d+)_l\.jpg", re.IGNORECASE)
 _READER_RE = re.compile(r"/artifacts/(\d+)/reader/(\d+)")
 _COPYRIGHT_RE = re.compile(r"©\s*[^<\n]+")
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 def parse_artifact_page(html: str, p_number: str) -> ArtifactImageManifest:
@@ -100,12 +101,17 @@ class _ArtifactPageParser(HTMLParser):
         if tag not in ("a", "img"):
             return
         for _key, value in attrs:
-            if value:
+            # Plain substring tests first: most attributes (classes, nav
+            # links, alt text) can't match, so skip the three regexes.
+            if value and ("/reader/" in value or "/dl/tn_" in value.lower()):
                 self._absorb_url(value)
 
     def handle_data(self, data: str) -> None:
+        # Only a handful of the page's text nodes carry a © notice.
+        if "©" not in data:
+            return
         for m in _COPYRIGHT_RE.finditer(data):
-            text = re.sub(r"\s+", " ", m.group(0).strip())
+            text = _WHITESPACE_RE.sub(" ", m.group(0).strip())
             self._copyright_strings.append(text)
 
     def _absorb_url(self, url: str) -> None:
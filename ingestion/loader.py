@@ -7,10 +7,33 @@ emits an `INSERT ... ON CONFLICT` matching that policy. Returns counts
 
 from __future__ import annotations
 
-from typing import Iterable
+import csv
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from psycopg.rows import tuple_row
+
+try:  # optional: faster parse for the large ORACC catalogue.json files
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback below
+    orjson = None  # type: ignore[assignment]
+
+try:  # optional: stream catalogue members instead of materialising the file
+    import ijson
+except ImportError:  # pragma: no cover - load_json fallback below
+    ijson = None
 
 from ingestion.base import ConflictPolicy, LoadStats
 
+# Catalogues smaller than this are parsed whole: below a few MB ijson's
+# per-event overhead costs more than the memory it saves.
+STREAM_JSON_MIN_BYTES = 5 * 1024 * 1024
+
+# Rows per round trip when fetch_key_set / fetch_key_map stream a key column.
+KEY_FETCH_ITERSIZE = 10_000
+
 
 def upsert_batch(
     db,
@@ -28,8 +51,9 @@ def upsert_batch(
     - UPDATE  → `ON CONFLICT DO UPDATE SET <every non-key column>=EXCLUDED.*`
     - REPLACE → same as UPDATE for now (semantic distinction reserved for future)
 
-    Returns LoadStats with counts. Uses RETURNING to distinguish insert from
-    update via `xmax = 0` (true if the row was freshly inserted).
+    Returns LoadStats with counts. UPDATE/REPLACE use RETURNING to distinguish
+    insert from update via `xmax = 0` (true if the row was freshly inserted);
+    SKIP streams each batch through COPY and counts from the merge's rowcount.
     """
     rows_list = list(rows)
     if not rows_list:
@@ -57,28 +81,41 @@ def upsert_batch(
                 "ON CONFLICT (" + unique_list + ") DO UPDATE SET " + set_clause
             )
 
-    sql = (
-        f"INSERT INTO {table} ({col_list}) VALUES ({placeholders}) "
-        f"{conflict_clause} RETURNING (xmax = 0) AS inserted"
-    )
+    if policy == ConflictPolicy.SKIP:
+        # Nothing to tell apart but inserted vs skipped, which the final
+        # INSERT's rowcount gives directly: stream the batch with COPY instead
+        # of one statement per row.
+        def flush(buf: list[tuple]) -> LoadStats:
+            return _flush_copy(db, table, col_list, conflict_clause, buf)
+
+    else:
+        sql = (
+            f"INSERT INTO {table} ({col_list}) VALUES ({placeholders}) "
+            f"{conflict_clause} RETURNING (xmax = 0) AS inserted"
+        )
+
+        def flush(buf: list[tuple]) -> LoadStats:
+            return _flush(db, sql, buf, policy)
 
     stats = LoadStats()
     buf: list[tuple] = []
     for r in rows_list:
         buf.append(tuple(r.get(c) for c in columns))
         if len(buf) >= batch_size:
-            stats = stats.merge(_flush(db, sql, buf, policy))
+            stats = stats.merge(flush(buf))
             buf.clear()
     if buf:
-        stats = stats.merge(_flush(db, sql, buf, policy))
+        stats = stats.merge(flush(buf))
     return stats
 
 
 def _flush(db, sql: str, buf: list[tuple], policy: ConflictPolicy) -> LoadStats:
     stats = LoadStats()
     with db.cursor() as cur:
-        for tup in buf:
-            cur.execute(sql, tup)
+        # One executemany per flush: psycopg pipelines the statements and keeps
+        # one result set per row, so the insert/update/skip split is preserved.
+        cur.executemany(sql, buf, returning=True)
+        while True:
             result = cur.fetchone()
             if result is None:
                 # SKIP policy → conflict, no row returned
@@ -89,10 +126,161 @@ def _flush(db, sql: str, buf: list[tuple], policy: ConflictPolicy) -> LoadStats:
                     stats.inserted += 1
                 else:
                     stats.updated += 1
+            if not cur.nextset():
+                break
     db.commit()
     return stats
 
 
+def _flush_copy(
+    db, table: str, col_list: str, conflict_clause: str, buf: list[tuple]
+) -> LoadStats:
+    """SKIP-policy flush: COPY the batch into a temp stage, then merge it with
+    one INSERT ... SELECT. The stage is built from the target's own column
+    types (no constraints), so COPY parses values exactly as the INSERT would.
+    """
+    with db.cursor() as cur:
+        cur.execute(
+            f"CREATE TEMP TABLE _upsert_stage ON COMMIT DROP AS "
+            f"SELECT {col_list} FROM {table} WITH NO DATA"
+        )
+        with cur.copy(f"COPY _upsert_stage ({col_list}) FROM STDIN") as cp:
+            for row in buf:
+                cp.write_row(row)
+        cur.execute(
+            f"INSERT INTO {table} ({col_list}) "
+            f"SELECT {col_list} FROM _upsert_stage {conflict_clause}"
+        )
+        inserted = max(cur.rowcount, 0)
+    db.commit()
+    return LoadStats(inserted=inserted, skipped=len(buf) - inserted)
+
+
+def copy_insert(
+    db,
+    *,
+    table: str,
+    columns: list[str],
+    rows: list[tuple],
+    on_conflict: str = "ON CONFLICT DO NOTHING",
+) -> LoadStats:
+    """COPY pre-built row tuples into `table` through a temp stage.
+
+    For connectors that already hold rows as tuples in `columns` order and only
+    need insert-or-skip: one COPY plus one INSERT ... SELECT replaces a
+    statement per row. Commits, like upsert_batch.
+    """
+    if not rows:
+        return LoadStats()
+    if not _safe_ident(table) or not all(_safe_ident(c) for c in columns):
+        raise ValueError("Identifiers must be alphanumeric+underscore.")
+    return _flush_copy(db, table, ", ".join(columns), on_conflict, rows)
+
+
+def fetch_key_set(db, sql: str, params: tuple | None = None) -> set[Any]:
+    """Return the first column of every row of `sql` as a set.
+
+    For the "known p_numbers"-style guard sets connectors preload before a
+    load. Runs on a tuple_row cursor: the connection's dict_row factory would
+    build a throwaway dict for each of the hundreds of thousands of rows. The
+    cursor is server-side, so rows stream in KEY_FETCH_ITERSIZE batches into
+    the set instead of the whole result being buffered client-side first.
+    """
+    with db.cursor(name="fetch_key_set", row_factory=tuple_row) as cur:
+        cur.itersize = KEY_FETCH_ITERSIZE
+        cur.execute(sql, params)
+        return {r[0] for r in cur}
+
+
+def fetch_key_map(db, sql: str, params: tuple | None = None) -> dict[Any, Any]:
+    """Return {first column: second column} over every row of `sql`.
+
+    The mapping counterpart of fetch_key_set, for resolving a whole set of
+    natural keys to ids in one query instead of a SELECT per key.
+    """
+    with db.cursor(name="fetch_key_map", row_factory=tuple_row) as cur:
+        cur.itersize = KEY_FETCH_ITERSIZE
+        cur.execute(sql, params)
+        return {r[0]: r[1] for r in cur}
+
+
+def load_json(path: Path | str) -> Any:
+    """Parse a JSON source file, with orjson when installed.
+
+    Reads the file as bytes in one go and hands it to orjson (several times
+    faster than stdlib json on multi-MB ORACC catalogues), else json.loads.
+    Malformed JSON raises ValueError either way (orjson.JSONDecodeError and
+    json.JSONDecodeError both subclass it).
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def iter_json_members(path: Path | str) -> Iterator[tuple[str, Any]]:
+    """Yield (key, value) pairs from the top-level ``members`` object.
+
+    The DCCLT / ePSD2 catalogues run to hundreds of MB and callers only walk
+    ``members``, so large files are streamed with ijson when it is installed;
+    small ones (and every file without ijson) go through load_json. Numbers
+    decode as int/float on both paths (use_float keeps ijson off Decimal).
+    Malformed JSON raises ValueError either way, possibly after some members
+    have been yielded.
+    """
+    if ijson is None or os.path.getsize(path) < STREAM_JSON_MIN_BYTES:
+        yield from load_json(path).get("members", {}).items()
+        return
+    with open(path, "rb") as f:
+        try:
+            yield from ijson.kvitems(f, "members", use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+
+
+def iter_json_items(path: Path | str, prefix: str) -> Iterator[Any]:
+    """Yield the elements of the array at ``prefix``, in ijson notation.
+
+    ``prefix`` names an array reached through object keys, e.g.
+    ``"signs.item"`` for ``{"signs": [...]}``. Large files are streamed with
+    ijson when it is installed, as in iter_json_members; otherwise the file
+    goes through load_json and the keys are walked. A missing key yields
+    nothing. Malformed JSON raises ValueError either way.
+    """
+    if ijson is None or os.path.getsize(path) < STREAM_JSON_MIN_BYTES:
+        node = load_json(path)
+        for key in prefix.split(".")[:-1]:
+            node = node.get(key, []) if isinstance(node, dict) else []
+        yield from node
+        return
+    with open(path, "rb") as f:
+        try:
+            yield from ijson.items(f, prefix, use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+
+
+def iter_csv_columns(
+    path: Path | str, columns: tuple[str, ...]
+) -> Iterator[tuple[str, ...]]:
+    """Yield the named ``columns`` of each row of a headed CSV, as a tuple.
+
+    csv.DictReader builds a dict over every column of every row; cdli_cat.csv
+    has dozens of columns and the scans that read it want two or three. A
+    column absent from the header, or cut off by a short row, reads as "".
+    """
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        idx = [header.index(c) if c in header else -1 for c in columns]
+        for row in reader:
+            n = len(row)
+            yield tuple(row[i] if 0 <= i < n else "" for i in idx)
+
+
 def _safe_ident(s: str) -> bool:
     """Cheap allow-list check to keep f-string SQL identifiers safe."""
     return bool(s) and s.replace("_", "").isalnum()
@@ -28,7 +28,6 @@ from ingestion.base import (
     RunContext,
     RunMode,
     SourceConnector,
-    utc_now,
 )
 from ingestion.dead_letters import DeadLetterSink
 from ingestion.dlq_alerts import check_and_alert
@@ -107,15 +106,22 @@ def run_connector(
     app_env: str = "local",
     force: bool = False,
     config: Optional[dict] = None,
+    db=None,
 ) -> dict:
     """Execute a connector end-to-end. Returns a summary dict.
 
     On any exception, the run is marked 'failed' with the traceback recorded
     in `error_summary` and re-raised.
+
+    `db` lets a caller chaining several runs (run-all) share one session, so
+    each connector skips connection setup and inherits the warm
+    prepared-statement cache. A passed-in connection is left open; otherwise
+    the run opens and closes its own.
     """
     connector = connector_cls()
-    db = connect_one_shot()
-    started = utc_now()
+    owns_db = db is None
+    if owns_db:
+        db = connect_one_shot()
     started_perf = datetime.now(timezone.utc)
 
     upsert_source_row(db, connector_cls)
@@ -131,14 +137,13 @@ def run_connector(
         INSERT INTO import_runs
             (connector_id, run_mode, app_env, started_at, status,
              config_json, model_id, git_sha)
-        VALUES (%s, %s, %s, %s, 'running', %s::jsonb, %s, %s)
+        VALUES (%s, %s, %s, NOW(), 'running', %s::jsonb, %s, %s)
         RETURNING id
         """,
         (
             connector_cls.id,
             mode.value,
             app_env,
-            started,
             json.dumps(config or {}, default=str),
             model_id,
             _git_sha(),
@@ -260,7 +265,8 @@ def run_connector(
         summary["error"] = str(exc)
         raise
     finally:
-        db.close()
+        if owns_db:
+            db.close()
 
 
 def _flatten_transform(connector, ctx, records):
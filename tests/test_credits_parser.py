@@ -116,3 +116,19 @@ def test_title_words_are_not_treated_as_names():
 def test_empty_credit_yields_nothing():
     assert parse_credits("") == []
     assert parse_credits("   ") == []
+
+
+def test_prose_without_role_phrases_yields_nothing():
+    assert parse_credits("Transliteration courtesy of the museum, 2011.") == []
+    # The substring pre-check is case-insensitive like the role patterns.
+    pairs = {(m.name, m.role) for m in parse_credits("LEMMATISED BY Mikko Luukko.")}
+    assert ("Mikko Luukko", "lemmatizer") in pairs
+
+
+def test_shared_stem_runs_every_pattern_it_anchors():
+    # "edition" anchors both the editor and the contributor pattern; gating on
+    # stems must not drop either.
+    pairs = {
+        (m.name, m.role) for m in parse_credits("Edition courtesy Jeremie Peterson.")
+    }
+    assert ("Jeremie Peterson", "contributor") in pairs
@@ -6,7 +6,16 @@ from __future__ import annotations
 import pytest
 
 from ingestion.base import ConflictPolicy
-from ingestion.loader import upsert_batch, _safe_ident
+from ingestion.loader import (
+    _safe_ident,
+    fetch_key_map,
+    fetch_key_set,
+    iter_csv_columns,
+    iter_json_items,
+    iter_json_members,
+    load_json,
+    upsert_batch,
+)
 
 
 def test_safe_ident_accepts_alnum_underscore():
@@ -22,6 +31,67 @@ def test_safe_ident_rejects_punctuation():
     assert not _safe_ident("table name")
 
 
+def test_load_json_parses_utf8_file(tmp_path):
+    p = tmp_path / "catalogue.json"
+    p.write_text('{"members": {"P000001": {"designation": "šarru"}}}', encoding="utf-8")
+    assert load_json(p) == {"members": {"P000001": {"designation": "šarru"}}}
+
+
+def test_load_json_malformed_raises_value_error(tmp_path):
+    p = tmp_path / "bad.json"
+    p.write_text("{not json", encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_json(p)
+
+
+def test_iter_json_members_yields_member_pairs(tmp_path):
+    p = tmp_path / "catalogue.json"
+    p.write_text(
+        '{"project": "saao", "members": {"P1": {"a": 1}, "Q2": {"b": 2}}}',
+        encoding="utf-8",
+    )
+    assert list(iter_json_members(p)) == [("P1", {"a": 1}), ("Q2", {"b": 2})]
+
+
+def test_iter_json_streaming_path_matches_load_json(tmp_path, monkeypatch):
+    pytest.importorskip("ijson")
+    import ingestion.loader as loader
+
+    monkeypatch.setattr(loader, "STREAM_JSON_MIN_BYTES", 0)
+    p = tmp_path / "catalogue.json"
+    p.write_text(
+        '{"members": {"P1": {"a": 1, "w": 2.5}}, "signs": [{"c": 0.5}]}',
+        encoding="utf-8",
+    )
+    members = list(iter_json_members(p))
+    assert members == [("P1", {"a": 1, "w": 2.5})]
+    assert type(members[0][1]["w"]) is float
+    assert list(iter_json_items(p, "signs.item")) == [{"c": 0.5}]
+
+    cut = tmp_path / "cut.json"
+    cut.write_text('{"members": {"P1": {"a": 1}, "P2": {"a"', encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_json_members(cut))
+    with pytest.raises(ValueError):
+        list(iter_json_items(cut, "members.item"))
+
+
+def test_iter_json_items_yields_array_elements(tmp_path):
+    p = tmp_path / "signs.json"
+    p.write_text('{"signs": [{"c": "a"}, {"c": "b"}]}', encoding="utf-8")
+    assert list(iter_json_items(p, "signs.item")) == [{"c": "a"}, {"c": "b"}]
+    assert list(iter_json_items(p, "missing.item")) == []
+
+
+def test_iter_csv_columns_projects_named_columns(tmp_path):
+    p = tmp_path / "cat.csv"
+    p.write_text(
+        'id,period,genre\nP1,Ur III,"Lexical, school"\nP2,OB\n', encoding="utf-8"
+    )
+    rows = list(iter_csv_columns(p, ("genre", "period", "missing")))
+    assert rows == [("Lexical, school", "Ur III", ""), ("", "OB", "")]
+
+
 def test_upsert_batch_rejects_unsafe_table_name():
     with pytest.raises(ValueError, match="Identifiers"):
         upsert_batch(
@@ -116,3 +186,33 @@ def test_upsert_batch_integration_update_policy(has_database_url):
         db.commit()
     finally:
         db.close()
+
+
+def test_fetch_key_set_integration(has_database_url):
+    """First-column set comes back as plain values despite dict_row connections."""
+    from core.database import connect_one_shot
+
+    db = connect_one_shot()
+    try:
+        keys = fetch_key_set(
+            db,
+            "SELECT v FROM (VALUES ('PTEST001'), ('PTEST002'), ('PTEST001')) t(v)",
+        )
+        assert keys == {"PTEST001", "PTEST002"}
+    finally:
+        db.close()
+
+
+def test_fetch_key_map_integration(has_database_url):
+    """First two columns come back as a plain key -> value dict."""
+    from core.database import connect_one_shot
+
+    db = connect_one_shot()
+    try:
+        keys = fetch_key_map(
+            db,
+            "SELECT k, v FROM (VALUES ('oracc/test1', 1), ('oracc/test2', 2)) t(k, v)",
+        )
+        assert keys == {"oracc/test1": 1, "oracc/test2": 2}
+    finally:
+        db.close()
@@ -166,3 +166,14 @@ def test_run_connector_upserts_source_metadata(clean_synth):
     assert src is not None
     assert src["display_name"] == "Synthetic Test Connector"
     assert src["kind"] == "catalog"
+
+
+def test_run_connector_leaves_borrowed_connection_open(clean_synth):
+    db = clean_synth
+    first = run_connector(_SyntheticConnector, mode=RunMode.FULL, app_env="test", db=db)
+    assert first["status"] == "succeeded"
+    assert not db.closed
+    second = run_connector(
+        _SyntheticConnector, mode=RunMode.FULL, app_env="test", force=True, db=db
+    )
+    assert second["status"] == "succeeded"
@@ -117,3 +117,31 @@ def test_non_q_and_bad_json_are_ignored(tmp_path: Path) -> None:
     conn = OraccCompositeWitnessesConnector(base=tmp_path)
     pairs = {(r["p_number"], r["q_number"]) for r in conn.extract(_FakeCtx())}
     assert pairs == {("P333333", "Q222222")}
+
+
+def test_catalogue_failing_mid_stream_contributes_nothing(
+    tmp_path: Path, monkeypatch
+) -> None:
+    # On the streaming path a truncated file raises only after some members
+    # were yielded; none of them may leak into the merged result.
+    _write_catalogue(tmp_path, "ok", {"Q222222": {"cdli_id_numbers": "P333333"}})
+    _write_catalogue(tmp_path, "cut", {})
+
+    from ingestion.connectors import oracc_composite_witnesses as mod
+
+    real = mod.iter_json_members
+
+    def fake_members(path):
+        if path.parent.name == "cut":
+            yield "Q444444", {"cdli_id_numbers": "P555555"}
+            raise ValueError("truncated")
+        yield from real(path)
+
+    monkeypatch.setattr(mod, "iter_json_members", fake_members)
+    ctx = _FakeCtx()
+    conn = OraccCompositeWitnessesConnector(base=tmp_path)
+    pairs = {(r["p_number"], r["q_number"]) for r in conn.extract(ctx)}
+    assert pairs == {("P333333", "Q222222")}
+    assert ("warn", "oracc_composite_witnesses.bad_json") in {
+        (lvl, msg) for lvl, msg, _ in ctx.events
+    }
@@ -6,7 +6,7 @@ between CDLI and ORACC.
 
 from __future__ import annotations
 
-from ingestion.connectors.scholars import _normalize_name, _parse_name_list
+from ingestion.connectors.scholars import _iter_names, _normalize_name, _parse_name_list
 
 
 # ── _normalize_name ─────────────────────────────────────────────────────────
@@ -73,3 +73,19 @@ def test_parse_filters_short_names():
 def test_parse_empty_input():
     assert _parse_name_list("") == []
     assert _parse_name_list("   ") == []
+
+
+# ── _iter_names ─────────────────────────────────────────────────────────────
+
+
+def test_iter_names_reads_every_field_and_skips_missing():
+    records = [
+        {"author": "Jane Doe & John Smith", "atf_source": ""},
+        {"atf_source": "Alice Brown"},
+        {"author": None},
+    ]
+    assert list(_iter_names(records, ("author", "atf_source"))) == [
+        "Jane Doe",
+        "John Smith",
+        "Alice Brown",
+    ]
@@ -0,0 +1,57 @@
+"""Tests for the Semantic Scholar service: caches, pooled client, DOI keys."""
+
+from __future__ import annotations
+
+import sqlite3
+from time import time
+
+import pytest
+
+from api.services import semantic_scholar as s2
+
+
+@pytest.fixture
+def disk(tmp_path, monkeypatch):
+    db = sqlite3.connect(
+        str(tmp_path / "s2.db"), isolation_level=None, check_same_thread=False
+    )
+    db.execute(
+        "CREATE TABLE s2_citations ("
+        "doi TEXT PRIMARY KEY, fetched_at REAL NOT NULL, payload BLOB NOT NULL)"
+    )
+    monkeypatch.setattr(s2, "_disk", db)
+    monkeypatch.setattr(s2, "_disk_opened", True)
+    yield db
+    db.close()
+
+
+def test_disk_round_trip(disk):
+    s2._disk_put("10.1/abc", [{"title": "Šulgi hymns", "year": 2001}])
+    assert s2._disk_get("10.1/abc") == [{"title": "Šulgi hymns", "year": 2001}]
+
+
+def test_corrupt_row_is_a_cache_miss(disk):
+    disk.execute(
+        "INSERT INTO s2_citations (doi, fetched_at, payload) VALUES (?, ?, ?)",
+        ("10.1/bad", time(), b"\x00not zlib"),
+    )
+    assert s2._disk_get("10.1/bad") is None
+
+
+def test_client_pool_keeps_connections_alive(monkeypatch):
+    monkeypatch.setattr(s2, "_client", None)
+    pool = s2._http()._transport._pool
+    assert pool._keepalive_expiry == s2._KEEPALIVE_S
+    assert pool._max_keepalive_connections == 4
+
+
+def test_doi_canonicalizes_like_doi_norm():
+    from ingestion.connectors.orcid_works import _normalize_doi
+
+    for raw in (
+        "https://doi.org/doi:10.1/X",
+        " HTTP://dx.doi.org/10.1/x\n",
+        "doi: 10.1/x",
+        "10.1/X",
+    ):
+        assert s2._canonical_doi(raw) == _normalize_doi(raw) == "10.1/x"